@@ -0,0 +1,247 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Benchmarks of each stage of the pipeline(decode, segment, rescale, classify, layout) on the bundled test images and on
+synthetic equations rendered with PIL that grow in size, number of segments and nesting depth(fraction towers and nested
+radicals), to show how segmentation and the region searches of `SegmentsToLatex` scale
+
+Results are written as JSON and compared against a baseline saved by an earlier run on the same machine, any case whose
+total time grew by more than the tolerance is reported as a regression and the exit status is 1. Timings don't carry
+over between machines so no baseline is shipped, the first run has to save one:
+
+    python benchmark.py --save-baseline
+    python benchmark.py -o results.json
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+
+from PIL import Image, ImageDraw, ImageFont
+
+from classify_segments import DEFAULT_LABELS_DIR, Classifier
+from convert_images import IMAGE_EXTENSIONS
+from image_to_latex import image_to_latex
+from profiling import PipelineStats
+
+TEST_IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_images')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+DEFAULT_REPEAT = 7
+DEFAULT_TOLERANCE = 1.25  # a case regressed if its total time is more than this many times the baseline's
+MIN_REGRESSION_SECONDS = 0.002  # smaller differences are noise no matter the ratio
+
+STAGES = ['decode', 'segment', 'rescale', 'classify', 'layout']
+
+INK = 0
+PAPER = 255
+
+
+def render(expression, scale=4):
+    """
+    Render an equation to a black on white 'L' mode image
+
+    :param expression: Nested tuples, one of ('text', string), ('row', [expressions]), ('frac', numerator, denominator)
+    or ('sqrt', expression)
+    :param scale: Size of a pixel of the default PIL font, glyphs are about 11 * `scale` pixels tall
+    """
+    kind = expression[0]
+    if kind == 'text':
+        font = ImageFont.load_default()
+        small = Image.new('L', font.getsize(expression[1]), PAPER)
+        ImageDraw.Draw(small).text((0, 0), expression[1], INK, font)
+        return small.resize((small.size[0] * scale, small.size[1] * scale), Image.NEAREST)
+
+    if kind == 'row':
+        parts = [render(part, scale) for part in expression[1]]
+        gap = scale * 2
+        width = sum(part.size[0] for part in parts) + gap * (len(parts) - 1)
+        height = max(part.size[1] for part in parts)
+        img = Image.new('L', (width, height), PAPER)
+        x = 0
+        for part in parts:
+            img.paste(part, (x, (height - part.size[1]) // 2))
+            x += part.size[0] + gap
+        return img
+
+    if kind == 'frac':
+        numerator, denominator = render(expression[1], scale), render(expression[2], scale)
+        gap, thickness = scale * 2, max(scale // 2, 1)
+        width = max(numerator.size[0], denominator.size[0]) + 2 * gap
+        height = numerator.size[1] + denominator.size[1] + 2 * gap + thickness
+        img = Image.new('L', (width, height), PAPER)
+        img.paste(numerator, ((width - numerator.size[0]) // 2, 0))
+        bar_y = numerator.size[1] + gap
+        ImageDraw.Draw(img).rectangle([0, bar_y, width - 1, bar_y + thickness - 1], INK)
+        img.paste(denominator, ((width - denominator.size[0]) // 2, bar_y + thickness + gap))
+        return img
+
+    if kind == 'sqrt':
+        inner = render(expression[1], scale)
+        gap, thickness = scale * 2, max(scale // 2, 1)
+        hook_width = inner.size[1] // 2
+        width = hook_width + inner.size[0] + 2 * gap
+        height = inner.size[1] + 2 * gap
+        img = Image.new('L', (width, height), PAPER)
+        img.paste(inner, (hook_width + gap, 2 * gap))
+        # tick, long stroke up to the top and the bar over the radicand, drawn as one connected line
+        tick_y = height * 2 // 3
+        ImageDraw.Draw(img).line([(0, tick_y), (hook_width // 3, tick_y), (hook_width // 2, height - 1),
+                                  (hook_width, 0), (width - 1, 0)], INK, thickness)
+        return img
+
+    raise ValueError('Unknown expression kind %r' % (kind,))
+
+
+def terms(n):
+    """
+    A row of `n` single digit terms added together, 2n - 1 segments
+    """
+    return ('text', '+'.join(str(i % 10) for i in xrange(n)))
+
+
+def fraction_tower(depth):
+    """
+    A continued fraction nested `depth` levels deep
+    """
+    expression = ('text', '1')
+    for _ in xrange(depth):
+        expression = ('frac', ('text', '1'), ('row', [('text', '2+'), expression]))
+    return expression
+
+
+def nested_radical(depth):
+    """
+    A square root nested `depth` levels deep
+    """
+    expression = ('text', '5')
+    for _ in xrange(depth):
+        expression = ('sqrt', ('row', [('text', '5+'), expression]))
+    return expression
+
+
+def synthetic_cases():
+    """
+    Return a list of (case name, expression, scale) of synthetic equations of growing size
+    """
+    cases = []
+    cases += [('terms_%d' % n, terms(n), 4) for n in [4, 16, 64, 256]]
+    cases += [('fraction_tower_%d' % depth, fraction_tower(depth), 4) for depth in [1, 3, 6, 10]]
+    cases += [('nested_radical_%d' % depth, nested_radical(depth), 4) for depth in [1, 3, 6, 10]]
+    cases += [('scale_%d' % scale, ('row', [terms(8), fraction_tower(2)]), scale) for scale in [2, 4, 8, 16]]
+    return cases
+
+
+def benchmark_image(img_path, classifier, repeat=DEFAULT_REPEAT):
+    """
+    Convert an image `repeat` times and return the median time of each stage, the median total and the counts of one
+    conversion
+    """
+    runs = []
+    for _ in xrange(repeat):
+        stats = PipelineStats()
+        image_to_latex(img_path, classifier=classifier, stats=stats)
+        runs.append(stats)
+
+    timings = {}
+    for stage in STAGES:
+        timings[stage] = median([stats.timings.get(stage, 0.0) for stats in runs])
+    return {'timings': timings,
+            'total': median([sum(stats.timings.values()) for stats in runs]),
+            'counts': runs[0].counts}
+
+
+def run_benchmarks(labels_dir=DEFAULT_LABELS_DIR, repeat=DEFAULT_REPEAT, include_test_images=True):
+    """
+    Benchmark every synthetic case and, with `include_test_images`, every bundled test image
+
+    :return: dict that `compare` and `json.dump` accept
+    """
+    # without the glyph cache every repetition rescales and classifies every segment
+    classifier = Classifier(labels_dir, glyph_cache=None)
+    cases = {}
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for name, expression, scale in synthetic_cases():
+            img_path = os.path.join(tmp_dir, name + '.png')
+            render(expression, scale).save(img_path)
+            cases[name] = benchmark_image(img_path, classifier, repeat)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    if include_test_images:
+        for img_name in sorted(name for name in os.listdir(TEST_IMAGES_DIR) if name.lower().endswith(IMAGE_EXTENSIONS)):
+            cases[img_name] = benchmark_image(os.path.join(TEST_IMAGES_DIR, img_name), classifier, repeat)
+
+    return {'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeat': repeat,
+            'cases': cases}
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Return a list of (case name, baseline total, total) of the cases in both `results` and `baseline` whose total time
+    grew by more than `tolerance` times
+    """
+    regressions = []
+    for name in sorted(results['cases']):
+        if name not in baseline['cases']:
+            continue
+        before, after = baseline['cases'][name]['total'], results['cases'][name]['total']
+        if after > before * tolerance and after - before > MIN_REGRESSION_SECONDS:
+            regressions.append((name, before, after))
+    return regressions
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def main(argv=None, stdout=sys.stdout):
+    parser = argparse.ArgumentParser(description='Benchmark each stage of converting images to latex')
+    parser.add_argument('-o', '--output', help='JSON file to write the results to')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='JSON results of an earlier run to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='ratio of total time to the baseline above which a case counts as a regression')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='conversions per case, the median is kept')
+    parser.add_argument('--labels', default=DEFAULT_LABELS_DIR, help='labels directory or model file')
+    parser.add_argument('--synthetic-only', action='store_true', help='skip the bundled test images')
+    args = parser.parse_args(argv)
+    if not args.save_baseline and not os.path.exists(args.baseline):
+        parser.error('no baseline at %s to compare with, save one first with --save-baseline' % args.baseline)
+
+    results = run_benchmarks(args.labels, args.repeat, not args.synthetic_only)
+    for name in sorted(results['cases']):
+        case = results['cases'][name]
+        stdout.write('%-24s %9.2fms  %s\n' % (name, case['total'] * 1000,
+                                              '  '.join('%s %.2f' % (stage, case['timings'][stage] * 1000)
+                                                        for stage in STAGES)))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.tolerance)
+    for name, before, after in regressions:
+        stdout.write('REGRESSION %s: %.2fms -> %.2fms\n' % (name, before * 1000, after * 1000))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
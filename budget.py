@@ -0,0 +1,88 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Limits on how much work converting a single image may take. A pathological image(a noisy photo of a whole page) can
+produce tens of thousands of segments and keep a worker busy for minutes, with a `Budget` the conversion stops with a
+`BudgetExceeded` error as soon as any limit is crossed instead
+
+    budget = Budget(max_seconds=5, max_pixels=20 * 10 ** 6, max_segments=2000, max_depth=32)
+    image_to_latex('path_to_image', budget=budget)
+
+The limits are checked inside the loops of segmentation, classification and layout
+"""
+
+import time
+
+BUDGET_CHECK_INTERVAL = 256  # items(groups, segments) processed per stage between checks of a `Budget`'s clock
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised when converting an image goes over one of the limits of its `Budget`
+
+    :ivar limit: Which limit was exceeded: 'seconds', 'pixels', 'segments' or 'depth'
+    :ivar value: The value that went over the limit
+    :ivar maximum: The limit
+    :ivar stage: Stage of the pipeline the limit was exceeded in
+    """
+
+    def __init__(self, limit, value, maximum, stage):
+        Exception.__init__(self, 'budget of %s exceeded during %s: %s > %s' % (limit, stage, value, maximum))
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.stage = stage
+
+    def as_dict(self):
+        return {'limit': self.limit, 'value': self.value, 'maximum': self.maximum, 'stage': self.stage}
+
+    def __reduce__(self):
+        return BudgetExceeded, (self.limit, self.value, self.maximum, self.stage)
+
+
+class Budget(object):
+    """
+    Limits on the wall time, number of pixels, number of segments and layout nesting depth of converting one image. A
+    limit of None is not checked
+    """
+
+    def __init__(self, max_seconds=None, max_pixels=None, max_segments=None, max_depth=None):
+        """
+        :param max_seconds: Wall time the whole conversion may take, counted from `start`
+        :param max_pixels: Number of pixels(width * height) an image may have, checked before it is decoded
+        :param max_segments: Number of segments an image may have
+        :param max_depth: How deeply special operators(fractions, radicals) may be nested in the layout
+        """
+        self.max_seconds = max_seconds
+        self.max_pixels = max_pixels
+        self.max_segments = max_segments
+        self.max_depth = max_depth
+        self.deadline = None  # set by `start`
+
+    def start(self):
+        """
+        Return a copy of the budget whose clock starts now, one per image
+        """
+        started = Budget(self.max_seconds, self.max_pixels, self.max_segments, self.max_depth)
+        if self.max_seconds is not None:
+            started.deadline = time.time() + self.max_seconds
+        return started
+
+    def check_time(self, stage):
+        if self.deadline is not None:
+            now = time.time()
+            if now > self.deadline:
+                raise BudgetExceeded('seconds', round(now - self.deadline + self.max_seconds, 3), self.max_seconds,
+                                     stage)
+
+    def check_pixels(self, pixels, stage='decode'):
+        if self.max_pixels is not None and pixels > self.max_pixels:
+            raise BudgetExceeded('pixels', pixels, self.max_pixels, stage)
+
+    def check_segments(self, segments, stage='segment'):
+        if self.max_segments is not None and segments > self.max_segments:
+            raise BudgetExceeded('segments', segments, self.max_segments, stage)
+
+    def check_depth(self, depth, stage='layout'):
+        if self.max_depth is not None and depth > self.max_depth:
+            raise BudgetExceeded('depth', depth, self.max_depth, stage)
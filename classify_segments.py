@@ -5,15 +5,366 @@ This module contains methods to classify the segments contained in an image usin
 """
 
 import os
-import cPickle as pickle
+import hashlib
+import threading
+from collections import OrderedDict
 
-from scipy.spatial.distance import euclidean
+import numpy as np
 
-from segment_img import ImageSegmenter
-from transform_segment import TransformSegment
+from budget import BUDGET_CHECK_INTERVAL
+from label_index import LabelIndex
+from label_model import MODEL_FILE_NAME, PROFILES_ARRAY, load_label_model
+from profiling import Profiler
+from segment_img import ImageSegmenter, segment_image_in_strips
+from transform_segment import get_ink_profiles, vectorize_segments
 
+DEFAULT_LABELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serialized_labeled_imgs')
+DEFAULT_INDEX_CANDIDATES = 64
+DEFAULT_GLYPH_CACHE_SIZE = 4096
+CASCADE_CHUNK_SIZE = 2 ** 22  # elements in the temporary arrays of `cascade_search`
 
-def seg_and_classify_img(img_path, labels_dir):
+# absolute path -> [mtime, `LabelModel`, `LoadedModel` or None], models and what is derived from them are shared by all
+# `Classifier` objects in a process
+_model_cache = {}
+_model_cache_lock = threading.Lock()
+
+
+class GlyphCache(object):
+    """
+    Bounded least recently used cache of segment classifications keyed by the segment's pixels. Equations repeat the
+    same glyphs(digits, operators, fraction bars) over and over so most segments don't need to be rescaled and compared
+    against the labeled vectors again. Values are (classification, distance) tuples
+    """
+
+    def __init__(self, max_size=DEFAULT_GLYPH_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_checksum, bitmap):
+        """
+        Return the cache key of a segment's bitmap classified against the model with checksum `model_checksum`
+        """
+        return model_checksum, bitmap.shape, hashlib.sha1(np.packbits(bitmap)).digest()
+
+    def get(self, key):
+        """
+        Return the cached (classification, distance) for `key` or None if it isn't cached
+        """
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries[key] = value  # reinsert as the most recently used
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+GLYPH_CACHE = GlyphCache()  # shared by every `Classifier` in the process by default
+
+
+class Classifier(object):
+    """
+    Classifies segments against the labeled vectors of a labels directory or model file. The labeled vectors and the
+    index and arrays derived from them are loaded once per process and shared by every `Classifier` created for the same
+    path, see `get_loaded_model`
+    """
+
+    def __init__(self, labels_dir=DEFAULT_LABELS_DIR, index_candidates=DEFAULT_INDEX_CANDIDATES, index_eps=0.0,
+                 cascade=False, glyph_cache=GLYPH_CACHE, segment_pool=None):
+        """
+        :param labels_dir: path of a labels directory or model file, see `label_model.load_label_model`
+        :param index_candidates: When the model has a `LabelIndex`, number of candidates the index shortlists per
+        segment for exact comparison. More candidates trade speed for recall, None always compares against every labeled
+        vector
+        :param index_eps: Allowed relative error of the index's search, larger is faster
+        :param cascade: When the model has ink profiles, use them to rule out labeled vectors before comparing full
+        vectors, see `cascade_search`. Off by default, the single matrix product of `nearest_neighbours` is faster
+        than screening the ink profiles in numpy, the cascade compares far fewer full vectors
+        :param glyph_cache: `GlyphCache` to remember the classification of glyphs that were already seen in, shared by
+        every classifier in the process by default. None to classify every segment from scratch
+        :param segment_pool: `multiprocessing.Pool` to segment the blocks of each image over in `classify_image` and
+        `image_to_latex.convert_batch`, see `ImageSegmenter.segment_image`. None segments in this process
+        """
+        self.labels_dir = labels_dir
+        self.glyph_cache = glyph_cache
+        self.segment_pool = segment_pool
+        self.index_candidates = index_candidates
+        self.index_eps = index_eps
+        self.cascade = cascade
+        self.cascade_stats = CascadeStats()
+        self.model = None
+        self.index = None
+        self.profiles = None
+        self.labels = None
+        self.label_sq_norms = None
+        self.reload()
+
+    def reload(self):
+        """
+        Pick up the current version of the labeled vectors if they changed on disk since this classifier loaded them
+        """
+        loaded = get_loaded_model(self.labels_dir)
+        self.model = loaded.model
+        self.index = loaded.index
+        self.profiles = loaded.profiles
+        self.labels = loaded.labels
+        self.label_sq_norms = loaded.label_sq_norms
+
+    def classify_segments(self, segments, profiler=None, budget=None):
+        """
+        Classify each `Segment` in `segments` and store the result in its classification attribute
+
+        :param profiler: `profiling.Profiler` to report the glyph cache lookup, rescale and classify stages to
+        :param budget: `budget.Budget` whose time limit to check between stages
+        :return: `segments`
+        """
+        if profiler is None:
+            profiler = Profiler()
+        if budget is not None:
+            budget.check_time('classify')
+        if self.glyph_cache is None:
+            self.classify_uncached(segments, profiler, budget)
+            return segments
+
+        start = profiler.clock()
+        keys = [self.glyph_cache.key(self.model.checksum, segment.bitmap) for segment in segments]
+        classifications = dict((key, self.glyph_cache.get(key)) for key in keys)
+        uncached = OrderedDict()  # repeated glyphs within the image only need to be classified once
+        for segment, key in zip(segments, keys):
+            if classifications[key] is None:
+                uncached.setdefault(key, segment)
+        profiler.record('glyph_cache', start, glyph_cache_hits=len(segments) - len(uncached),
+                        glyph_cache_misses=len(uncached))
+
+        for key, segment in zip(uncached.keys(), self.classify_uncached(uncached.values(), profiler, budget)):
+            classifications[key] = segment.classification, segment.distance
+            self.glyph_cache.put(key, classifications[key])
+
+        for segment, key in zip(segments, keys):
+            segment.classification, segment.distance = classifications[key]
+        return segments
+
+    def classify_uncached(self, segments, profiler=None, budget=None):
+        """
+        Rescale and classify `segments` against the labeled vectors without looking them up in the glyph cache
+
+        :param profiler: `profiling.Profiler` to report the rescale and classify stages to
+        :param budget: `budget.Budget` whose time limit to check between stages
+        :return: `segments`
+        """
+        if profiler is None:
+            profiler = Profiler()
+        if segments:
+            start = profiler.clock()
+            seg_vecs = vectorize_segments(segments, self.model.size, self.model.fill_val, budget=budget)
+            profiler.record('rescale', start, rescaled=len(segments))
+            if budget is not None:
+                budget.check_time('rescale')
+            start = profiler.clock()
+            labels, distances = self.classify_vectors(seg_vecs, budget=budget)
+            profiler.record('classify', start, classified=len(segments))
+            for segment, label, distance in zip(segments, labels[:, 0], distances[:, 0].tolist()):
+                segment.classification = label
+                segment.distance = distance
+        return segments
+
+    def classify_vectors(self, vecs, k=1, budget=None):
+        """
+        Find the `k` labeled vectors closest to each vector in `vecs`
+
+        :param vecs: Array of shape (n, width * height) of vectors representing segments
+        :param budget: `budget.Budget` whose time limit to check every `BUDGET_CHECK_INTERVAL` vectors
+        :return: Tuple of two arrays of shape (n, k), the labels and euclidean distances of the closest labeled vectors
+        to each vector ordered from closest to farthest
+        """
+        if self.index is not None and self.index_candidates is not None and self.index_candidates < len(self.labels):
+            candidates = self.index.candidates(vecs, self.index_candidates, self.index_eps)
+            indices, distances = self.rerank(vecs, candidates, k, budget)
+        elif self.cascade and self.profiles is not None:
+            indices, distances = self.cascade_search(vecs, k, budget)
+        else:
+            indices, distances = nearest_neighbours(vecs, self.model.vectors, self.label_sq_norms, k)
+        return self.labels[indices], distances
+
+    def cascade_search(self, vecs, k=1, budget=None):
+        """
+        Find the same nearest labeled vectors as `nearest_neighbours` while comparing full vectors against only a
+        shortlist of the labeled vectors
+
+        Vectors only ever hold two values(1 and fill_val) so the squared distance between two vectors is the number of
+        pixels they differ in times (1 - fill_val) ** 2. Comparing ink profiles gives a lower bound on that number for
+        every labeled vector at once. The `k` labeled vectors with the lowest bounds are compared in full first and any
+        labeled vector whose bound exceeds the farthest of those can't be one of the `k` nearest, so only the rest are
+        compared in full
+
+        The bounds of a chunk of segments against every labeled vector are computed at once, as are the distances of
+        all the shortlisted pairs. The bound only holds for vectors of 1s and fill_vals, any other vector is compared
+        against every labeled vector
+
+        :param budget: `budget.Budget` whose time limit to check between chunks of at most `BUDGET_CHECK_INTERVAL`
+        segments
+        :return: Same as `nearest_neighbours`
+        """
+        vecs = np.asarray(vecs, dtype=self.model.vectors.dtype)
+        k = min(k, len(self.labels))
+        indices = np.empty((len(vecs), k), dtype=np.intp)
+        distances = np.empty((len(vecs), k))
+
+        binary = ((vecs == 1) | (vecs == self.model.fill_val)).all(axis=1)
+        rows = np.flatnonzero(~binary)
+        if len(rows):
+            indices[rows], distances[rows] = nearest_neighbours(vecs[rows], self.model.vectors, self.label_sq_norms, k)
+
+        rows = np.flatnonzero(binary)
+        chunk_size = min(max(CASCADE_CHUNK_SIZE // (len(self.labels) * self.profiles.shape[1]), 1),
+                         BUDGET_CHECK_INTERVAL)
+        for start in xrange(0, len(rows), chunk_size):
+            if budget is not None:
+                budget.check_time('classify')
+            chunk = rows[start:start + chunk_size]
+            indices[chunk], distances[chunk] = self._cascade_chunk(vecs[chunk], k)
+        return indices, distances
+
+    def _cascade_chunk(self, vecs, k):
+        height = self.model.size[1]
+        mismatch_sq_dist = (1 - self.model.fill_val) ** 2  # squared distance added by every pixel two vectors differ in
+        profile_diffs = np.abs(get_ink_profiles(vecs, self.model.size)[:, np.newaxis, :] - self.profiles)
+        bounds = np.maximum(profile_diffs[:, :, :height].sum(axis=2), profile_diffs[:, :, height:].sum(axis=2))
+        bounds *= mismatch_sq_dist
+        del profile_diffs
+
+        rows = np.arange(len(vecs))[:, np.newaxis]
+        seeds = np.argpartition(bounds, k - 1, axis=1)[:, :k]
+        seed_sq_dists = self._pair_sq_dists(vecs, np.repeat(rows, k, axis=1).ravel(), seeds.ravel())
+        # distances are multiples of mismatch_sq_dist, half of one absorbs any floating point error
+        shortlisted = bounds <= seed_sq_dists.reshape(seeds.shape).max(axis=1)[:, np.newaxis] + mismatch_sq_dist / 2
+        shortlisted[rows, seeds] = True
+
+        pair_rows, pair_labels = np.nonzero(shortlisted)
+        sq_dists = np.full(bounds.shape, np.inf)
+        sq_dists[pair_rows, pair_labels] = self._pair_sq_dists(vecs, pair_rows, pair_labels)
+        self.cascade_stats.record(bounds.size, len(pair_rows), len(vecs))
+        return k_nearest(sq_dists, k)
+
+    def _pair_sq_dists(self, vecs, rows, labels):
+        """
+        Return the squared distances between vecs[rows[i]] and labeled vector labels[i] for every i
+        """
+        sq_dists = np.empty(len(rows))
+        pairs_per_chunk = max(CASCADE_CHUNK_SIZE // vecs.shape[1], 1)
+        for start in xrange(0, len(rows), pairs_per_chunk):
+            chunk = slice(start, start + pairs_per_chunk)
+            pair_vecs, pair_labeled = vecs[rows[chunk]], self.model.vectors[labels[chunk]]
+            sq_dists[chunk] = squared_norms(pair_vecs) - 2 * np.einsum('ij,ij->i', pair_vecs, pair_labeled) + \
+                self.label_sq_norms[labels[chunk]]
+        return np.maximum(sq_dists, 0, out=sq_dists)
+
+    def rerank(self, vecs, candidates, k=1, budget=None):
+        """
+        Compare each vector in `vecs` exactly against its shortlisted labeled vectors
+
+        :param candidates: Array of shape (n, c) of indices into the labeled vectors, row i is the shortlist of vecs[i]
+        :param budget: `budget.Budget` whose time limit to check every `BUDGET_CHECK_INTERVAL` vectors
+        :return: Same as `nearest_neighbours`
+        """
+        k = min(k, candidates.shape[1])
+        indices = np.empty((len(vecs), k), dtype=np.intp)
+        distances = np.empty((len(vecs), k))
+        for i, (vec, vec_candidates) in enumerate(zip(vecs, candidates)):
+            if budget is not None and i % BUDGET_CHECK_INTERVAL == 0:
+                budget.check_time('classify')
+            nearest, distances[i] = nearest_neighbours(vec[np.newaxis], self.model.vectors[vec_candidates],
+                                                       self.label_sq_norms[vec_candidates], k)
+            indices[i] = vec_candidates[nearest[0]]
+        return indices, distances
+
+    def classify_image(self, img, profiler=None, budget=None, strip_height=None, pool=None):
+        """
+        Segment and classify the segments contained in an image
+
+        :param img: path of image or anything else `ImageSegmenter` accepts
+        :param profiler: `profiling.Profiler` to report the segment stage and the stages of `classify_segments` to
+        :param budget: `budget.Budget` whose limits to check while segmenting and classifying
+        :param strip_height: Decode and segment the image this many rows at a time with
+        `segment_img.segment_image_in_strips` instead of all at once, to bound the memory a large page takes
+        :param pool: Pool to segment the image over instead of `segment_pool`. Strips are always segmented in this
+        process
+        :return: List of `Segment` objects each with a classification attribute containing their classification
+        """
+        if profiler is None:
+            profiler = Profiler()
+        start = profiler.clock()
+        if strip_height is None:
+            segments = ImageSegmenter(img).segment_image(pool=pool or self.segment_pool, budget=budget)
+        else:
+            segments = segment_image_in_strips(img, strip_height, budget=budget)
+        profiler.record('segment', start, segments=len(segments))
+        return self.classify_segments(segments, profiler, budget)
+
+
+class LoadedModel(object):
+    """
+    A `LabelModel` along with the index and arrays `Classifier` derives from it, built once per version of the model
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.index = LabelIndex.from_model(model)
+        self.profiles = model.arrays.get(PROFILES_ARRAY)
+        self.labels = np.array(model.labels, dtype=object)
+        self.label_sq_norms = squared_norms(model.vectors)
+
+
+class CascadeStats(object):
+    """
+    Counts how much work `Classifier.cascade_search` saves
+    """
+
+    def __init__(self):
+        self.segments = 0  # number of vectors classified
+        self.screened = 0  # number of labeled vectors checked against the ink profile bound
+        self.compared = 0  # number of labeled vectors that passed the bound and were compared in full
+
+    def record(self, screened, compared, segments=1):
+        self.segments += segments
+        self.screened += screened
+        self.compared += compared
+
+    def pruned_fraction(self):
+        """
+        Return the fraction of labeled vectors the bound ruled out
+        """
+        if self.screened == 0:
+            return 0.0
+        return 1 - float(self.compared) / self.screened
+
+    def __str__(self):
+        return "Segments: %d \nScreened: %d \nCompared: %d \nPruned: %.1f%%\n" % (self.segments, self.screened,
+                                                                                   self.compared,
+                                                                                   100 * self.pruned_fraction())
+
+
+def seg_and_classify_img(img_path, labels_dir=DEFAULT_LABELS_DIR, classifier=None, strip_height=None):
     """
     Segment and classify the segments contained in an image
 
@@ -23,21 +374,14 @@ def seg_and_classify_img(img_path, labels_dir):
     the same as those used to transform the labeled segments.
 
     :param img_path: path of image to classify
-    :param labels_dir: path of directory containing serialized objects. Each object represents an image. The name of the
-    object file is the label of the image and the object itself is a vector representing the image. All vectors should
-    be of same length
+    :param labels_dir: path of a labels directory or model file, see `label_model.load_label_model`
+    :param classifier: existing `Classifier` to use instead of one for `labels_dir`
+    :param strip_height: See `Classifier.classify_image`
     :return: List of `Segment` objects each with a classification attribute containing their classification
     """
-    segments = ImageSegmenter(img_path).segment_image()
-    labeled_segments = load_labeled_segments(labels_dir)
-    for segment in segments:
-        seg_transform = TransformSegment(segment)
-        rescale_size, fill_val = load_size_and_fill_val(labels_dir)
-        seg_transform.rescale(rescale_size)
-        seg_vec = seg_transform.get_flattened_pix_grid(fill_val)
-        classification = classify_segment_vector(seg_vec, labeled_segments)
-        segment.classification = classification
-    return segments
+    if classifier is None:
+        classifier = Classifier(labels_dir)
+    return classifier.classify_image(img_path, strip_height=strip_height)
 
 
 def classify_segment_vector(vec, labeled_segments):
@@ -48,28 +392,119 @@ def classify_segment_vector(vec, labeled_segments):
     :param labeled_segments: Dictionary where the keys are labels and values are vectors
     :return: Label of the labeled vector that has the smallest euclidean distance to the vec passed in
     """
-    comparisons = []
     labels = labeled_segments.keys()
-    labeled_vecs = labeled_segments.values()
-    for i in xrange(len(labeled_segments)):
-        comparisons.append((labels[i], euclidean(vec, labeled_vecs[i])))
-    comparisons.sort(key=lambda x: x[1])
-    return comparisons[0][0]
+    indices, _ = nearest_neighbours(np.atleast_2d(vec), np.array(labeled_segments.values()))
+    return labels[indices[0, 0]]
+
+
+def nearest_neighbours(vecs, labeled_vecs, labeled_sq_norms=None, k=1):
+    """
+    Find the `k` rows of `labeled_vecs` with the smallest euclidean distance to each row of `vecs`
+
+    All distances are computed at once from ||v - l||^2 = ||v||^2 - 2 v.l + ||l||^2, which needs a single matrix product
+    between the segment vectors and the labeled vectors
+
+    :param vecs: Array of shape (n, d)
+    :param labeled_vecs: Array of shape (m, d)
+    :param labeled_sq_norms: Squared norms of the rows of `labeled_vecs`, computed if not passed in
+    :param k: Number of nearest rows to return, capped at m
+    :return: Tuple of two arrays of shape (n, k): indices into `labeled_vecs` and their distances, closest first
+    """
+    if labeled_sq_norms is None:
+        labeled_sq_norms = squared_norms(labeled_vecs)
+    vecs = np.asarray(vecs, dtype=labeled_vecs.dtype)
+    sq_dists = squared_norms(vecs)[:, np.newaxis] - 2 * np.dot(vecs, labeled_vecs.T) + labeled_sq_norms
+    np.maximum(sq_dists, 0, out=sq_dists)  # rounding can leave tiny negative values for identical vectors
+    return k_nearest(sq_dists, k)
+
+
+def k_nearest(sq_dists, k):
+    """
+    Pick the `k` smallest squared distances of each row of `sq_dists`
+
+    :return: Same as `nearest_neighbours`
+    """
+    k = min(k, sq_dists.shape[1])
+    if k == 1:
+        indices = np.argmin(sq_dists, axis=1)[:, np.newaxis]
+    else:
+        indices = np.argpartition(sq_dists, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(indices))[:, np.newaxis]
+        indices = indices[rows, np.argsort(sq_dists[rows, indices], axis=1)]
+    return indices, np.sqrt(np.take_along_axis(sq_dists, indices, axis=1))
+
+
+def squared_norms(vecs):
+    """
+    Return the squared euclidean norm of each row of `vecs`
+    """
+    vecs = np.asarray(vecs)
+    return np.einsum('ij,ij->i', vecs, vecs)
+
+
+def get_label_model(path):
+    """
+    Return the `LabelModel` stored at `path`, loading it only if it isn't already cached for this process or if it
+    changed on disk since it was cached
+    """
+    with _model_cache_lock:
+        return _get_cache_entry(path)[1]
+
+
+def get_loaded_model(path):
+    """
+    Return the `LoadedModel` of the `LabelModel` stored at `path`, building it only once per version of the model the
+    same way `get_label_model` only loads the model once
+    """
+    with _model_cache_lock:
+        cached = _get_cache_entry(path)
+        if cached[2] is None:
+            cached[2] = LoadedModel(cached[1])
+        return cached[2]
+
+
+def _get_cache_entry(path):
+    """
+    Return the entry of `_model_cache` for `path`, replacing it if the model changed on disk. The lock must be held
+    """
+    key = os.path.abspath(path)
+    mtime = get_model_mtime(path)
+    cached = _model_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = [mtime, load_label_model(path), None]
+        _model_cache[key] = cached
+    return cached
+
+
+def invalidate_model_cache(path=None):
+    """
+    Drop the cached model for `path` or for every path if `path` is None so the next lookup reloads it
+    """
+    with _model_cache_lock:
+        if path is None:
+            _model_cache.clear()
+        else:
+            _model_cache.pop(os.path.abspath(path), None)
+
+
+def get_model_mtime(path):
+    """
+    Return the latest modification time of the files a labels directory or model file is loaded from
+    """
+    if os.path.isdir(path):
+        model_path = os.path.join(path, MODEL_FILE_NAME)
+        if os.path.exists(model_path):
+            return os.path.getmtime(model_path)
+        return max([os.path.getmtime(path)] + [os.path.getmtime(os.path.join(path, name)) for name in os.listdir(path)])
+    return os.path.getmtime(path)
 
 
 def load_labeled_segments(path_to_dir):
     """
-    Deserialize all objects in path_to_dir. Each object in the dir represents an image. The name of the
-    object file is the label of the image and the object itself is a vector representing the image. All vectors should
-    be of same length. The keys of the dictionary are the labels and the values are their corresponding vectors that
-    represent the labels
+    Load the labeled vectors in a labels directory or model file. The keys of the dictionary are the labels and the
+    values are their corresponding vectors that represent the labels
     """
-    vec_dic = {}
-    for file_path in os.listdir(path_to_dir):
-        if file_path not in ['fill_val.p', 'size.p']:
-            with open(os.path.join(path_to_dir, file_path), 'rb') as file_obj:
-                vec_dic[file_path[:-2]] = pickle.load(file_obj)
-    return vec_dic
+    return get_label_model(path_to_dir).as_dict()
 
 
 def load_size_and_fill_val(path_to_dir):
@@ -77,7 +512,5 @@ def load_size_and_fill_val(path_to_dir):
     Load the parameters used for `TransformSegment` when the labeled segments were initially serialized
     :return: tuple of size 2 containing (size, fill_val)
     """
-    size_obj_file = open(os.path.join(path_to_dir, 'size.p'), 'rb')
-    fill_val_obj_file = open(os.path.join(path_to_dir, 'fill_val.p'), 'rb')
-    return pickle.load(size_obj_file), pickle.load(fill_val_obj_file)
-
+    model = get_label_model(path_to_dir)
+    return model.size, model.fill_val
@@ -0,0 +1,391 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Local HTTP service that converts images to latex with the labeled model kept loaded between requests. It listens on a
+TCP port or a Unix socket:
+
+    python conversion_server.py --port 8080 --workers 4
+    curl --data-binary @equation.png http://localhost:8080/latex
+
+POST /latex takes the bytes of an image of any format PIL can read and answers with the JSON object
+{"latex": ..., "error": ..., "budget_exceeded": ..., "timings": {...}}. GET /health describes the model and the queue
+
+Requests are handled by one thread each. Concurrent requests are gathered into micro-batches, whose segments are
+classified together, and the batches are converted by a pool of worker processes that each load the model once. The
+number of queued requests is bounded: when the queue is full new requests are turned away with 503 straight away
+instead of piling up
+"""
+
+import os
+import json
+import time
+import Queue
+import argparse
+import threading
+import multiprocessing
+from StringIO import StringIO
+from SocketServer import ThreadingMixIn, UnixStreamServer
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+from budget import Budget
+from classify_segments import DEFAULT_LABELS_DIR, Classifier
+from image_to_latex import DEFAULT_BATCH_SIZE, ImageResult, convert_batch, describe_error
+from result_cache import ResultCache
+
+DEFAULT_MAX_WAIT = 0.005  # seconds a micro-batch waits for more requests after its first one
+DEFAULT_MAX_QUEUE = 256  # requests waiting for a batch before new ones are turned away
+DEFAULT_REQUEST_TIMEOUT = 60.0
+STOP_POLL_SECONDS = 0.1  # how often an idle batching thread checks whether the service is stopping
+MAX_IMAGE_BYTES = 32 * 1024 * 1024
+
+_worker_classifier = None  # `Classifier` of a worker process, loaded once per process
+_worker_result_cache = None
+_worker_budget = None
+_worker_strip_height = None
+
+
+class QueueFull(Exception):
+    """
+    Raised when a request is submitted while the queue of a `ConversionService` is full or the service is stopping
+    """
+    pass
+
+
+class ConversionService(object):
+    """
+    Converts image bytes submitted from any thread in micro-batches
+
+        service = ConversionService(workers=4)
+        service.start()
+        result = service.convert(image_bytes)
+        service.stop()
+    """
+
+    def __init__(self, labels_dir=DEFAULT_LABELS_DIR, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                 max_wait=DEFAULT_MAX_WAIT, max_queue=DEFAULT_MAX_QUEUE, result_cache_path=None, budget=None,
+                 strip_height=None, batch_timeout=DEFAULT_REQUEST_TIMEOUT):
+        """
+        :param labels_dir: path of a labels directory or model file, see `label_model.load_label_model`
+        :param workers: Number of worker processes converting batches, defaults to the number of cpus. With 1 batches
+        are converted by the batching thread in this process
+        :param batch_size: Maximum number of requests in a micro-batch
+        :param max_wait: Seconds a micro-batch waits for more requests to arrive after its first one
+        :param max_queue: Maximum number of requests waiting to be batched
+        :param result_cache_path: sqlite file of a `result_cache.ResultCache` to look images up in
+        :param budget: `budget.Budget` limiting the work each image may take
+        :param strip_height: Decode and segment images this many rows at a time, see `image_to_latex.convert_batch`
+        :param batch_timeout: Seconds a worker process may take to convert a batch before the batch's requests are
+        failed. A worker that dies(killed for running out of memory, a crash in a C extension) never answers
+        """
+        self.labels_dir = labels_dir
+        self.workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.result_cache_path = result_cache_path
+        self.budget = budget
+        self.strip_height = strip_height
+        self.batch_timeout = batch_timeout
+        self.classifier = Classifier(labels_dir)  # loaded up front so a bad model fails on start up
+        self.queue = Queue.Queue(max_queue)
+        self.batches = 0
+        self.converted = 0
+        self._converted_lock = threading.Lock()  # batches of worker processes are finished by their watcher threads
+        self._stopping = threading.Event()
+        self._in_flight = threading.BoundedSemaphore(max(2 * self.workers, 1))
+        self._result_cache = None
+        self._pool = None
+        self._thread = None
+
+    def start(self):
+        if self.workers > 1:
+            self._pool = multiprocessing.Pool(self.workers, _init_worker,
+                                              (self.labels_dir, self.result_cache_path, self.budget,
+                                               self.strip_height))
+        elif self.result_cache_path:
+            self._result_cache = ResultCache(self.result_cache_path)
+        self._thread = threading.Thread(target=self._batch_loop, name='conversion batcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Convert the requests already queued and stop
+        """
+        self._stopping.set()
+        self._thread.join()
+        if self._pool is not None:
+            # every batch is finished or given up on, the batch of a worker that died would keep `close` waiting
+            self._pool.terminate()
+            self._pool.join()
+        if self._result_cache is not None:
+            self._result_cache.close()
+
+    def submit(self, image_bytes):
+        """
+        Queue an image for conversion without waiting for it
+
+        :raises QueueFull: if too many requests are already waiting or the service is stopping
+        :return: `Request` to wait on
+        """
+        if self._stopping.is_set():
+            raise QueueFull('the service is stopping')
+        request = Request(image_bytes)
+        try:
+            self.queue.put_nowait(request)
+        except Queue.Full:
+            raise QueueFull('%d requests are already waiting' % self.queue.maxsize)
+        return request
+
+    def convert(self, image_bytes, timeout=DEFAULT_REQUEST_TIMEOUT):
+        """
+        Convert an image and wait for the result
+
+        :return: `image_to_latex.ImageResult`, its error is set if the image couldn't be converted in time
+        """
+        return self.submit(image_bytes).wait(timeout)
+
+    def _batch_loop(self):
+        while True:
+            try:
+                request = self.queue.get(timeout=STOP_POLL_SECONDS)
+            except Queue.Empty:
+                if self._stopping.is_set():
+                    break  # every request queued before `stop` has been dispatched
+                continue
+            batch = [request]
+            deadline = time.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(deadline - time.time(), 0)))
+                except Queue.Empty:
+                    break
+            self._dispatch(batch)
+
+        # wait for the batches still being converted
+        for _ in xrange(max(2 * self.workers, 1)):
+            self._in_flight.acquire()
+
+    def _dispatch(self, batch):
+        self.batches += 1
+        self._in_flight.acquire()  # at most a couple of batches per worker are converted at once
+        blobs = [request.image_bytes for request in batch]
+        if self._pool is None:
+            try:
+                results = convert_image_bytes(blobs, self.classifier, self._result_cache, self.budget,
+                                              self.strip_height)
+            except Exception as e:
+                results = failed_results(blobs, describe_error(e))
+            self._finish(batch, results)
+        else:
+            # python 2 pools have no error callback and lose the task of a worker that dies, so a thread per batch
+            # waits for the results and fails the batch if they don't come
+            async_result = self._pool.apply_async(_convert_in_worker, (blobs,))
+            watcher = threading.Thread(target=self._wait_for_worker, args=(batch, async_result),
+                                       name='conversion batch watcher')
+            watcher.daemon = True
+            watcher.start()
+
+    def _wait_for_worker(self, batch, async_result):
+        try:
+            results = async_result.get(self.batch_timeout)
+        except multiprocessing.TimeoutError:
+            results = failed_results(batch, 'Timeout: the worker converting the batch did not answer within %g seconds'
+                                     % self.batch_timeout)
+        except Exception as e:
+            results = failed_results(batch, describe_error(e))
+        self._finish(batch, results)
+
+    def _finish(self, batch, results):
+        for request, result in zip(batch, results):
+            request.set_result(result)
+        with self._converted_lock:
+            self.converted += len(batch)
+        self._in_flight.release()
+
+
+class Request(object):
+    """
+    An image waiting to be converted by a `ConversionService`
+    """
+
+    __slots__ = ('image_bytes', 'result', 'done')
+
+    def __init__(self, image_bytes):
+        self.image_bytes = image_bytes
+        self.result = None
+        self.done = threading.Event()
+
+    def set_result(self, result):
+        self.result = result
+        self.done.set()
+
+    def wait(self, timeout=DEFAULT_REQUEST_TIMEOUT):
+        if not self.done.wait(timeout):
+            return ImageResult(None, error='Timeout: not converted within %g seconds' % timeout)
+        return self.result
+
+
+def convert_image_bytes(blobs, classifier, result_cache=None, budget=None, strip_height=None):
+    """
+    Decode and convert a batch of images given as the bytes of image files, see `image_to_latex.convert_batch`
+
+    :return: List of `ImageResult` objects in the same order as `blobs`
+    """
+    # `convert_batch` decodes file objects itself, after checking each image's size against its own started budget
+    results = convert_batch([StringIO(blob) for blob in blobs], classifier, result_cache, budget,
+                            strip_height=strip_height)
+    for result in results:
+        result.img_path = None
+    return results
+
+
+def failed_results(batch, error):
+    """
+    Return an `ImageResult` with `error` for every image of `batch`
+    """
+    return [ImageResult(None, error=error) for _ in batch]
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """
+    HTTP interface of the `ConversionService` of the server it belongs to
+    """
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/latex':
+            return self.send_json(404, {'error': 'Not found: POST images to /latex'})
+        content_length = self.headers.getheader('Content-Length')
+        try:
+            length = int(content_length or 0)
+        except ValueError:
+            return self.send_json(400, {'error': 'Bad Content-Length header: %r' % content_length})
+        if length <= 0:
+            return self.send_json(400, {'error': 'Empty request: send the bytes of an image'})
+        if length > MAX_IMAGE_BYTES:
+            return self.send_json(413, {'error': 'Image is larger than %d bytes' % MAX_IMAGE_BYTES})
+        image_bytes = self.rfile.read(length)
+
+        try:
+            request = self.server.service.submit(image_bytes)
+        except QueueFull as e:
+            return self.send_json(503, {'error': 'Busy: %s' % e}, {'Retry-After': '1'})
+        result = request.wait()
+        if not request.done.is_set():
+            status = 504
+        else:
+            status = 200 if result.error is None else 422
+        self.send_json(status, {'latex': result.latex, 'error': result.error, 'budget_exceeded': result.budget_exceeded,
+                                'timings': result.timings})
+
+    def do_GET(self):
+        if self.path.rstrip('/') != '/health':
+            return self.send_json(404, {'error': 'Not found'})
+        service = self.server.service
+        self.send_json(200, {'model': service.classifier.model.checksum,
+                             'queued': service.queue.qsize(),
+                             'max_queue': service.queue.maxsize,
+                             'batches': service.batches,
+                             'converted': service.converted})
+
+    def send_json(self, status, obj, headers=None):
+        body = json.dumps(obj, sort_keys=True)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).iteritems():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # clients of a Unix socket have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    verbose = False
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+    verbose = False
+
+
+def make_server(service, host='127.0.0.1', port=8080, unix_socket=None):
+    """
+    Create a server for `service` listening on `host`:`port`, or on the Unix socket at `unix_socket` if given
+    """
+    if unix_socket is not None:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        server = ThreadingUnixHTTPServer(unix_socket, ConversionHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ConversionHandler)
+    server.service = service
+    return server
+
+
+def _init_worker(labels_dir, result_cache_path=None, budget=None, strip_height=None):
+    global _worker_classifier, _worker_result_cache, _worker_budget, _worker_strip_height
+    _worker_classifier = Classifier(labels_dir)
+    if result_cache_path:
+        _worker_result_cache = ResultCache(result_cache_path)
+    _worker_budget = budget
+    _worker_strip_height = strip_height
+
+
+def _convert_in_worker(blobs):
+    try:
+        return convert_image_bytes(blobs, _worker_classifier, _worker_result_cache, _worker_budget,
+                                   _worker_strip_height)
+    except Exception as e:
+        # an exception would be raised again in the watcher of the batch, but may not survive being pickled
+        return failed_results(blobs, describe_error(e))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve image to latex conversion over HTTP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--unix-socket', help='listen on a Unix socket at this path instead of a TCP port')
+    parser.add_argument('--labels', default=DEFAULT_LABELS_DIR, help='labels directory or model file')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes, defaults to cpu count')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='maximum requests per micro-batch')
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help='milliseconds a micro-batch waits for more requests')
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help='queued requests above which new requests are answered with 503')
+    parser.add_argument('--cache', help='sqlite file caching results by image content')
+    parser.add_argument('--max-seconds', type=float, help='give up on an image after this many seconds')
+    parser.add_argument('--max-pixels', type=int, help='refuse images with more pixels than this')
+    parser.add_argument('--max-segments', type=int, help='give up on images with more segments than this')
+    parser.add_argument('--max-depth', type=int, help='give up on images with operators nested deeper than this')
+    parser.add_argument('--strip-height', type=int,
+                        help='decode and segment images this many rows at a time to bound the memory a page takes')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    budget = Budget(args.max_seconds, args.max_pixels, args.max_segments, args.max_depth)
+    service = ConversionService(args.labels, args.workers, args.batch_size, args.max_wait_ms / 1000.0,
+                                args.max_queue, args.cache, budget, args.strip_height)
+    service.start()
+    server = make_server(service, args.host, args.port, args.unix_socket)
+    server.verbose = args.verbose
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == '__main__':
+    main()
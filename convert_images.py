@@ -0,0 +1,176 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Command line tool that converts images to latex and writes one JSON object per image per line(JSONL):
+
+    {"path": ..., "latex": ..., "error": ..., "budget_exceeded": ...,
+     "timings": {"segment": ..., "classify": ..., "layout": ...}}
+
+Images are given as directories(searched recursively), glob patterns or paths. With no images given, or with '-',
+newline separated paths are read from stdin. Everything is processed lazily so memory use stays bounded no matter how
+many images there are. With --resume, images already in the output file are skipped and new results are appended
+
+    python convert_images.py test_images -o results.jsonl
+    find scans -name '*.png' | python convert_images.py --workers 8 --resume -o results.jsonl
+    python convert_images.py uploads --cache results.sqlite -o results.jsonl
+    python convert_images.py scans --checkpoints scans.stages -o results.jsonl
+"""
+
+import os
+import sys
+import glob
+import json
+import struct
+import hashlib
+import argparse
+
+import numpy as np
+
+from budget import Budget
+from classify_segments import DEFAULT_LABELS_DIR
+from image_to_latex import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_TIMEOUT, iter_image_to_latex
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff')
+
+
+def iter_img_paths(sources, stdin=sys.stdin):
+    """
+    Lazily expand directories, glob patterns and paths into image paths. '-' stands for newline separated paths read
+    from `stdin`
+    """
+    for source in sources:
+        if source == '-':
+            for line in stdin:
+                if line.strip():
+                    yield line.strip()
+        elif os.path.isdir(source):
+            for dir_path, dir_names, file_names in os.walk(source):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                        yield os.path.join(dir_path, file_name)
+        elif glob.has_magic(source):
+            for path in sorted(glob.iglob(source)):
+                yield path
+        else:
+            yield source
+
+
+class DonePaths(object):
+    """
+    Set of the image paths that already have a result. Only a 64 bit digest of each path is kept, in a sorted array, so
+    resuming a run over millions of images doesn't hold all of their paths in memory
+    """
+
+    def __init__(self, digests=()):
+        self.digests = np.unique(np.array(digests, dtype=np.uint64))
+
+    def __contains__(self, path):
+        digest = np.uint64(path_digest(path))
+        i = np.searchsorted(self.digests, digest)
+        return i < len(self.digests) and self.digests[i] == digest
+
+    def __len__(self):
+        return len(self.digests)
+
+
+def path_digest(path):
+    if isinstance(path, unicode):
+        path = path.encode('utf-8')  # paths read back from JSON are unicode, paths from the command line bytes
+    return struct.unpack('<Q', hashlib.sha1(path).digest()[:8])[0]
+
+
+def read_done_paths(output_path):
+    """
+    Return the `DonePaths` of the image paths that already have a result in the JSONL file `output_path`
+
+    Only the last line can have been cut short by an interrupted run: if it is partially written it is truncated, if it
+    is a complete result missing its newline it gets one, so new results can be appended after it. Other lines that
+    aren't results are skipped and left as they are
+    """
+    if not os.path.exists(output_path):
+        return DonePaths()
+    digests = []
+    with open(output_path, 'r+b') as output_file:
+        line_start = 0
+        for line in iter(output_file.readline, ''):
+            try:
+                digests.append(path_digest(json.loads(line)['path']))
+                complete = True
+            except (ValueError, KeyError, TypeError):
+                complete = False
+            if not line.endswith('\n'):  # the last line, cut short
+                if complete:
+                    output_file.seek(0, os.SEEK_END)  # stdio needs a seek between reading and writing
+                    output_file.write('\n')
+                else:
+                    output_file.truncate(line_start)
+            line_start = output_file.tell()
+    return DonePaths(digests)
+
+
+def result_to_json(result):
+    return json.dumps({'path': result.img_path,
+                       'latex': result.latex,
+                       'error': result.error,
+                       'budget_exceeded': result.budget_exceeded,
+                       'timings': result.timings}, sort_keys=True)
+
+
+def main(argv=None, stdin=sys.stdin, stdout=sys.stdout):
+    parser = argparse.ArgumentParser(description='Convert screenshots of compiled latex into latex source')
+    parser.add_argument('sources', nargs='*', default=['-'],
+                        help="directories, glob patterns or image paths, '-' to read paths from stdin(default)")
+    parser.add_argument('-o', '--output', help='JSONL file to write results to, defaults to stdout')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip images that already have a result in the output file and append to it')
+    parser.add_argument('--labels', default=DEFAULT_LABELS_DIR, help='labels directory or model file')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes, defaults to cpu count')
+    parser.add_argument('--segment-workers', type=int,
+                        help='number of processes to segment each image over, for a few very large images. Implies '
+                             '--workers 1')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='number of images whose segments are classified together')
+    parser.add_argument('--batch-timeout', type=float, default=DEFAULT_BATCH_TIMEOUT,
+                        help='seconds to wait for a worker process to convert a batch before its images are failed')
+    parser.add_argument('--cache', help='sqlite file caching results by image content, images already in it are not '
+                                        'converted again')
+    parser.add_argument('--checkpoints', help='directory to save the segments and classifications of each image to, '
+                                              'a later run starts images from them unless the image changed')
+    parser.add_argument('--strip-height', type=int,
+                        help='decode and segment images this many rows at a time so memory use does not grow with '
+                             'the size of a page')
+    parser.add_argument('--max-seconds', type=float, help='give up on an image after this many seconds')
+    parser.add_argument('--max-pixels', type=int, help='skip images with more pixels than this')
+    parser.add_argument('--max-segments', type=int, help='give up on images with more segments than this')
+    parser.add_argument('--max-depth', type=int, help='give up on images with operators nested deeper than this')
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.output:
+        parser.error('--resume requires --output')
+    if args.segment_workers is not None and args.segment_workers > 1:
+        if args.workers is None:
+            args.workers = 1
+        elif args.workers > 1:
+            parser.error('--segment-workers requires --workers 1')
+
+    img_paths = iter_img_paths(args.sources, stdin)
+    if args.resume:
+        done = read_done_paths(args.output)
+        img_paths = (path for path in img_paths if path not in done)
+
+    output_file = open(args.output, 'ab' if args.resume else 'wb') if args.output else stdout
+    try:
+        budget = Budget(args.max_seconds, args.max_pixels, args.max_segments, args.max_depth)
+        results = iter_image_to_latex(img_paths, args.labels, args.workers, args.batch_size, args.cache, budget,
+                                      args.checkpoints, args.strip_height, args.segment_workers, args.batch_timeout)
+        for result in results:
+            output_file.write(result_to_json(result) + '\n')
+            output_file.flush()
+    finally:
+        if output_file is not stdout:
+            output_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Incremental recognition of a sequence of similar frames, such as screen captures taken while someone writes or scrolls
+through an equation. Each frame is diffed against the previous one and only the groups of pixels that changed are
+cropped into new segments and classified, the segments of the unchanged groups are carried over along with their
+classifications. Layout is only recomputed when the segments changed, a frame identical to the previous one or that only
+differs in specks too small to be segments gives the previous latex back straight away
+
+    sequence = FrameSequence()
+    for frame in frames:
+        print sequence.update(frame)
+
+Binarizing and diffing a frame are vectorized passes over the whole frame. Labelling only covers the boxes around the
+changed pixels and the groups they touch, the labels of the rest of the frame are carried over. Everything done per
+segment(cropping, rescaling, classification and layout) only happens for the groups of pixels that changed
+"""
+
+import numpy as np
+from scipy import ndimage
+
+from classify_segments import DEFAULT_LABELS_DIR, Classifier
+from image_to_latex import segments_to_latex
+from profiling import Profiler
+from segment_img import CONNECTIVITY, WHITE, ImageSegmenter, Segment, count_ink, downsample_mask, resolution_scale
+
+DIFF_TILE = 32  # side of the tiles changed pixels are grouped by into the boxes that are labelled again
+
+
+class FrameSequence(object):
+    """
+    Converts frames one after another, reusing the work done for the previous frame wherever the frames agree
+    """
+
+    def __init__(self, labels_dir=DEFAULT_LABELS_DIR, classifier=None, min_pixels=30, threshold=WHITE,
+                 target_glyph_height=None):
+        """
+        :param classifier: existing `classify_segments.Classifier` to use instead of one for `labels_dir`
+        :param min_pixels: Minimum number of pixels that constitute a segment, as in `ImageSegmenter.segment_image`
+        :param threshold: Passed to `segment_img.binarize`
+        :param target_glyph_height: Downsample high dpi frames the same way as `ImageSegmenter.segment_image`, None to
+        segment at full resolution
+        """
+        self.classifier = classifier if classifier is not None else Classifier(labels_dir)
+        self.min_pixels = min_pixels
+        self.threshold = threshold
+        self.target_glyph_height = target_glyph_height
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the previous frame, the next frame is converted from scratch
+        """
+        self.frame_shape = None  # (height, width) of the previous frame before it was downsampled
+        self.ink_mask = None  # ink mask of the previous frame, downsampled by `scale`
+        self.ink_counts = None  # pixels of the previous frame behind each pixel of `ink_mask`, None if `scale` is 1
+        self.scale = 1  # factor the previous frame was downsampled by
+        self.labels = None  # group label of each pixel of the previous frame, 0 for background
+        self.group_boxes = {}  # group label -> (y slice, x slice) of the group in `labels`, specks included
+        self.next_label = 1  # label the next new group gets, labels of groups that are gone aren't reused
+        self.segments_by_label = {}  # group label -> classified `Segment` of the previous frame
+        self.segments = []  # classified segments of the previous frame in the order `segment_image` returns them
+        self.latex = None  # latex of the previous frame
+        self.reused = 0  # number of segments of the latest frame carried over from the frame before it
+        self.segmented = 0  # number of segments of the latest frame that were cropped and classified
+
+    def update(self, img, stats=None):
+        """
+        Convert the next frame of the sequence
+
+        :param img: Path to an image, a PIL image of any mode or an ink mask, anything `ImageSegmenter` accepts
+        :param stats: `profiling.PipelineStats` to add the time and counts of each stage to
+        :return: latex of the frame
+        """
+        profiler = Profiler(stats)
+        start = profiler.clock()
+        ink_mask = ImageSegmenter(img, self.threshold).ink_mask
+        profiler.record('decode', start, pixels=ink_mask.size)
+
+        frame_shape = ink_mask.shape
+        scale, ink_counts = 1, None
+        if self.target_glyph_height is not None:
+            # the frames of a sequence share their dpi, the scale is only picked again for a frame of another size
+            if frame_shape == self.frame_shape:
+                scale = self.scale
+            else:
+                scale = resolution_scale(ink_mask, self.target_glyph_height)
+        if scale > 1:
+            ink_counts = count_ink(ink_mask, scale)
+            ink_mask = ink_counts > 0
+
+        start = profiler.clock()
+        if frame_shape != self.frame_shape:
+            changed = None  # first frame or a frame of another size, nothing can be reused
+        elif ink_counts is not None:
+            # a group whose downsampled pixels are the same can still have gained or lost pixels of the image
+            changed = ink_counts != self.ink_counts
+        else:
+            changed = ink_mask != self.ink_mask
+        if changed is not None and not changed.any():
+            profiler.record('diff', start, changed_pixels=0)
+            self.reused, self.segmented = len(self.segments), 0
+            return self.latex
+        profiler.record('diff', start, changed_pixels=int(changed.sum()) if changed is not None else ink_mask.size)
+
+        start = profiler.clock()
+        if changed is None:
+            regions = [((slice(0, ink_mask.shape[0]), slice(0, ink_mask.shape[1])), None)]
+            group_boxes, segments_by_label, next_label = {}, {}, 1
+        else:
+            regions = self.changed_regions(changed)
+            touched = set().union(*[region_touched for _, region_touched in regions])
+            group_boxes = dict((label, box) for label, box in self.group_boxes.iteritems() if label not in touched)
+            segments_by_label = dict((label, segment) for label, segment in self.segments_by_label.iteritems()
+                                     if label not in touched)
+            next_label = self.next_label
+
+        new_segments = []
+        relabelled = []  # (box, pixels labelled again, their new labels) of each region
+        for box, region_touched in regions:
+            y_start, x_start = box[0].start, box[1].start
+            dirty = None
+            mask = ink_mask[box]
+            if region_touched is not None:
+                # the changed pixels and the groups they touch are labelled again, other groups in the box are kept
+                dirty = changed[box] | np.in1d(self.labels[box], list(region_touched)).reshape(mask.shape)
+                mask = mask & dirty
+            region_labels, num_labels = ndimage.label(mask, structure=CONNECTIVITY)
+            weights = None if ink_counts is None else ink_counts[box].ravel()
+            pixel_counts = np.bincount(region_labels.ravel(), weights=weights, minlength=num_labels + 1)
+            for label, (y_slice, x_slice) in enumerate(ndimage.find_objects(region_labels), 1):
+                group_label = next_label + label - 1
+                group_boxes[group_label] = (slice(y_start + y_slice.start, y_start + y_slice.stop),
+                                            slice(x_start + x_slice.start, x_start + x_slice.stop))
+                if pixel_counts[label] <= self.min_pixels:
+                    continue
+                segment = Segment(region_labels[y_slice, x_slice] == label,
+                                  (int(x_start + x_slice.start), int(y_start + y_slice.start)))
+                segments_by_label[group_label] = segment
+                new_segments.append(segment)
+            region_labels[region_labels > 0] += next_label - 1
+            relabelled.append((box, dirty, region_labels))
+            next_label += num_labels
+        segments = sorted(segments_by_label.itervalues(), key=scan_order)
+        profiler.record('segment', start, segments=len(new_segments), reused_segments=len(segments) - len(new_segments))
+
+        self.classifier.classify_segments(new_segments, profiler)
+
+        # the same segments in the same order lay out the same, only specks below min_pixels changed
+        if new_segments or len(segments) != len(self.segments) or self.latex is None:
+            start = profiler.clock()
+            self.latex = segments_to_latex(segments)
+            profiler.record('layout', start)
+
+        if changed is None:
+            self.labels = relabelled[0][2]
+        else:
+            for box, dirty, region_labels in relabelled:
+                self.labels[box][dirty] = region_labels[dirty]
+        self.frame_shape, self.ink_mask, self.ink_counts, self.scale = frame_shape, ink_mask, ink_counts, scale
+        self.group_boxes, self.next_label = group_boxes, next_label
+        self.segments_by_label, self.segments = segments_by_label, segments
+        self.reused, self.segmented = len(segments) - len(new_segments), len(new_segments)
+        return self.latex
+
+    def changed_regions(self, changed):
+        """
+        Group the changed pixels into boxes to label again, each along with the groups of the previous frame that its
+        changes touch
+
+        A group touches a changed pixel when it contains it or is next to it, the groups of the previous frame that
+        touch none are exactly the groups of the new frame that touch none. Changed pixels are grouped by the
+        `DIFF_TILE` tiles they fall in, so far apart changes get boxes of their own. Each box is widened to hold the
+        groups it touches whole and boxes that then overlap are merged
+
+        :param changed: Boolean array marking the pixels that differ from the previous frame
+        :return: List of ((y slice, x slice), set of labels of the previous frame) that don't overlap
+        """
+        height, width = changed.shape
+        tiles, _ = ndimage.label(downsample_mask(changed, DIFF_TILE), structure=np.ones((3, 3), dtype=bool))
+        regions = []
+        for y_tiles, x_tiles in ndimage.find_objects(tiles):
+            # a pixel wider than the tiles so the groups next to the changes are in the box
+            box = [max(y_tiles.start * DIFF_TILE - 1, 0), min(y_tiles.stop * DIFF_TILE + 1, height),
+                   max(x_tiles.start * DIFF_TILE - 1, 0), min(x_tiles.stop * DIFF_TILE + 1, width)]
+            region = (slice(box[0], box[1]), slice(box[2], box[3]))
+            near_changes = ndimage.binary_dilation(changed[region], CONNECTIVITY)
+            touched = set(np.unique(self.labels[region][near_changes]).tolist())
+            touched.discard(0)
+            for label in touched:
+                y_slice, x_slice = self.group_boxes[label]
+                box = [min(box[0], y_slice.start), max(box[1], y_slice.stop),
+                       min(box[2], x_slice.start), max(box[3], x_slice.stop)]
+            regions.append((box, touched))
+
+        merged = True
+        while merged:
+            merged = False
+            for i, j in ((i, j) for i in xrange(len(regions)) for j in xrange(i + 1, len(regions))):
+                (a, a_touched), (b, b_touched) = regions[i], regions[j]
+                if a[0] < b[1] and b[0] < a[1] and a[2] < b[3] and b[2] < a[3]:
+                    regions[i] = ([min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3])],
+                                  a_touched | b_touched)
+                    del regions[j]
+                    merged = True
+                    break
+        return [((slice(box[0], box[1]), slice(box[2], box[3])), touched) for box, touched in regions]
+
+
+def scan_order(segment):
+    """
+    Sort key putting segments in the order `ImageSegmenter.segment_image` returns them, by their first pixel row by row
+    """
+    return segment.upper_left[1], segment.upper_left[0] + int(segment.bitmap[0].argmax())
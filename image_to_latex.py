@@ -1,14 +1,395 @@
 # Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
 
-from classify_segments import seg_and_classify_img
+import time
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from PIL import Image
+
+from budget import BudgetExceeded
+from classify_segments import DEFAULT_LABELS_DIR, Classifier
+from profiling import Profiler
+from result_cache import ResultCache
+from segment_img import ImageSegmenter, segment_image_in_strips
 from segments_to_latex import SegmentsToLatex
+from stage_artifacts import CLASSIFIED, StageCheckpoints
+
+DEFAULT_BATCH_SIZE = 16  # number of images whose segments are classified together
+DEFAULT_BATCH_TIMEOUT = 600.0  # seconds to wait for a worker process to convert a batch before failing its images
+
+_worker_classifier = None  # `Classifier` of a worker process of `image_to_latex_many`, loaded once per process
+_worker_result_cache = None  # `ResultCache` of a worker process of `image_to_latex_many`
+_worker_budget = None  # `Budget` of each image converted by a worker process of `image_to_latex_many`
+_worker_checkpoints = None  # `StageCheckpoints` of a worker process of `image_to_latex_many`
+_worker_strip_height = None  # rows a worker process of `image_to_latex_many` segments images by, None for whole images
+
+
+class ImageResult(object):
+    """
+    Result of converting one image with `image_to_latex_many`. Exactly one of `latex` and `error` is set
+    """
+
+    def __init__(self, img_path, latex=None, error=None):
+        self.img_path = img_path
+        self.latex = latex
+        self.error = error  # description of the exception that stopped the image from being converted
+        self.budget_exceeded = None  # `budget.BudgetExceeded.as_dict` when the error is that the budget ran out
+        # seconds spent on each stage, classification is done for a whole batch and is split by number of segments
+        self.timings = {}
 
+    def __str__(self):
+        return "Image: %s \nLatex: %s \nError: %s\n" % (self.img_path, self.latex, self.error)
 
-def image_to_latex(img_path):
+
+def image_to_latex(img_path, labels_dir=DEFAULT_LABELS_DIR, classifier=None, result_cache=None, stats=None,
+                   budget=None, strip_height=None, segment_pool=None):
     """
     Segment an image, classify the segments, and deduce its latex code from the classified segments
+
+    :param classifier: existing `classify_segments.Classifier` to use instead of one for `labels_dir`
+    :param result_cache: `result_cache.ResultCache` to look the image up in before converting it and to store the
+    result in afterwards
+    :param stats: `profiling.PipelineStats` to add the time and counts of each stage to
+    :param budget: `budget.Budget` limiting the work the conversion may take
+    :param strip_height: Decode and segment the image this many rows at a time instead of all at once, see
+    `segment_in_strips`. The result cache is then only looked up once the image is segmented
+    :param segment_pool: `multiprocessing.Pool` to segment the blocks of the image over, defaults to the classifier's
+    `segment_pool`
+    :raises budget.BudgetExceeded: if the conversion goes over `budget`
+    """
+    profiler = Profiler(stats)
+    if classifier is None:
+        classifier = Classifier(labels_dir, segment_pool=segment_pool)
+    if budget is not None:
+        budget = budget.start()
+
+    start = profiler.clock()
+    img = open_image(img_path, budget, load=strip_height is None)
+    profiler.record('decode', start, pixels=img.size[0] * img.size[1])
+
+    if strip_height is not None:
+        start = profiler.clock()
+        try:
+            segments, key = segment_in_strips(img, strip_height, result_cache and classifier.model.checksum, budget)
+        finally:
+            if img is not img_path:
+                img.close()
+        profiler.record('segment', start, segments=len(segments))
+    elif result_cache is not None:
+        key = ResultCache.key(img, classifier.model.checksum)
+
+    if result_cache is not None:
+        start = profiler.clock()
+        latex = result_cache.get(key)
+        profiler.record('result_cache', start, result_cache_hits=int(latex is not None),
+                        result_cache_misses=int(latex is None))
+        if latex is not None:
+            return latex
+
+    if strip_height is None:
+        segments = classifier.classify_image(img, profiler, budget, pool=segment_pool)
+    else:
+        classifier.classify_segments(segments, profiler, budget)
+
+    start = profiler.clock()
+    latex = segments_to_latex(segments, budget)
+    profiler.record('layout', start)
+
+    if result_cache is not None:
+        result_cache.put(key, latex)
+    return latex
+
+
+def segment_in_strips(img, strip_height, model_checksum=None, budget=None):
+    """
+    Segment an image strip by strip with `segment_img.segment_image_in_strips`, computing its `ResultCache` key from the
+    strips as they are decoded
+
+    :param img: PIL image, preferably not loaded yet so it is decoded strip by strip
+    :param model_checksum: Checksum of the model the segments are classified with, None to skip the cache key
+    :return: (list of `Segment` objects, cache key or None)
+    """
+    if model_checksum is None:
+        return segment_image_in_strips(img, strip_height, budget=budget), None
+    digest = ResultCache.digest(img, model_checksum)
+    segments = segment_image_in_strips(img, strip_height, budget=budget,
+                                       on_strip=lambda strip: digest.update(strip.tobytes()))
+    return segments, digest.hexdigest()
+
+
+def segments_to_latex(classified_segments, budget=None):
+    """
+    Deduce the latex code of an image from its classified segments
+
+    :param budget: started `budget.Budget` whose time and depth limits to check
     """
-    classified_segments = seg_and_classify_img(img_path, 'serialized_labeled_imgs')
-    seg_to_latex = SegmentsToLatex(classified_segments)
+    seg_to_latex = SegmentsToLatex(classified_segments, budget)
     simplfied = seg_to_latex.search_and_simplify((0, 0), (999999, 999999))  # search entire region
     return simplfied.classification
+
+
+def image_to_latex_many(img_paths, labels_dir=DEFAULT_LABELS_DIR, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                        result_cache_path=None, budget=None, checkpoints_dir=None, strip_height=None,
+                        segment_workers=None, batch_timeout=DEFAULT_BATCH_TIMEOUT):
+    """
+    Convert many images to latex
+
+    The images are split into batches of `batch_size` and the batches are spread over a pool of `workers` processes,
+    each of which loads the labeled vectors once. Within a batch every image is segmented first and the segments of all
+    the images are classified together in one call. An image that fails doesn't stop the others from being converted,
+    its result holds the error instead
+
+    :param img_paths: Paths of the images to convert
+    :param workers: Number of worker processes, defaults to the number of cpus. With 1 everything runs in this process
+    :param result_cache_path: sqlite file of a `result_cache.ResultCache` shared by the workers, images already in it
+    aren't converted again
+    :param budget: `budget.Budget` limiting the work each image may take, an image that goes over it gets an error
+    :param checkpoints_dir: Directory of `stage_artifacts.StageCheckpoints`, images start from the segments and
+    classifications an earlier run saved there
+    :param strip_height: Decode and segment each image this many rows at a time, see `convert_batch`
+    :param segment_workers: Number of processes to segment the blocks of each image over, for a few very large images
+    rather than many small ones. Only with `workers` 1, the worker processes can't have pools of their own
+    :param batch_timeout: Seconds to wait for the results of a batch once the batches before it are done, after which
+    its images are failed. A worker process that dies(killed for running out of memory, a crash in a C extension)
+    never answers. None to wait forever
+    :return: List of `ImageResult` objects in the same order as `img_paths`
+    """
+    return list(iter_image_to_latex(img_paths, labels_dir, workers, batch_size, result_cache_path, budget,
+                                    checkpoints_dir, strip_height, segment_workers, batch_timeout))
+
+
+def iter_image_to_latex(img_paths, labels_dir=DEFAULT_LABELS_DIR, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                        result_cache_path=None, budget=None, checkpoints_dir=None, strip_height=None,
+                        segment_workers=None, batch_timeout=DEFAULT_BATCH_TIMEOUT):
+    """
+    Lazy version of `image_to_latex_many`: `img_paths` can be any iterable, including an endless one, and results are
+    yielded in order as soon as they are ready. Only a few batches per worker are read ahead of the results that have
+    been consumed so memory use doesn't grow with the number of images
+    """
+    batches = iter_batches(img_paths, batch_size)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    segment_workers = segment_workers or 1
+    if segment_workers > 1 and workers > 1:
+        raise ValueError('segment_workers requires workers=1, worker processes cannot start pools of their own')
+
+    if workers <= 1:
+        segment_pool = multiprocessing.Pool(segment_workers) if segment_workers > 1 else None
+        classifier = Classifier(labels_dir, segment_pool=segment_pool)
+        result_cache = ResultCache(result_cache_path) if result_cache_path else None
+        checkpoints = StageCheckpoints(checkpoints_dir) if checkpoints_dir else None
+        try:
+            for batch in batches:
+                for result in convert_batch(batch, classifier, result_cache, budget, checkpoints, strip_height):
+                    yield result
+        finally:
+            if result_cache is not None:
+                result_cache.close()
+            if segment_pool is not None:
+                segment_pool.terminate()
+                segment_pool.join()
+        return
+
+    pool = multiprocessing.Pool(workers, _init_worker,
+                                (labels_dir, result_cache_path, budget, checkpoints_dir, strip_height))
+    try:
+        pending = deque()
+        for batch in batches:
+            pending.append((batch, pool.apply_async(_convert_batch_in_worker, (batch,))))
+            if len(pending) >= 2 * workers:
+                for result in _batch_results(*pending.popleft(), timeout=batch_timeout):
+                    yield result
+        while pending:
+            for result in _batch_results(*pending.popleft(), timeout=batch_timeout):
+                yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _batch_results(batch, async_result, timeout=None):
+    """
+    Wait for the results of a batch sent to a worker process, failing its images if the worker doesn't answer in time
+    """
+    try:
+        return async_result.get(timeout)
+    except multiprocessing.TimeoutError:
+        error = 'Timeout: the worker converting the batch did not answer within %g seconds' % timeout
+    except Exception as e:
+        error = describe_error(e)
+    return [ImageResult(img_path, error=error) for img_path in batch]
+
+
+def iter_batches(iterable, batch_size):
+    """
+    Yield lists of up to `batch_size` consecutive items of `iterable`
+    """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+def convert_batch(img_paths, classifier, result_cache=None, budget=None, checkpoints=None, strip_height=None):
+    """
+    Segment every image in `img_paths`, classify all of their segments together and deduce the latex of each image
+
+    :param img_paths: Paths of the images to convert, file objects or already opened PIL images
+    :param result_cache: `result_cache.ResultCache` to look the images up in before converting them and to store the
+    results in afterwards. Images found in it skip segmentation, classification and layout
+    :param budget: `budget.Budget` limiting the work each image may take. The clock of each image starts when it is
+    opened, classification is shared by the batch and only bounded by the segment limit
+    :param checkpoints: `stage_artifacts.StageCheckpoints` to start images from the segments and classifications saved
+    by an earlier run and to save them to. Segments are saved as soon as an image is segmented and saved again with
+    their classifications. Classifications are only reused if they are from the current model
+    :param strip_height: Decode and segment each image this many rows at a time with `segment_in_strips` instead of
+    all at once, so memory use doesn't grow with the size of a page. The result cache is then looked up once an image is
+    segmented and a hit only skips classification and layout
+    :return: List of `ImageResult` objects in the same order as `img_paths`
+    """
+    profiler = Profiler()  # only reports to the hooks, the time of each stage is kept in the results
+    results = [ImageResult(img_path) for img_path in img_paths]
+    segments_per_img = [None] * len(img_paths)
+    classified = [False] * len(img_paths)  # whether the segments of the image were classified by an earlier run
+    cache_keys = [None] * len(img_paths)
+    budgets = [None] * len(img_paths)
+    scales = [1] * len(img_paths)  # factor each image was downsampled by before it was segmented
+    for i, img_path in enumerate(img_paths):
+        start = time.time()
+        try:
+            if budget is not None:
+                budgets[i] = budget.start()
+            artifact = checkpoints.load(img_path) if checkpoints is not None else None
+            if artifact is not None:
+                segments_per_img[i] = artifact.segments
+                scales[i] = artifact.scale
+                classified[i] = artifact.stage == CLASSIFIED and artifact.model_checksum == classifier.model.checksum
+                if budgets[i] is not None:
+                    budgets[i].check_segments(len(artifact.segments))
+                continue
+            img = open_image(img_path, budgets[i], load=strip_height is None)
+            if strip_height is not None:
+                try:
+                    segments, cache_keys[i] = segment_in_strips(img, strip_height,
+                                                                result_cache and classifier.model.checksum, budgets[i])
+                finally:
+                    if img is not img_path:
+                        img.close()
+                if cache_keys[i] is not None:
+                    results[i].latex = result_cache.get(cache_keys[i])
+            else:
+                if result_cache is not None:
+                    cache_keys[i] = ResultCache.key(img, classifier.model.checksum)
+                    results[i].latex = result_cache.get(cache_keys[i])
+                if results[i].latex is None:
+                    segmenter = ImageSegmenter(img)
+                    segments = segmenter.segment_image(pool=classifier.segment_pool, budget=budgets[i])
+                    scales[i] = segmenter.scale
+            if results[i].latex is None:
+                segments_per_img[i] = segments
+                if checkpoints is not None:
+                    # saved straight away so the segments survive classification failing or the run being stopped
+                    checkpoints.save(img_path, segments, scale=scales[i])
+        except Exception as e:
+            set_error(results[i], e)
+            segments_per_img[i] = None
+        finally:
+            results[i].timings['segment'] = time.time() - start
+            profiler.record('segment', start, segments=len(segments_per_img[i] or []))
+
+    start = time.time()
+    to_classify = [segments if segments and not done else [] for segments, done in zip(segments_per_img, classified)]
+    all_segments = [segment for segments in to_classify for segment in segments]
+    try:
+        classifier.classify_segments(all_segments, profiler)
+    except Exception:
+        # classify image by image so the image that caused the failure doesn't fail the rest of the batch
+        for i, segments in enumerate(to_classify):
+            try:
+                classifier.classify_segments(segments)
+            except Exception as e:
+                set_error(results[i], e)
+                segments_per_img[i] = None
+    classify_time = time.time() - start
+
+    if checkpoints is not None:
+        for img_path, segments, done, scale in zip(img_paths, segments_per_img, classified, scales):
+            if segments is not None and not done:
+                checkpoints.save(img_path, segments, classifier.model.checksum, scale=scale)
+
+    for result, segments, img_segments_to_classify, img_budget in zip(results, segments_per_img, to_classify, budgets):
+        if segments is not None:
+            result.timings['classify'] = classify_time * len(img_segments_to_classify) / max(len(all_segments), 1)
+            start = time.time()
+            try:
+                result.latex = segments_to_latex(segments, img_budget)
+            except Exception as e:
+                set_error(result, e)
+            result.timings['layout'] = time.time() - start
+            profiler.record('layout', start)
+
+    if result_cache is not None:
+        for result, segments, key in zip(results, segments_per_img, cache_keys):
+            if segments is not None and result.latex is not None and key is not None:
+                result_cache.put(key, result.latex)
+    return results
+
+
+def open_image(img_path, budget=None, load=True):
+    """
+    Open and decode the image at `img_path`, which can also be a file object. PIL images are returned as they are
+
+    :param budget: `budget.Budget` whose pixel limit to check before the image is decoded
+    :param load: Decode the image and close its file. Otherwise the image is returned undecoded with its file open for
+    `segment_img.iter_image_strips` to decode strip by strip, the caller closes it
+    """
+    if isinstance(img_path, Image.Image):
+        img = img_path
+        if budget is not None:
+            budget.check_pixels(img.size[0] * img.size[1])
+        return img
+    img = Image.open(img_path)
+    if not load:
+        try:
+            if budget is not None:
+                budget.check_pixels(img.size[0] * img.size[1])
+        except Exception:
+            img.close()
+            raise
+        return img
+    with img:
+        if budget is not None:
+            budget.check_pixels(img.size[0] * img.size[1])
+        img.load()
+        return img
+
+
+def describe_error(error):
+    return '%s: %s' % (type(error).__name__, error)
+
+
+def set_error(result, error):
+    """
+    Record the exception that stopped the image of `result` from being converted
+    """
+    result.error = describe_error(error)
+    if isinstance(error, BudgetExceeded):
+        result.budget_exceeded = error.as_dict()
+
+
+def _init_worker(labels_dir, result_cache_path=None, budget=None, checkpoints_dir=None, strip_height=None):
+    global _worker_classifier, _worker_result_cache, _worker_budget, _worker_checkpoints, _worker_strip_height
+    _worker_classifier = Classifier(labels_dir)
+    if result_cache_path:
+        _worker_result_cache = ResultCache(result_cache_path)
+    _worker_budget = budget
+    if checkpoints_dir:
+        _worker_checkpoints = StageCheckpoints(checkpoints_dir)
+    _worker_strip_height = strip_height
+
+
+def _convert_batch_in_worker(img_paths):
+    return convert_batch(img_paths, _worker_classifier, _worker_result_cache, _worker_budget, _worker_checkpoints,
+                         _worker_strip_height)
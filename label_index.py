@@ -0,0 +1,99 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+With a large library of labeled vectors comparing every segment against every labeled vector gets slow. `LabelIndex`
+projects the labeled vectors onto their first principal components and puts the projections in a KD tree, so the labeled
+vectors closest to a segment can be shortlisted quickly. The shortlist is then compared exactly against the full vectors
+
+The index is built when the labeled images are serialized and stored in the model file alongside the labeled vectors
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+DEFAULT_COMPONENTS = 32  # number of principal components to project onto
+
+# names of the arrays holding the index in a `LabelModel`
+MEAN_ARRAY = 'index_mean'
+COMPONENTS_ARRAY = 'index_components'
+PROJECTED_ARRAY = 'index_projected'
+
+
+class LabelIndex(object):
+    """
+    Approximate nearest neighbour index over the labeled vectors of a `LabelModel`
+    """
+
+    def __init__(self, mean, components, projected):
+        """
+        :param mean: Mean of the labeled vectors, shape (d,)
+        :param components: Principal components to project onto, shape (r, d)
+        :param projected: Projections of the labeled vectors, shape (m, r)
+        """
+        self.mean = mean
+        self.components = components
+        self.projected = projected
+        self.tree = cKDTree(projected)
+
+    @classmethod
+    def build(cls, vectors, n_components=DEFAULT_COMPONENTS):
+        """
+        Build an index over `vectors`, an array of shape (m, d) of labeled vectors
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        mean = vectors.mean(axis=0)
+        _, _, principal_axes = np.linalg.svd(vectors - mean, full_matrices=False)
+        components = principal_axes[:n_components]
+        return cls(mean.astype(np.float32), components.astype(np.float32),
+                   np.dot(vectors - mean, components.T).astype(np.float32))
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        Return the index stored in a `LabelModel` or None if it doesn't have one
+        """
+        if PROJECTED_ARRAY not in model.arrays:
+            return None
+        return cls(model.arrays[MEAN_ARRAY], model.arrays[COMPONENTS_ARRAY], model.arrays[PROJECTED_ARRAY])
+
+    def to_arrays(self):
+        """
+        Return the arrays to store in a `LabelModel` to persist the index
+        """
+        return {MEAN_ARRAY: self.mean, COMPONENTS_ARRAY: self.components, PROJECTED_ARRAY: self.projected}
+
+    def candidates(self, vecs, n_candidates, eps=0.0):
+        """
+        Shortlist the labeled vectors closest to each vector in `vecs` in the reduced space
+
+        :param vecs: Array of shape (n, d) of vectors representing segments
+        :param n_candidates: Number of labeled vectors to shortlist per vector. More candidates means better recall and
+        slower lookups
+        :param eps: Allowed relative error of the KD tree search in the reduced space, larger is faster
+        :return: Array of shape (n, n_candidates) of indices into the labeled vectors
+        """
+        n_candidates = min(n_candidates, len(self.projected))
+        projected = np.dot(np.asarray(vecs) - self.mean, self.components.T)
+        _, indices = self.tree.query(projected, k=n_candidates, eps=eps)
+        return np.asarray(indices).reshape(len(projected), n_candidates)
+
+
+def add_index(model, n_components=DEFAULT_COMPONENTS):
+    """
+    Build a `LabelIndex` over a model's labeled vectors and store it in the model's arrays
+
+    :return: `model`
+    """
+    model.arrays.update(LabelIndex.build(model.vectors, n_components).to_arrays())
+    model.checksum = model.compute_checksum()
+    return model
+
+
+if __name__ == '__main__':
+    import sys
+    from label_model import LabelModel
+
+    # add an index to an existing model file: python label_index.py path_to_model_file [n_components]
+    model_path = sys.argv[1]
+    n_components = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COMPONENTS
+    add_index(LabelModel.load(model_path), n_components).save(model_path)
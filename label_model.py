@@ -0,0 +1,203 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+The labeled vectors used for classification are packed into a single versioned model file instead of one pickle per
+label. The file starts with a small JSON header describing the model(labels, `TransformSegment` parameters, checksum and
+where each array lives in the file) followed by the arrays themselves stored contiguously, so loading a model is a
+single memory map. Processes that load the same model file share its pages
+
+File layout:
+    MAGIC | version(uint32) | header length(uint32) | JSON header | padding | arrays, each aligned to ARRAY_ALIGNMENT
+"""
+
+import os
+import json
+import struct
+import hashlib
+import cPickle as pickle
+
+import numpy as np
+
+from transform_segment import get_ink_profiles
+
+MAGIC = 'J2LMODEL'
+FORMAT_VERSION = 1
+MODEL_FILE_NAME = 'labels.model'  # name of the model file inside a labels directory
+ARRAY_ALIGNMENT = 64
+PROFILES_ARRAY = 'ink_profiles'  # name of the array holding the shape descriptors of the labeled vectors
+VECTOR_DTYPE = np.dtype('<f4')
+
+_PREAMBLE = struct.Struct('<%dsII' % len(MAGIC))
+
+
+class LabelModel(object):
+    """
+    Labeled vectors to classify segments against along with the parameters that were used to create them
+
+    :ivar labels: List of labels, labels[i] is the label of vectors[i]
+    :ivar vectors: Array of shape (len(labels), width * height), read only and memory mapped when loaded from a file
+    :ivar size: Size the labeled segments were rescaled to
+    :ivar fill_val: Value white pixels were represented with
+    :ivar arrays: Dictionary of any additional named arrays stored with the model(such as a `label_index.LabelIndex`)
+    :ivar checksum: Hex digest identifying the contents of the model
+    """
+
+    def __init__(self, labels, vectors, size, fill_val, arrays=None):
+        self.labels = list(labels)
+        self.vectors = vectors
+        self.size = tuple(size)
+        self.fill_val = fill_val
+        self.arrays = arrays if arrays is not None else {}
+        self.checksum = self.compute_checksum()
+
+    @classmethod
+    def from_dict(cls, vec_dic, size, fill_val, arrays=None):
+        """
+        Create a model from a dictionary whose keys are labels and values are the vectors that represent the labels
+        """
+        labels = sorted(vec_dic.keys())
+        vectors = np.array([vec_dic[label] for label in labels], dtype=VECTOR_DTYPE)
+        arrays = dict(arrays or {})
+        arrays.setdefault(PROFILES_ARRAY, get_ink_profiles(vectors, size))
+        return cls(labels, vectors, size, fill_val, arrays)
+
+    @classmethod
+    def from_pickle_dir(cls, path_to_dir):
+        """
+        Create a model from a directory in the legacy format: one pickled vector per label named `<label>.p` along with
+        `size.p` and `fill_val.p`
+        """
+        vec_dic = {}
+        for file_name in os.listdir(path_to_dir):
+            if file_name.endswith('.p') and file_name not in ['fill_val.p', 'size.p']:
+                vec_dic[file_name[:-2]] = _load_pickle(os.path.join(path_to_dir, file_name))
+        size = _load_pickle(os.path.join(path_to_dir, 'size.p'))
+        fill_val = _load_pickle(os.path.join(path_to_dir, 'fill_val.p'))
+        return cls.from_dict(vec_dic, size, fill_val)
+
+    @classmethod
+    def load(cls, path, verify=False):
+        """
+        Memory map a model file
+
+        :param verify: Read the whole file and check it against its stored checksum
+        """
+        with open(path, 'rb') as model_file:
+            magic, version, header_len = _PREAMBLE.unpack(model_file.read(_PREAMBLE.size))
+            if magic != MAGIC:
+                raise ValueError('%s is not a label model file' % path)
+            if version != FORMAT_VERSION:
+                raise ValueError('%s has model format version %d, expected %d' % (path, version, FORMAT_VERSION))
+            header = json.loads(model_file.read(header_len))
+
+        arrays = {}
+        for name, layout in header['arrays'].iteritems():
+            arrays[name] = np.memmap(path, dtype=np.dtype(str(layout['dtype'])), mode='r',
+                                     offset=layout['offset'], shape=tuple(layout['shape']))
+        # built by hand so that loading doesn't hash the arrays and touch every page of the file
+        model = cls.__new__(cls)
+        model.labels = [label.encode('utf-8') for label in header['labels']]
+        model.vectors = arrays.pop('vectors')
+        model.size = tuple(header['size'])
+        model.fill_val = header['fill_val']
+        model.arrays = arrays
+        model.checksum = str(header['checksum'])
+        if verify and model.compute_checksum() != model.checksum:
+            raise ValueError('%s does not match its checksum, the file is corrupt' % path)
+        return model
+
+    def save(self, path):
+        """
+        Write the model to `path` in the packed format. The model is written to a temporary file that then replaces
+        `path`, processes that have the old file memory mapped keep reading the old model
+        """
+        all_arrays = dict(self.arrays, vectors=self.vectors)
+        header = self.get_metadata()
+        header['checksum'] = self.checksum
+        header['arrays'] = {}
+
+        # offsets depend on the length of the header which depends on the offsets, so reserve room for the largest
+        # possible offsets first and pad the header out to that length
+        for name, array in all_arrays.iteritems():
+            header['arrays'][name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': 2 ** 62}
+        data_start = _align(_PREAMBLE.size + len(json.dumps(header)))
+        offset = data_start
+        for name in sorted(all_arrays):
+            header['arrays'][name]['offset'] = offset
+            offset = _align(offset + all_arrays[name].nbytes)
+        header_bytes = json.dumps(header)
+        header_bytes += ' ' * (data_start - _PREAMBLE.size - len(header_bytes))
+
+        with open(path + '.tmp', 'wb') as model_file:
+            model_file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+            model_file.write(header_bytes)
+            for name in sorted(all_arrays):
+                model_file.seek(header['arrays'][name]['offset'])
+                model_file.write(np.ascontiguousarray(all_arrays[name]).tobytes())
+        os.rename(path + '.tmp', path)
+
+    def get_metadata(self):
+        """
+        Return the JSON serializable description of the model that is stored in the model file's header
+        """
+        return {'version': FORMAT_VERSION,
+                'labels': self.labels,
+                'size': list(self.size),
+                'fill_val': self.fill_val}
+
+    def compute_checksum(self):
+        """
+        Hash the model's metadata and arrays
+        """
+        digest = hashlib.sha1(json.dumps(self.get_metadata(), sort_keys=True))
+        all_arrays = dict(self.arrays, vectors=self.vectors)
+        for name in sorted(all_arrays):
+            digest.update(name)
+            digest.update(np.ascontiguousarray(all_arrays[name]).tobytes())
+        return digest.hexdigest()
+
+    def as_dict(self):
+        """
+        Return a dictionary where the keys are labels and values are their corresponding vectors
+        """
+        return dict(zip(self.labels, self.vectors))
+
+
+def load_label_model(path, verify=False):
+    """
+    Load a model from a model file or from a labels directory. A labels directory is loaded from the model file inside
+    of it if there is one, otherwise from the legacy per label pickles
+    """
+    if os.path.isdir(path):
+        model_path = os.path.join(path, MODEL_FILE_NAME)
+        if not os.path.exists(model_path):
+            return LabelModel.from_pickle_dir(path)
+        path = model_path
+    return LabelModel.load(path, verify)
+
+
+def convert_pickle_dir(path_to_dir, model_path=None):
+    """
+    Convert a labels directory in the legacy per label pickle format into a packed model file
+
+    :param model_path: Where to write the model file, defaults to `MODEL_FILE_NAME` inside of `path_to_dir`
+    :return: Path of the model file
+    """
+    if model_path is None:
+        model_path = os.path.join(path_to_dir, MODEL_FILE_NAME)
+    LabelModel.from_pickle_dir(path_to_dir).save(model_path)
+    return model_path
+
+
+def _load_pickle(path):
+    with open(path, 'rb') as obj_file:
+        return pickle.load(obj_file)
+
+
+def _align(offset):
+    return (offset + ARRAY_ALIGNMENT - 1) // ARRAY_ALIGNMENT * ARRAY_ALIGNMENT
+
+
+if __name__ == '__main__':
+    import sys
+    print convert_pickle_dir(*sys.argv[1:])
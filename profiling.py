@@ -0,0 +1,92 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Instrumentation of the conversion pipeline. Each stage of converting an image(decode, segment, rescale, classify,
+layout and the cache lookups) reports the wall time it took along with counts such as the number of segments or pixels
+it handled. Measurements go to the hooks registered with `add_hook`, which see every conversion in the process, and to
+a `PipelineStats` object passed to a single conversion:
+
+    stats = PipelineStats()
+    image_to_latex('path_to_image', stats=stats)
+    print stats
+
+With no hooks registered and no stats object a stage only costs a couple of attribute lookups, the clock isn't read
+"""
+
+import time
+
+_hooks = []  # functions called as hook(stage, seconds, counts) for every stage of every conversion
+
+
+def add_hook(hook):
+    """
+    Register `hook` to be called as hook(stage, seconds, counts) after each stage of every conversion in the process,
+    where `counts` is a dict such as {'segments': 12}. Hooks are called in the thread doing the conversion
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    _hooks.remove(hook)
+
+
+class PipelineStats(object):
+    """
+    Totals of the measurements of one or more conversions
+    """
+
+    def __init__(self):
+        self.timings = {}  # stage -> total seconds
+        self.calls = {}  # stage -> number of times the stage ran
+        self.counts = {}  # name -> total, e.g. 'segments', 'pixels', 'glyph_cache_hits'
+
+    def record(self, stage, seconds, counts):
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        for name, count in counts.iteritems():
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    def as_dict(self):
+        return {'timings': dict(self.timings), 'calls': dict(self.calls), 'counts': dict(self.counts)}
+
+    def __str__(self):
+        lines = ['%s: %.6fs (%d calls)' % (stage, self.timings[stage], self.calls[stage])
+                 for stage in sorted(self.timings)]
+        lines += ['%s: %d' % (name, self.counts[name]) for name in sorted(self.counts)]
+        return '\n'.join(lines) + '\n'
+
+
+class Profiler(object):
+    """
+    Measures the stages of one conversion and passes the measurements on to the registered hooks and an optional
+    `PipelineStats`. The hooks are looked up when the profiler is created
+
+        start = profiler.clock()
+        segments = segmenter.segment_image()
+        profiler.record('segment', start, segments=len(segments))
+    """
+
+    __slots__ = ('stats', 'hooks', 'enabled')
+
+    def __init__(self, stats=None):
+        self.stats = stats
+        self.hooks = tuple(_hooks)
+        self.enabled = stats is not None or bool(self.hooks)
+
+    def clock(self):
+        """
+        Return the start time of a stage, 0 when disabled
+        """
+        return time.time() if self.enabled else 0
+
+    def record(self, stage, start, **counts):
+        """
+        Report that `stage` started at `start`(from `clock`) and just finished
+        """
+        if not self.enabled:
+            return
+        seconds = time.time() - start
+        if self.stats is not None:
+            self.stats.record(stage, seconds, counts)
+        for hook in self.hooks:
+            hook(stage, seconds, counts)
@@ -0,0 +1,151 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Cache of the latex deduced for whole images so that converting an image that was already converted doesn't go through
+segmentation, classification and layout again. Results are keyed by a hash of the image's decoded pixels(so the same
+screenshot saved twice or under another name is still a hit), the parameters it was segmented with and the checksum of
+the model used to classify it(so results from an old model are never returned after the model changes)
+
+There are two tiers: a least recently used dictionary in memory and optionally a single sqlite file on disk, which
+persists between runs and can be shared by several processes. Both tiers evict their least recently used results once
+they are full. The total size of the results on disk is kept in the sqlite file next to them so that every process
+sharing it sees the same total without summing the table on every write
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+from segment_img import DEFAULT_SEGMENTATION
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+
+class ResultCache(object):
+    """
+    Two tier cache mapping (image pixels, segmentation parameters, model checksum) to the latex of the image
+    """
+
+    def __init__(self, path=None, memory_entries=DEFAULT_MEMORY_ENTRIES, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        """
+        :param path: sqlite file for the on disk tier, None to only cache in memory
+        :param memory_entries: Maximum number of results kept in memory
+        :param max_disk_bytes: Maximum total size of the results kept on disk
+        """
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS results '
+                             '(key TEXT PRIMARY KEY, latex TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS disk_usage (bytes INTEGER NOT NULL)')
+            # files written before the total was kept start from the sum of their results
+            self._db.execute('INSERT INTO disk_usage SELECT COALESCE(SUM(size), 0) FROM results '
+                             'WHERE NOT EXISTS (SELECT * FROM disk_usage)')
+            self._db.commit()
+
+    @staticmethod
+    def key(img, model_checksum, segmentation=DEFAULT_SEGMENTATION):
+        """
+        Return the cache key of a decoded PIL image classified against the model with checksum `model_checksum`
+
+        :param segmentation: (min_pixels, threshold, target_glyph_height) the image is segmented with, see
+        `segment_img.DEFAULT_SEGMENTATION`
+        """
+        digest = ResultCache.digest(img, model_checksum, segmentation)
+        digest.update(img.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def digest(img, model_checksum, segmentation=DEFAULT_SEGMENTATION):
+        """
+        Return the sha1 object the cache key of a PIL image is computed with, before any pixels are fed to it. Feeding
+        it the bytes of the rows of the image in order and taking its hexdigest gives the same key as `key` without the
+        whole image ever being decoded at once, `img` doesn't need to be loaded
+        """
+        min_pixels, threshold, target_glyph_height = segmentation
+        return hashlib.sha1('%s %d %d %s %s %dx%d ' % (model_checksum, min_pixels, threshold, target_glyph_height,
+                                                       img.mode, img.size[0], img.size[1]))
+
+    def get(self, key):
+        """
+        Return the cached latex for `key` or None if it isn't cached
+        """
+        with self._lock:
+            latex = self._memory.pop(key, None)
+            if latex is not None:
+                self._memory[key] = latex  # reinsert as the most recently used
+                self.memory_hits += 1
+                return latex
+
+            if self._db is not None:
+                row = self._db.execute('SELECT latex FROM results WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    latex = row[0].encode('utf-8')
+                    self._db.execute('UPDATE results SET used = ? WHERE key = ?', (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, latex)
+                    self.disk_hits += 1
+                    return latex
+
+            self.misses += 1
+            return None
+
+    def put(self, key, latex):
+        with self._lock:
+            self._remember(key, latex)
+            if self._db is not None:
+                size = len(key) + len(latex)
+                # the first statement starts the transaction, so the total can't change under the result being replaced
+                self._db.execute('UPDATE disk_usage SET bytes = bytes + ? - '
+                                 'COALESCE((SELECT size FROM results WHERE key = ?), 0)', (size, key))
+                self._db.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                                 (key, latex.decode('utf-8'), size, time.time()))
+                self._evict_from_disk()
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.execute('UPDATE disk_usage SET bytes = 0')
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key, latex):
+        self._memory.pop(key, None)
+        self._memory[key] = latex
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_from_disk(self):
+        total = self._db.execute('SELECT bytes FROM disk_usage').fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        # drop the least recently used results until the rest fit
+        to_free = total - self.max_disk_bytes
+        freed = 0
+        evicted = []
+        for key, size in self._db.execute('SELECT key, size FROM results ORDER BY used'):
+            evicted.append((key,))
+            freed += size
+            if freed >= to_free:
+                break
+        self._db.executemany('DELETE FROM results WHERE key = ?', evicted)
+        self._db.execute('UPDATE disk_usage SET bytes = bytes - ?', (freed,))
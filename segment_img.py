@@ -7,52 +7,93 @@ groups of pixels is considered a segment. This module identifies the individual
 an image (but does not know their classification)
 """
 
-import sys
+import re
 
+import numpy as np
 from PIL import Image
-from numpy import ones
+from scipy import ndimage
+
+from budget import BUDGET_CHECK_INTERVAL
+
+# pixels are connected to the pixels directly above, below, left and right of them (no diagonals)
+CONNECTIVITY = ndimage.generate_binary_structure(2, 1)
+
+WHITE = 255  # value of a fully white/opaque colour channel
+
+DEFAULT_STRIP_HEIGHT = 256  # rows per strip of `iter_segments_in_strips`
+POOL_TASKS = 16  # number of tasks the blocks of an image are split into when segmenting over a pool
+
+# suggested `target_glyph_height` of `ImageSegmenter.segment_image`: images whose glyphs are at least twice this tall
+# are downsampled towards it before segmentation, the labeled images are rescaled to 50x50 so little a classification
+# depends on is lost
+TARGET_GLYPH_HEIGHT = 96
+ESTIMATE_SIDE = 512  # longest side of the pooled mask glyph heights are estimated from
+
+# parameters segments depend on: (min_pixels, threshold, target_glyph_height), see `ImageSegmenter.segment_image`.
+# These are the defaults of `ImageSegmenter` and of `segment_image_in_strips`, which give the same segments
+DEFAULT_SEGMENTATION = (30, WHITE, None)
 
 
 class Segment(object):
     """
     Represents a single segment that is segmented from an image. A segment is a group of pixels all located next to each
     other and can represent anything: A digit(0-9), operator(addition, subtraction, etc), letter(a-Z), etc.
+
+    The pixels are stored as a boolean bitmap cropped to the rectangle enclosing the segment along with the coordinate
+    of the bitmap's upper left corner in the original image, which is far more compact than a list of coordinates
     """
 
-    def __init__(self, pixels):
-        self.pix = pixels
+    __slots__ = ('bitmap', 'classification', 'distance', 'centroid', 'upper_left', 'lower_right', 'dimensions')
+
+    def __init__(self, bitmap, upper_left=(0, 0)):
+        """
+        :param bitmap: Two dimensional boolean array cropped to the segment where True marks a pixel of the segment
+        :param upper_left: (x, y) coordinate of the upper left corner of `bitmap` in the image the segment is from
+        """
+        self.bitmap = bitmap
         self.classification = None  # won't get classified until later, we dont know what the pixels represent right now
-        self.describe_pixels()
+        self.distance = None  # euclidean distance to the labeled vector the segment is classified as
+        self.describe_pixels(upper_left)
 
-    def describe_pixels(self):
+    @classmethod
+    def from_pixels(cls, pixels):
+        """
+        Create a segment from a list of (x, y) coordinates
+        """
+        xy = np.asarray(pixels)
+        x_min, y_min = xy.min(axis=0)
+        x_max, y_max = xy.max(axis=0)
+        bitmap = np.zeros((y_max - y_min + 1, x_max - x_min + 1), dtype=bool)
+        bitmap[xy[:, 1] - y_min, xy[:, 0] - x_min] = True
+        return cls(bitmap, (int(x_min), int(y_min)))
+
+    def describe_pixels(self, upper_left):
         """
         Extract information describing the group of pixels and store the info in attributes
         """
-        x_min, y_min = self.pix[0][0], self.pix[0][1]  # just to initialize to a known value
-        x_max, y_max = 0, 0
-        for xy in self.pix:
-            if xy[0] < x_min:
-                x_min = xy[0]
-            if xy[0] > x_max:
-                x_max = xy[0]
-            if xy[1] < y_min:
-                y_min = xy[1]
-            if xy[1] > y_max:
-                y_max = xy[1]
+        x_min, y_min = upper_left
+        x_max, y_max = x_min + self.bitmap.shape[1] - 1, y_min + self.bitmap.shape[0] - 1
 
         self.centroid = ((x_min + x_max) / 2.0), ((y_min + y_max) / 2.0)  # close enough to real centroid
         self.upper_left = (x_min, y_min)  # upper left most coordinate of the rectangle enclosing the segment
         self.lower_right = (x_max, y_max)  # lower right most coordinate of the rectangle enclosing the segment
         self.dimensions = (x_max - x_min, y_max - y_min)
 
+    @property
+    def pix(self):
+        """
+        List of (x, y) coordinates of the pixels that make up the segment
+        """
+        ys, xs = np.nonzero(self.bitmap)
+        return zip((xs + self.upper_left[0]).tolist(), (ys + self.upper_left[1]).tolist())
+
     def show_segment(self):
         """
         Create and show an image of the segment
         """
         im_size = (self.lower_right[0] + 1, self.lower_right[1] + 1)
         im = Image.new('RGBA', im_size)
-        for xy in self.pix:
-            im.putpixel(xy, (0, 255, 255, 255))
+        im.paste((0, 255, 255, 255), self.upper_left, Image.fromarray(self.bitmap.astype(np.uint8) * WHITE))
         im.show()
 
     def __str__(self):
@@ -68,79 +109,428 @@ class ImageSegmenter(object):
     Class that segments the characters/symbols/numbers/etc in an image into individual `Segment` objects
     """
 
-    def __init__(self, img):
-        if type(img) is str:
-            self.img = Image.open(img)
+    def __init__(self, img, threshold=WHITE):
+        """
+        :param img: Path to an image, a PIL image of any mode or an already binarized ink mask(two dimensional boolean
+        array where True marks a non-white pixel)
+        :param threshold: Passed to `binarize`, ignored if `img` is already an ink mask
+        """
+        self.scale = 1  # factor the latest `segment_image` downsampled `ink_mask` by before segmenting it
+        if isinstance(img, np.ndarray):
+            self.ink_mask = img.astype(bool, copy=False)
+        elif type(img) is str:
+            with Image.open(img) as opened:
+                self.ink_mask = binarize(opened, threshold)
         else:
-            self.img = img
-
-        # pixels that are yet to be checked if they are part of a segment
-        self.pixels_to_scan = ones((self.img.size[1], self.img.size[0]))
-        self.rgba_matrix = self.get_rgba_matrix()
+            self.ink_mask = binarize(img, threshold)
 
-    def segment_image(self, min_pixels=30):
+    def segment_image(self, min_pixels=30, pool=None, budget=None, target_glyph_height=None):
         """
         Search for groups of non-white pixels that are directly connected(next to one another)
 
-        :param min_pixels: Minimum number of pixels that constitute a segment
-        :return: List of `Segment` objects
+        :param min_pixels: Minimum number of pixels that constitute a segment, counted at the resolution of the image
+        :param pool: `multiprocessing.Pool`(or anything else with a `map` method) to segment the blocks found by
+        `find_blocks` in parallel. The segments are the same and in the same order as without a pool
+        :param budget: `budget.Budget` whose pixel, segment and time limits to check
+        :param target_glyph_height: Opt in to downsampling high dpi images: passed to `resolution_scale` to pick the
+        factor to downsample `ink_mask` by before segmenting, e.g. `TARGET_GLYPH_HEIGHT`. By default images are
+        segmented at full resolution. `ink_mask` itself is left as it is
+        :return: List of `Segment` objects. When the image was downsampled their coordinates and bitmaps are in the
+        pixels of the downsampled mask, multiply them by `scale` to get back to the pixels of the image
         """
-        # segmentation algo is recursive and will call itself as many times as there are pixels in the largest segment
-        sys.setrecursionlimit(15000)
+        if budget is not None:
+            budget.check_pixels(self.ink_mask.size, 'segment')
+        self.scale = resolution_scale(self.ink_mask, target_glyph_height) if target_glyph_height is not None else 1
+        mask, ink_counts = self.ink_mask, None
+        if self.scale > 1:
+            ink_counts = count_ink(self.ink_mask, self.scale)
+            mask = ink_counts > 0
+        if pool is None:
+            groups = label_components(mask, min_pixels, budget, ink_counts)
+        else:
+            groups = label_blocks(mask, find_blocks(mask), min_pixels, pool, ink_counts)
+            if budget is not None:
+                budget.check_segments(len(groups))
         segments = []
-        for y in xrange(self.img.size[1]):
-            for x in xrange(self.img.size[0]):
-                if self.pixels_to_scan[y][x] == 1:
-                    pixel_group = self.scan_pixel((x, y), [])
-                    if len(pixel_group) > min_pixels:
-                        segments.append(Segment(pixel_group))
+        for bitmap, upper_left in groups:
+            segments.append(Segment(bitmap, upper_left))
         return segments
 
-    def scan_pixel(self, xy, segment):
-        """
-        Recursively search for non-white pixels surrounding `xy` and add them to `segment` until there are only white
-        pixels surrounding all the non-white pixels that make up `segment`
-        """
-        self.pixels_to_scan[xy[1]][xy[0]] = 0
-        if xy not in segment and self.is_not_white(xy):
-            segment.append(xy)
-            surrounding = self.get_surrounding_pixels(xy)
-            for pix in surrounding:
-                if self.pixels_to_scan[pix[1]][pix[0]] != 0:
-                    self.scan_pixel(pix, segment)
-        return segment
-
     def get_surrounding_pixels(self, xy):
         """
         Return list of pixels surrounding xy, usually 4 unless at a border
         """
         x, y = xy[0], xy[1]
+        height, width = self.ink_mask.shape
         surrounding = [(x, y - 1),
                        (x - 1, y), (x + 1, y),
                        (x, y + 1)]
-        out_of_bounds = lambda xy: xy[0] < 0 or xy[1] < 0 or xy[0] >= self.img.size[0] or xy[1] >= self.img.size[1]
+        out_of_bounds = lambda xy: xy[0] < 0 or xy[1] < 0 or xy[0] >= width or xy[1] >= height
         return [xy for xy in surrounding if not out_of_bounds(xy)]
 
-    def get_rgba_matrix(self):
-        """
-        Return a two dimensional list in the same shape as the image. The zeroeth index contains the list of RGBA
-        values of all the pixels in the zeroeth row
-
-        rgba_matrix[5][1] contains a tuple for the rgba values of the pixel in the coordinate (1, 5)
-        """
-        width, height = self.img.size[0], self.img.size[1]
-        pixels = list(self.img.getdata())
-        pixel_matrix = []
-        for row in xrange(height):
-            pixel_matrix.append(pixels[row * width:(row + 1) * width])
-        return pixel_matrix
-
     def is_not_white(self, xy):
         """
         Check if a pixel is non white
         """
-        if self.rgba_matrix[xy[1]][xy[0]] != (255, 255, 255, 255):
-            return True
-        return False
+        return bool(self.ink_mask[xy[1], xy[0]])
+
+
+def binarize(img, threshold=WHITE):
+    """
+    Reduce an image of any mode to a boolean ink mask with one entry per pixel
+
+    A pixel is ink when its darkest colour channel is below `threshold` or when it is not fully opaque. With the default
+    threshold only pure opaque white counts as background, lower thresholds let near white noise(JPEG artifacts,
+    anti-aliased paper backgrounds) count as background too. The image is read one band at a time so no more than one
+    byte per pixel is held on top of the mask itself
+
+    :param img: PIL image
+    :param threshold: Colour channel value(0-255) at or above which a channel is considered white
+    :return: Two dimensional boolean array in the same shape as the image where non-white pixels are True
+    """
+    if img.mode not in ('1', 'L', 'LA', 'RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    elif img.mode == '1':
+        img = img.convert('L')
+
+    mask = np.zeros((img.size[1], img.size[0]), dtype=bool)
+    for band in img.getbands():
+        channel = np.asarray(img.getchannel(band))
+        if band == 'A':
+            mask |= channel != WHITE
+        else:
+            mask |= channel < threshold
+    return mask
+
+
+def resolution_scale(mask, target_glyph_height=TARGET_GLYPH_HEIGHT):
+    """
+    Pick the whole factor to downsample an ink mask by before segmenting it, so high dpi images are segmented at
+    roughly the cost of normal resolution ones. Images whose glyphs are less than twice `target_glyph_height` tall are
+    left alone
+
+    Layout only compares the positions and sizes of the segments of an image with each other so it works the same on
+    downsampled coordinates
+
+    :return: Factor to pass to `count_ink`, 1 to segment at full resolution
+    """
+    if mask.shape[0] < 2 * target_glyph_height:
+        return 1  # no glyph is taller than the image, there is no need to label the mask to estimate their height
+    factor = int(estimate_glyph_height(mask) // target_glyph_height)
+    return factor if factor >= 2 else 1
+
+
+def estimate_glyph_height(mask):
+    """
+    Estimate the typical height of the glyphs in an ink mask as the median height of its groups of pixels, weighted by
+    the number of pixels in each group so specks of noise barely count. The groups are found in a copy of the mask
+    downsampled to at most `ESTIMATE_SIDE` pixels a side, so the estimate costs about the same no matter the size of the
+    image and is only accurate to within the downsampling factor
+
+    :return: Estimated height in pixels of `mask`, 0 if there is no ink
+    """
+    factor = max(-(-max(mask.shape) // ESTIMATE_SIDE), 1)
+    labels, num_labels = ndimage.label(downsample_mask(mask, factor), structure=CONNECTIVITY)
+    if num_labels == 0:
+        return 0
+    heights = np.array([y_slice.stop - y_slice.start for y_slice, _ in ndimage.find_objects(labels)])
+    order = np.argsort(heights, kind='mergesort')
+    cumulative_pixels = np.cumsum(np.bincount(labels.ravel())[1:][order])
+    return int(heights[order[np.searchsorted(cumulative_pixels, cumulative_pixels[-1] / 2.0)]]) * factor
+
+
+def downsample_mask(mask, factor):
+    """
+    Shrink a boolean mask by a whole `factor` along each side, a pixel of the result is True if any of the `factor` by
+    `factor` pixels it covers is. The right and bottom edges are padded with False to a multiple of `factor`
+    """
+    if factor == 1:
+        return mask
+    height, width = -(-mask.shape[0] // factor), -(-mask.shape[1] // factor)
+    padded = np.zeros((height * factor, width * factor), dtype=bool)
+    padded[:mask.shape[0], :mask.shape[1]] = mask
+    return padded.reshape(height, factor, width, factor).any(axis=3).any(axis=1)
+
+
+def count_ink(mask, factor):
+    """
+    Downsample a boolean mask by a whole `factor` along each side, counting the True pixels each pixel of the result
+    covers. The counts are above 0 wherever `downsample_mask` is True
+
+    :return: Array of integer counts
+    """
+    height, width = -(-mask.shape[0] // factor), -(-mask.shape[1] // factor)
+    padded = np.zeros((height * factor, width * factor), dtype=np.uint8)
+    padded[:mask.shape[0], :mask.shape[1]] = mask
+    return padded.reshape(height, factor, width, factor).sum(axis=3, dtype=np.int32).sum(axis=1)
+
+
+def label_components(mask, min_pixels=30, budget=None, pixel_weights=None):
+    """
+    Find the groups of True pixels in `mask` that are directly connected(next to one another)
 
+    Labelling is done with a two pass union-find over the whole mask instead of flood filling pixel by pixel, so the
+    cost is linear in the size of the image and does not depend on the size of the largest group. Groups are returned in
+    the order their first pixel is found when scanning the mask row by row, left to right
 
+    :param mask: Two dimensional boolean array where True marks a pixel that can be part of a segment
+    :param min_pixels: Groups must contain more than this many pixels to be returned
+    :param budget: `budget.Budget` whose segment and time limits to check
+    :param pixel_weights: Array in the shape of `mask` of the number of pixels of the image each pixel of a
+    downsampled `mask` stands for, see `count_ink`. `min_pixels` is compared to the summed weights of each group
+    :return: List of (bitmap, upper_left) tuples, one per group. `bitmap` is a boolean array cropped to the rectangle
+    enclosing the group and `upper_left` is the (x, y) coordinate of that rectangle's upper left corner in `mask`
+    """
+    labels, num_labels = ndimage.label(mask, structure=CONNECTIVITY)
+    if num_labels == 0:
+        return []
+
+    pixel_counts = np.bincount(labels.ravel(), weights=None if pixel_weights is None else pixel_weights.ravel())
+    if budget is not None:
+        budget.check_segments(int(np.count_nonzero(pixel_counts[1:] > min_pixels)))
+        budget.check_time('segment')
+    groups = []
+    for label, (y_slice, x_slice) in enumerate(ndimage.find_objects(labels), 1):
+        if pixel_counts[label] <= min_pixels:
+            continue
+        if budget is not None and len(groups) % BUDGET_CHECK_INTERVAL == 0:
+            budget.check_time('segment')
+        groups.append((labels[y_slice, x_slice] == label, (int(x_slice.start), int(y_slice.start))))
+    return groups
+
+
+def find_blocks(mask):
+    """
+    Cut `mask` into blocks along fully blank rows and columns using its projection profiles: first into bands of rows
+    separated by blank rows(separate lines, stacked equations), then each band into blocks separated by blank
+    columns(terms). Pixels are only connected to their four direct neighbours so no group of pixels crosses a blank row
+    or column, every group lies entirely within one block
+
+    :return: List of (y_slice, x_slice) tuples bounding the ink of each block, row by row then left to right
+    """
+    blocks = []
+    for y_start, y_stop in _runs(mask.any(axis=1)):
+        for x_start, x_stop in _runs(mask[y_start:y_stop].any(axis=0)):
+            blocks.append((slice(y_start, y_stop), slice(x_start, x_stop)))
+    return blocks
+
+
+def label_blocks(mask, blocks, min_pixels, pool, pixel_weights=None):
+    """
+    Same as `label_components` but labels each of the `blocks` of `mask` separately over `pool`
+
+    :param blocks: List of (y_slice, x_slice) tuples from `find_blocks`
+    :return: List of (bitmap, upper_left) tuples in the same order as `label_components`
+    """
+    tasks = [(mask[y_slice, x_slice], (x_slice.start, y_slice.start), min_pixels,
+              None if pixel_weights is None else pixel_weights[y_slice, x_slice]) for y_slice, x_slice in blocks]
+    groups = [group for block_groups in pool.map(_label_block, tasks, max(len(tasks) // POOL_TASKS, 1))
+              for group in block_groups]
+    # the first pixel of a group is the first True pixel in the top row of its bitmap
+    groups.sort(key=lambda group: (group[1][1], group[1][0] + int(group[0][0].argmax())))
+    return groups
+
+
+def _label_block(task):
+    block, (x, y), min_pixels, pixel_weights = task
+    return [(bitmap, (x + x_offset, y + y_offset))
+            for bitmap, (x_offset, y_offset) in label_components(block, min_pixels, pixel_weights=pixel_weights)]
+
+
+def _runs(flags):
+    """
+    Return the (start, stop) indices of each run of True values in the one dimensional boolean array `flags`
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flags.view(np.int8), [0]))))
+    return zip(edges[::2].tolist(), edges[1::2].tolist())
+
+
+def segment_image_in_strips(img, strip_height=DEFAULT_STRIP_HEIGHT, min_pixels=30, threshold=WHITE, budget=None,
+                            on_strip=None):
+    """
+    Same as `ImageSegmenter.segment_image` at full resolution, but decodes, binarizes and labels the image strip by
+    strip with `iter_segments_in_strips` so the whole page is never held in memory at once
+
+    :return: List of `Segment` objects in the same order as `ImageSegmenter.segment_image`
+    """
+    segments = list(iter_segments_in_strips(img, strip_height, min_pixels, threshold, budget, on_strip))
+    # the first pixel of a segment is the first True pixel in the top row of its bitmap
+    segments.sort(key=lambda segment: (segment.upper_left[1], segment.upper_left[0] + int(segment.bitmap[0].argmax())))
+    return segments
+
+
+def iter_segments_in_strips(img, strip_height=DEFAULT_STRIP_HEIGHT, min_pixels=30, threshold=WHITE, budget=None,
+                            on_strip=None):
+    """
+    Segment an image strip by strip, yielding each `Segment` as soon as it is complete
+
+    Each horizontal strip of `strip_height` rows is decoded by `iter_image_strips`, binarized and labelled on its own.
+    Groups touching the bottom of a strip are kept open and joined with the groups of the next strip that they touch
+    across the boundary, a group is complete once it no longer reaches the bottom of the latest strip. The ink mask and
+    labels only ever exist for one strip at a time, so memory use depends on the strip height and the open groups
+    rather than on the size of the page. Yields the same segments as `ImageSegmenter.segment_image` at full resolution
+    but in the order they complete
+
+    :param img: Path to an image or a PIL image of any mode, preferably not loaded yet so it can be decoded strip by
+    strip
+    :param strip_height: Number of rows to decode, binarize and label at a time
+    :param min_pixels: Minimum number of pixels that constitute a segment
+    :param threshold: Passed to `binarize`
+    :param budget: `budget.Budget` whose segment and time limits to check
+    :param on_strip: Function called with each decoded strip, a PIL image, before it is segmented
+    """
+    if type(img) is str:
+        with Image.open(img) as opened:
+            for segment in iter_segments_in_strips(opened, strip_height, min_pixels, threshold, budget, on_strip):
+                yield segment
+        return
+
+    width, height = img.size
+    open_groups = {}  # group id -> [pixel count, list of (bitmap, upper_left) pieces]
+    prev_bottom = None  # group id of each pixel in the bottom row of the previous strip, -1 for background
+    next_id = 0
+    n_segments = 0
+    for top, strip in zip(xrange(0, height, strip_height), iter_image_strips(img, strip_height)):
+        if budget is not None:
+            budget.check_time('segment')
+        if on_strip is not None:
+            on_strip(strip)
+        mask = binarize(strip, threshold)
+        del strip
+        labels, num_labels = ndimage.label(mask, structure=CONNECTIVITY)
+        pixel_counts = np.bincount(labels.ravel(), minlength=num_labels + 1)
+
+        # strip labels 1..num_labels become group ids next_id..next_id + num_labels - 1
+        groups = dict(open_groups)
+        for label, (y_slice, x_slice) in enumerate(ndimage.find_objects(labels), 1):
+            piece = (labels[y_slice, x_slice] == label, (int(x_slice.start), top + int(y_slice.start)))
+            groups[next_id + label - 1] = [int(pixel_counts[label]), [piece]]
+
+        # union the groups that touch across the boundary with the previous strip
+        parent = {}
+
+        def find(group_id):
+            while parent.get(group_id, group_id) != group_id:
+                group_id = parent[group_id]
+            return group_id
+
+        if prev_bottom is not None:
+            touching = (prev_bottom >= 0) & (labels[0] > 0)
+            for above, below in set(zip(prev_bottom[touching].tolist(), (labels[0][touching] + next_id - 1).tolist())):
+                above, below = find(above), find(below)
+                if above != below:
+                    parent[below] = above
+        for group_id in parent:
+            root = find(group_id)
+            if group_id != root:
+                merged = groups.pop(group_id)
+                groups[root][0] += merged[0]
+                groups[root][1].extend(merged[1])
+
+        bottom = np.where(labels[-1] > 0, labels[-1] + next_id - 1, -1)
+        prev_bottom = np.array([find(group_id) if group_id >= 0 else -1 for group_id in bottom.tolist()])
+        still_open = set(prev_bottom.tolist()) if top + strip_height < height else set()
+        next_id += num_labels
+
+        open_groups = {}
+        for group_id in sorted(groups, key=lambda group_id: _first_piece_order(groups[group_id][1])):
+            if group_id in still_open:
+                open_groups[group_id] = groups[group_id]
+            elif groups[group_id][0] > min_pixels:
+                n_segments += 1
+                if budget is not None:
+                    budget.check_segments(n_segments)
+                yield Segment(*_join_pieces(groups[group_id][1]))
+
+
+def iter_image_strips(img, strip_height=DEFAULT_STRIP_HEIGHT):
+    """
+    Yield the horizontal strips of `strip_height` rows of a PIL image from top to bottom
+
+    An image that isn't loaded yet and whose file stores its rows uncompressed in one block(BMP, PPM/PGM/PBM,
+    uncompressed TIFF) is read from the file one strip at a time, so the whole image is never decoded into memory. Any
+    other image(PNG and JPEG are compressed as a single stream that can't be resumed part way) is decoded whole once
+    and cropped
+    """
+    width, height = img.size
+    layout = _raw_layout(img)
+    for top in xrange(0, height, strip_height):
+        bottom = min(top + strip_height, height)
+        if layout is None:
+            yield img.crop((0, top, width, bottom))
+            continue
+        offset, rawmode, stride, ystep = layout
+        first_row = top if ystep > 0 else height - bottom  # bottom up files(BMP) store the last row first
+        img.fp.seek(offset + first_row * stride)
+        data = img.fp.read((bottom - top) * stride)
+        yield Image.frombytes(img.mode, (width, bottom - top), data, 'raw', rawmode, stride, ystep)
+
+
+def _raw_layout(img):
+    """
+    Return (offset, rawmode, stride, ystep) of the rows of an image that isn't loaded yet and is stored as one
+    uncompressed block in its file, or None if it isn't
+    """
+    tiles = getattr(img, 'tile', None)
+    if not tiles or len(tiles) != 1 or img.mode in ('P', 'PA') or getattr(img, 'fp', None) is None:
+        return None
+    decoder, extents, offset, args = tiles[0]
+    if decoder != 'raw' or tuple(extents) != (0, 0) + img.size:
+        return None
+    if not isinstance(args, tuple):
+        args = (args,)
+    rawmode = args[0]
+    stride = args[1] if len(args) > 1 else 0  # 0 for rows packed without padding
+    ystep = args[2] if len(args) > 2 else 1
+    if stride == 0:
+        stride = _packed_row_size(rawmode, img.size[0])
+    if stride is None or stride < 0 or ystep not in (1, -1):
+        return None
+    return offset, rawmode, stride, ystep
+
+
+def _packed_row_size(rawmode, width):
+    """
+    Return the number of bytes a row of `width` pixels of `rawmode` takes, or None if the bits per pixel of `rawmode`
+    aren't known
+    """
+    base, _, suffix = rawmode.partition(';')
+    depth = re.match(r'\d*', suffix).group()
+    if base == '1':
+        bits = 1  # '1;I' and '1;R' are inverted and reversed bits
+    elif depth and len(base) == 1:
+        bits = int(depth)  # one band of the given depth, e.g. 'L;16', 'I;16B', 'F;32F'
+    elif suffix:
+        return None  # packed bands or a variant of the bytes, e.g. 'RGB;15', 'L;I'(inverted)
+    elif base in ('I', 'F'):
+        bits = 32
+    elif base.isalpha() and base.isupper():
+        bits = 8 * len(base)  # a byte per band, e.g. 'L', 'LA', 'BGR', 'RGBX', 'CMYK'
+    else:
+        return None
+    return (bits * width + 7) // 8
+
+
+def _first_piece_order(pieces):
+    """
+    Row by row, left to right order of the upper left corners of the earliest of `pieces`
+    """
+    return min((upper_left[1], upper_left[0]) for _, upper_left in pieces)
+
+
+def _join_pieces(pieces):
+    """
+    Join the (bitmap, upper_left) pieces of a group labelled in different strips into one bitmap
+
+    :return: (bitmap, upper_left)
+    """
+    if len(pieces) == 1:
+        return pieces[0]
+    x_min = min(upper_left[0] for _, upper_left in pieces)
+    y_min = min(upper_left[1] for _, upper_left in pieces)
+    x_max = max(upper_left[0] + bitmap.shape[1] for bitmap, upper_left in pieces)
+    y_max = max(upper_left[1] + bitmap.shape[0] for bitmap, upper_left in pieces)
+    joined = np.zeros((y_max - y_min, x_max - x_min), dtype=bool)
+    for bitmap, (x, y) in pieces:
+        joined[y - y_min:y - y_min + bitmap.shape[0], x - x_min:x - x_min + bitmap.shape[1]] |= bitmap
+    return joined, (x_min, y_min)
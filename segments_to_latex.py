@@ -5,6 +5,19 @@ Given a list of characters such as (5, 3, division_sign) and their corresponding
 deduce what latex source code would generate such characters in those positions
 """
 
+import math
+
+from budget import BudgetExceeded
+
+DEFAULT_CELL_SIZE = 32  # cell size of a `SegmentGrid` when there are no segments to base it on
+
+# special operators in the order they are resolved in, see `SegmentsToLatex.get_operators`
+SPECIAL_OPERATORS = ['division', 'radical', 'integral']
+
+# special operators nested deeper than this raise an error no matter the budget, well before python's recursion limit is
+# reached
+MAX_LAYOUT_DEPTH = 100
+
 
 class SegmentsToLatex(object):
     """
@@ -12,11 +25,16 @@ class SegmentsToLatex(object):
     relative position and size of the segments
     """
 
-    def __init__(self, segments):
+    def __init__(self, segments, budget=None):
         """
-        :param segments: List of `Segment` objects which together represent an equation/expression
+        :param segments: List of `Segment` objects which together represent an equation/expression. Neither the list
+        nor the segments are modified
+        :param budget: `budget.Budget` whose time and depth limits to check while laying out the segments
         """
         self.segs = segments
+        self.grid = SegmentGrid(segments)
+        self.budget = budget
+        self.depth = 0  # number of regions currently being laid out, the nesting depth of the current region plus one
 
     def search_region(self, upper_left, lower_right, ignore=None):
         """
@@ -27,8 +45,14 @@ class SegmentsToLatex(object):
         :param ignore: Object to ignore if found in the search region
         :return: List of segment objects whose centroid is in that region
         """
+        return self.find_in_region(self.grid, upper_left, lower_right, ignore)
+
+    def find_in_region(self, grid, upper_left, lower_right, ignore=None):
+        """
+        Same as `search_region` but searches the segments in `grid` instead of all segments
+        """
         results = []
-        for segment in self.segs:
+        for segment in grid.search(upper_left, lower_right):
             if upper_left[0] < segment.centroid[0] < lower_right[0] and \
                upper_left[1] < segment.centroid[1] < lower_right[1]:
 
@@ -56,73 +80,83 @@ class SegmentsToLatex(object):
          and the `CombinedSegments` object is returned
 
         For example a division sign will have a sub-region `top_region` above the division sign to be searched and
-        a sub-region `bottom_region` below the division sign that needs to be searched. `search_and_simplify(top_region)` is
-        called and simplifies all `Segment` objects(including special operators) in top_region into one `CombinedSegments`
-        object whose `classification` attribute contains the latex that describes all the `Segment` objects that were
-        inside of top_region. The same is done for `bottom_region`. The result is that the division sign `Segment` object
-        will now have one `CombinedSegments` object above it(combined_above) and one below it(combined_below) and we can
-        now easily combine the three into one object with the classification:
-        "/frac{combined_above.classification}{combined_below.classification}"
+        a sub-region `bottom_region` below the division sign that needs to be searched. The segments in top_region
+        (including special operators) are simplified into one `CombinedSegments` object whose `classification` attribute
+        contains the latex that describes all the `Segment` objects that were inside of top_region. The same is done for
+        `bottom_region`. The result is that the division sign `Segment` object will now have one `CombinedSegments`
+        object above it(combined_above) and one below it(combined_below) and we can now easily combine the three into
+        one object with the classification: "/frac{combined_above.classification}{combined_below.classification}"
 
         :param upper_left: Upper left coordinate of the search region
         :param lower_right: Lower right coordinate of the search region
         :param ignore: Object to ignore if found in the search region
-        :return: A `CombinedSegments` object that represents all objects found in the search region
-        """
-        to_search = self.search_region(upper_left, lower_right, ignore)
-        while self.contains_special_op(to_search):
-            if self.contains_op(to_search, 'division'):
-                division = self.get_longest_division(to_search)
-                SpecialOperators.division(self, division, upper_left, lower_right)
-            elif self.contains_op(to_search, 'radical'):
-                radical = self.get_op(to_search, 'radical')
-                SpecialOperators.radical(self, radical)
-            elif self.contains_op(to_search, 'integral'):
-                integral = self.get_op(to_search, 'integral')
-                integral.classification = '\\int'
-            else:
-                raise ValueError('you fucked up')
-            to_search = self.search_region(upper_left, lower_right, ignore)
-        return self.simplify(to_search)
-
-    def contains_special_op(self, segments):
+        :return: A `CombinedSegments` object that represents all objects found in the search region. Its `parts` form
+        the layout tree of the region
         """
-        Return true if a segment in `segments` is an operator with special behavior
-        """
-        for op in ['division', 'integral', 'radical']:
-            if self.contains_op(segments, op):
-                return True
-        return False
+        return self.build_layout(upper_left, lower_right, self.search_region(upper_left, lower_right, ignore))
 
-    def contains_op(self, segments, op_name):
+    def build_layout(self, upper_left, lower_right, segments):
         """
-        Return true if a segment in 'segments' is of classification `op_name`
+        Build the layout tree of `segments`, which all lie in the region bounded by `upper_left` and `lower_right`, and
+        simplify it into one `CombinedSegments` object
+
+        The special operators in the region are resolved in a single pass in the order given by `get_operators`. Each
+        operator claims the segments in its sub-regions that haven't been claimed by an operator before it, lays them
+        out recursively and is replaced by the combination of itself and its sub-regions. Whatever is left unclaimed
+        once every operator is resolved is simplified from left to right
+
+        :return: `CombinedSegments` object
+        :raises budget.BudgetExceeded: if the budget runs out or operators are nested too deeply
+        :raises RuntimeError: if operators are nested deeper than `MAX_LAYOUT_DEPTH` without a budget
         """
+        if self.budget is not None:
+            self.budget.check_depth(self.depth)
+        if self.depth > MAX_LAYOUT_DEPTH:
+            if self.budget is not None:
+                raise BudgetExceeded('depth', self.depth, MAX_LAYOUT_DEPTH, 'layout')
+            raise RuntimeError('special operators nested more than %d deep' % MAX_LAYOUT_DEPTH)
+        self.depth += 1
         try:
-            self.get_op(segments, op_name)
-            return True
-        except ValueError:
-            return False
+            return self._build_layout(upper_left, lower_right, segments)
+        finally:
+            self.depth -= 1
 
-    def get_op(self, segments, op):
+    def _build_layout(self, upper_left, lower_right, segments):
+        region = SegmentGrid(segments)
+        for operator in self.get_operators(segments):
+            if self.budget is not None:
+                self.budget.check_time('layout')
+            if operator not in region:  # claimed by the sub-region of an operator that was resolved before it
+                continue
+            if operator.classification == 'division':
+                combined = SpecialOperators.division(self, region, operator, upper_left, lower_right)
+            elif operator.classification == 'radical':
+                combined = SpecialOperators.radical(self, region, operator)
+            else:
+                region.replace(operator, SpecialOperators.integral(self, operator))
+                continue
+            region.remove(operator)
+            region.insert(combined)
+        return self.simplify(region.segments())
+
+    def get_operators(self, segments):
         """
-        Return first segment object of classification `op`. Method should only be called if segments is known to contain
-        that op
+        Return the special operators in `segments` in the order they should be resolved in: division signs from longest
+        to shortest(a longer division sign spans the shorter ones in its numerator and denominator), then radicals, then
+        integrals. Operators of the same kind and extent stay in the same order as in `segments`
         """
-        for seg in segments:
-            if seg.classification == op:
-                return seg
-        raise ValueError('%s not found in segments passed in' % op)
+        operators = [seg for seg in segments if seg.classification in SPECIAL_OPERATORS]
+        return sorted(operators, key=lambda seg: (SPECIAL_OPERATORS.index(seg.classification),
+                                                  -seg.dimensions[0] if seg.classification == 'division' else 0))
 
-    def get_longest_division(self, segments):
+    def claim_region(self, region, upper_left, lower_right, ignore=None):
         """
-        Return longest division sign found in segments (the one that should be simplified first)
+        Remove the segments found in a rectangular region from `region` (a `SegmentGrid`) and return them
         """
-        divisions = [seg for seg in segments if seg.classification == 'division']
-        if len(divisions) == 0:
-            return None
-        else:
-            return sorted(divisions, key=lambda seg: seg.dimensions[0], reverse=True)[0]
+        claimed = self.find_in_region(region, upper_left, lower_right, ignore)
+        for segment in claimed:
+            region.remove(segment)
+        return claimed
 
     def simplify(self, segments):
         """
@@ -146,26 +180,13 @@ class SegmentsToLatex(object):
         :param classification: classification of the combined segments
         :return: `CombinedSegments` object
         """
-
-        class CombinedSegments(object):
-            """
-            Data structure that represents a group of segments that are combined into one object under one
-            name/classification. Similar to `Segment` data structure but without attributes that aren't needed anymore
-            """
-
-            def __init__(self, classification, centroid):
-                self.classification = classification
-                self.centroid = centroid
-
-        sum_x, sum_y = 0.0, 0.0
-        for segment in segments:
-            self.segs.remove(segment)
-            sum_x += segment.centroid[0]
-            sum_y += segment.centroid[1]
-        combined_centroid = sum_x / len(segments), sum_y / len(segments)
-        combined_segment = CombinedSegments(classification, combined_centroid)
-        self.segs.append(combined_segment)
-        return combined_segment
+        centroids = [segment.centroid for segment in segments if segment.centroid is not None]
+        if centroids:
+            combined_centroid = sum(xy[0] for xy in centroids) / float(len(centroids)), \
+                sum(xy[1] for xy in centroids) / float(len(centroids))
+        else:
+            combined_centroid = None  # nothing was found in the region
+        return CombinedSegments(classification, combined_centroid, segments)
 
     def get_area(self, upper_left_coord, lower_right_coord):
         """
@@ -176,6 +197,103 @@ class SegmentsToLatex(object):
         return width * height
 
 
+class CombinedSegments(object):
+    """
+    Data structure that represents a group of segments that are combined into one object under one
+    name/classification. Similar to `Segment` data structure but without attributes that aren't needed anymore
+    """
+
+    def __init__(self, classification, centroid, parts=()):
+        """
+        :param parts: The segments/`CombinedSegments` objects that were combined into this one
+        """
+        self.classification = classification
+        self.centroid = centroid
+        self.parts = list(parts)
+
+
+class SegmentGrid(object):
+    """
+    Uniform grid that buckets segments by the position of their centroid so a region search only has to look at the
+    segments in the cells overlapping the region instead of at every segment. Segments are returned in the order they
+    were inserted so searching the grid gives the same results in the same order as scanning the list of segments
+    """
+
+    def __init__(self, segments, cell_size=None):
+        """
+        :param segments: Segments to insert, in order
+        :param cell_size: Width and height of a cell, defaults to the median size of the segments
+        """
+        if cell_size is None:
+            sizes = sorted(max(segment.dimensions) for segment in segments if hasattr(segment, 'dimensions'))
+            cell_size = max(sizes[len(sizes) // 2], 1) if sizes else DEFAULT_CELL_SIZE
+        self.cell_size = float(cell_size)
+        self.cells = {}  # (column, row) -> {segment: insertion number}
+        self.insertions = 0
+        for segment in segments:
+            self.insert(segment)
+
+    def get_cell(self, xy):
+        return int(math.floor(xy[0] / self.cell_size)), int(math.floor(xy[1] / self.cell_size))
+
+    def insert(self, segment, insertion=None):
+        if insertion is None:
+            insertion = self.insertions
+            self.insertions += 1
+        self.cells.setdefault(self.get_cell(segment.centroid), {})[segment] = insertion
+
+    def remove(self, segment):
+        """
+        Remove `segment` from the grid and return its insertion number
+        """
+        cell = self.get_cell(segment.centroid)
+        insertion = self.cells[cell].pop(segment)
+        if not self.cells[cell]:
+            del self.cells[cell]
+        return insertion
+
+    def replace(self, segment, replacement):
+        """
+        Put `replacement` in place of `segment`, keeping its position in the insertion order
+        """
+        self.insert(replacement, self.remove(segment))
+
+    def search(self, upper_left, lower_right):
+        """
+        Return the segments in all cells overlapping the region bounded by `upper_left` and `lower_right` in the order
+        they were inserted. This can include segments just outside of the region, it is up to the caller to check the
+        exact bounds
+        """
+        first_col, first_row = self.get_cell(upper_left)
+        last_col, last_row = self.get_cell(lower_right)
+        n_region_cells = (last_col - first_col + 1) * (last_row - first_row + 1)
+        if n_region_cells > len(self.cells):
+            # region is large compared to the number of occupied cells(like a search of the entire image)
+            keys = [key for key in self.cells
+                    if first_col <= key[0] <= last_col and first_row <= key[1] <= last_row]
+        else:
+            keys = [(col, row) for col in xrange(first_col, last_col + 1) for row in xrange(first_row, last_row + 1)
+                    if (col, row) in self.cells]
+        return self._in_order(keys)
+
+    def segments(self):
+        """
+        Return every segment in the grid in the order they were inserted
+        """
+        return self._in_order(self.cells.keys())
+
+    def _in_order(self, keys):
+        found = [(insertion, segment) for key in keys for segment, insertion in self.cells[key].iteritems()]
+        found.sort(key=lambda item: item[0])
+        return [segment for _, segment in found]
+
+    def __contains__(self, segment):
+        return segment in self.cells.get(self.get_cell(segment.centroid), {})
+
+    def __len__(self):
+        return sum(len(cell) for cell in self.cells.itervalues())
+
+
 class SpecialOperators(object):
     """
     The `SpecialOperators` class defines the behavior of special operators (what sub-regions to search for a given
@@ -183,17 +301,18 @@ class SpecialOperators(object):
     """
 
     @staticmethod
-    def radical(instance, operator):
+    def radical(instance, region, operator):
         """
         Just evaluate everything inside the root. TODO search for nth root
         """
         bounds = (operator.upper_left, operator.lower_right)
-        nested = instance.search_and_simplify(bounds[0], bounds[1], ignore=operator)
+        nested = instance.build_layout(bounds[0], bounds[1],
+                                       instance.claim_region(region, bounds[0], bounds[1], ignore=operator))
         latex = '\\sqrt{%s}' % nested.classification
         return instance.combine_segments([operator, nested], latex)
 
     @staticmethod
-    def division(instance, operator, upper_left, lower_right):
+    def division(instance, region, operator, upper_left, lower_right):
         """
         Search above and below the division sign
         """
@@ -202,12 +321,20 @@ class SpecialOperators(object):
 
         num_upper_left = operator.upper_left[0], upper_y_bound
         num_lower_right = operator.lower_right[0], operator.upper_left[1]
-        numerator = instance.search_and_simplify(num_upper_left, num_lower_right)
+        numerator = instance.build_layout(num_upper_left, num_lower_right,
+                                          instance.claim_region(region, num_upper_left, num_lower_right))
 
         denom_upper_left = operator.upper_left[0], operator.lower_right[1]
         denom_lower_right = operator.lower_right[0], lower_y_bound
-        denominator = instance.search_and_simplify(denom_upper_left, denom_lower_right)
+        denominator = instance.build_layout(denom_upper_left, denom_lower_right,
+                                            instance.claim_region(region, denom_upper_left, denom_lower_right))
 
         latex = '\\frac{%s}{%s}' % (numerator.classification, denominator.classification)
         return instance.combine_segments([operator, numerator, denominator], latex)
 
+    @staticmethod
+    def integral(instance, operator):
+        """
+        Integrals have no sub-regions, they only need their latex
+        """
+        return instance.combine_segments([operator], '\\int')
@@ -3,61 +3,174 @@
 """
 Compute the vector representations of labeled images/segments and serialize the vector objects so we don't needlessly
 recompute the vector representations of the labeled data since they remains the same from run to run
+
+Builds are incremental: a manifest next to the model file records the hash of every labeled image and the parameters
+the model was built with, so a rebuild only vectorizes the images that were added or changed since the last build and
+takes the vectors of the rest from the existing model. The images that do need vectorizing are spread over a pool of
+worker processes
 """
 
 import os
+import json
+import hashlib
 import logging
-import cPickle as pickle
+import multiprocessing
+
+import numpy as np
 
+from label_index import add_index
+from label_model import FORMAT_VERSION, MODEL_FILE_NAME, LabelModel
 from segment_img import ImageSegmenter
 from transform_segment import TransformSegment
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MANIFEST_FILE_NAME = 'labels.manifest'  # name of the manifest next to the model file
+MANIFEST_VERSION = 1
 
-def serialize_imgs(dir_to_serialize, dir_to_place_objs, size, fill_val):
+
+def serialize_imgs(dir_to_serialize, dir_to_place_objs, size, fill_val, index_components=None, workers=None,
+                   incremental=True):
     """
-    Vectorize all the labeled images in `dir_to_serialize` and save the vectors in the directory `dir_to_place_objs`
+    Vectorize all the labeled images in `dir_to_serialize` and save the vectors as a model file in the directory
+    `dir_to_place_objs`
 
     :param dir_to_serialize: Directory containing labeled images to serialize
-    :param dir_to_place_objs: Directory to place serialized objects into
+    :param dir_to_place_objs: Directory to place the model file into
     :param size: Resize parameter for creating vector representations
     :param fill_val: fill_val parameter for creating vector representations
+    :param index_components: Number of principal components of a `LabelIndex` to build and store with the model,
+    worthwhile for libraries with thousands of labeled images. None to not build an index
+    :param workers: Number of worker processes to vectorize with, defaults to the number of cpus
+    :param incremental: Reuse the vectors of the existing model for images that haven't changed since it was built,
+    False to vectorize every image
+    :return: Number of images that were vectorized
+    """
+    model_path = os.path.join(dir_to_place_objs, MODEL_FILE_NAME)
+    manifest_path = os.path.join(dir_to_place_objs, MANIFEST_FILE_NAME)
+    params = build_params(size, fill_val, index_components)
+
+    img_paths = find_labeled_imgs(dir_to_serialize)
+    hashes = dict((label, hash_file(img_path)) for label, img_path in img_paths.iteritems())
+    vec_dic = reuse_vectors(model_path, manifest_path, params, hashes) if incremental else {}
+    changed = sorted(label for label in img_paths if label not in vec_dic)
+    if not changed and incremental and len(vec_dic) == len(load_manifest(manifest_path)['sources']):
+        logger.info("%s is up to date" % model_path)
+        return 0
+
+    logger.info("Vectorizing %d of %d labeled images ..." % (len(changed), len(img_paths)))
+    vecs = vectorize_labeled_imgs([img_paths[label] for label in changed], size, fill_val, workers)
+    vec_dic.update(zip(changed, vecs))
+
+    logger.info("Serializing %d labels to %s ..." % (len(vec_dic), model_path))
+    model = LabelModel.from_dict(vec_dic, size, fill_val)
+    if index_components:
+        logger.info("Building index ...")
+        add_index(model, index_components)
+    # replace the old files only once the new ones are complete, `LabelModel.save` does the same for the model
+    model.save(model_path)
+    save_manifest(manifest_path + '.tmp', params, hashes)
+    os.rename(manifest_path + '.tmp', manifest_path)
+    return len(changed)
+
+
+def build_params(size, fill_val, index_components=None):
+    """
+    Return the parameters that determine the contents of a model besides the labeled images, a model built with
+    different parameters can't be reused
+    """
+    return {'size': list(size), 'fill_val': fill_val, 'index_components': index_components,
+            'model_format_version': FORMAT_VERSION}
+
+
+def find_labeled_imgs(dir_path):
     """
-    logger.info("Parsing directory and vectorizing ...")
-    vec_dic = search_dir_and_seg(dir_to_serialize, size, fill_val)
-    labels = vec_dic.keys()
-    vecs = vec_dic.values()
+    Return a dictionary whose keys are labels and values are the paths of the .png images of the labels in `dir_path`
+    """
+    return dict((file_name[:-4], os.path.join(dir_path, file_name))
+                for file_name in os.listdir(dir_path) if file_name[-4:] == '.png')
+
+
+def hash_file(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as img_file:
+        for chunk in iter(lambda: img_file.read(1 << 16), ''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
-    for i in xrange(len(labels)):
-        logger.info("Serializing %s ..." % labels[i])
-        with open(os.path.join(dir_to_place_objs, labels[i] + '.p'), 'wb') as obj_file:
-            pickle.dump(vecs[i], obj_file)
+def load_manifest(manifest_path):
+    """
+    Return the manifest at `manifest_path`, or an empty one if there is none or it's from another version
+    """
+    empty = {'version': MANIFEST_VERSION, 'params': None, 'sources': {}}
+    if not os.path.exists(manifest_path):
+        return empty
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return empty
+    return manifest
 
-    size_obj_file = open(os.path.join(dir_to_place_objs, 'size.p'), 'wb')
-    fill_val_obj_file = open(os.path.join(dir_to_place_objs, 'fill_val.p'), 'wb')
 
-    pickle.dump(size, size_obj_file)
-    pickle.dump(fill_val, fill_val_obj_file)
-    fill_val_obj_file.close()
-    size_obj_file.close()
+def save_manifest(manifest_path, params, hashes):
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump({'version': MANIFEST_VERSION, 'params': params, 'sources': hashes}, manifest_file, indent=1,
+                  sort_keys=True)
 
 
-def search_dir_and_seg(dir_path, resize, fill_val=-1):
+def reuse_vectors(model_path, manifest_path, params, hashes):
+    """
+    Take the vectors of the labeled images that haven't changed since the model at `model_path` was built from it
+
+    :param params: Parameters of the new build, see `build_params`
+    :param hashes: Dictionary whose keys are labels and values are the hashes of their images
+    :return: Dictionary whose keys are labels and values are vectors, empty if the model can't be reused
+    """
+    manifest = load_manifest(manifest_path)
+    if manifest['params'] != params or not os.path.exists(model_path):
+        return {}
+    model = LabelModel.load(model_path)
+    rows = dict((label, row) for row, label in enumerate(model.labels))
+    vec_dic = {}
+    for label, source_hash in hashes.iteritems():
+        if manifest['sources'].get(label) == source_hash and label in rows:
+            vec_dic[label] = np.array(model.vectors[rows[label]])
+    return vec_dic
+
+
+def vectorize_labeled_imgs(img_paths, size, fill_val=-1, workers=None):
+    """
+    Segment and vectorize each labeled image in `img_paths` over a pool of `workers` processes, with 1 everything runs
+    in this process
+
+    :return: List of vectors in the same order as `img_paths`
+    """
+    args = [(img_path, size, fill_val) for img_path in img_paths]
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers <= 1 or len(args) <= 1:
+        return [_vectorize_labeled_img(arg) for arg in args]
+
+    pool = multiprocessing.Pool(min(workers, len(args)))
+    try:
+        return pool.map(_vectorize_labeled_img, args, chunksize=max(len(args) // (4 * workers), 1))
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def search_dir_and_seg(dir_path, resize, fill_val=-1, workers=1):
     """
     Meant to be used on a folder with labeled segments to compare unknown examples against. All files
     in the folder should contain .png files with one segment in each image. This method searches the directory
     and creates a dictionary with each file name and the pixels in it that the segment comprises of.
     :return: Dictionary with the keys being labels and values being corresponding segments
     """
-    vec_dic = {}
-    for path in os.listdir(dir_path):
-        if path[-4:] == '.png':
-            segment = open_and_segment(dir_path + '/' + path)
-            logger.info("Transofrming and vectorizing %s" % path)
-            vec_dic[path[:-4]] = transform_and_vectorize(segment, resize, fill_val)
-    return vec_dic
+    img_paths = find_labeled_imgs(dir_path)
+    labels = sorted(img_paths)
+    return dict(zip(labels, vectorize_labeled_imgs([img_paths[label] for label in labels], resize, fill_val, workers)))
 
 
 def open_and_segment(img_path):
@@ -81,9 +194,15 @@ def transform_and_vectorize(segment, size, fill_val=-1):
     return transform.get_flattened_pix_grid(fill_val)
 
 
+def _vectorize_labeled_img(args):
+    img_path, size, fill_val = args
+    logger.info("Transforming and vectorizing %s" % os.path.basename(img_path))
+    return transform_and_vectorize(open_and_segment(img_path), size, fill_val)
+
+
 if __name__ == '__main__':
     folder = 'labeled'  # folder containing images to serialize
-    serialized_folder = 'serialized_labeled_imgs'  # folder to place serialized objects representing the images
+    serialized_folder = 'serialized_labeled_imgs'  # folder to place the model file representing the images
     size = (50, 50)  # size to resize images to
     fill_val = -1.45
 
@@ -1,26 +0,0 @@
-cnumpy.core.multiarray
-_reconstruct
-p1
-(cnumpy
-ndarray
-p2
-(I0
-tS'b'
-tRp3
-(I1
-(I2500
-tcnumpy
-dtype
-p4
-(S'f8'
-I0
-I1
-tRp5
-(I3
-S'<'
-NNNI-1
-I-1
-I0
-tbI00
-S'333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf333333\xf7\xbf\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\xf0?'
-tb.
\ No newline at end of file
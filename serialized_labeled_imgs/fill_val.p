@@ -1,2 +0,0 @@
-F-1.45
-.
\ No newline at end of file
@@ -1,4 +0,0 @@
-(I50
-I50
-tp1
-.
\ No newline at end of file
@@ -0,0 +1,197 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+"""
+Checkpoints of the output of the pipeline's stages so a later run can pick up from the last stage that still applies.
+After segmentation an image's segments are saved(bitmaps and bounding boxes) and after classification their labels and
+distances are added. Re-running layout over a corpus then skips decoding, segmentation and classification, and
+re-running classification with new labeled images skips decoding and segmentation
+
+Artifacts are stored one file per image in a compact versioned binary format:
+    preamble | label table | segment boxes | distances | label indices | packed bitmaps
+
+The preamble records the stage the artifact reached, the size and modification time of the source image(an artifact of
+an image that changed since is ignored), the parameters the image was segmented with(an artifact segmented differently
+is ignored), the factor the image was downsampled by before segmentation and the checksum of the model the segments were
+classified with(classifications from another model are ignored and the segments are classified again)
+"""
+
+import os
+import struct
+import hashlib
+
+import numpy as np
+
+from segment_img import DEFAULT_SEGMENTATION, Segment
+
+MAGIC = 'J2LSTAGE'
+FORMAT_VERSION = 2
+ARTIFACT_EXTENSION = '.j2ls'
+
+SEGMENTED = 1  # the artifact holds segments
+CLASSIFIED = 2  # the artifact holds segments along with their classifications
+
+# magic, version, stage, number of segments, source size, source mtime, model checksum, label table length,
+# min_pixels, threshold, target glyph height(0 for None), scale
+_PREAMBLE = struct.Struct('<8sIIIQd40sIIIII')
+_BOX = np.dtype([('x', '<i4'), ('y', '<i4'), ('width', '<u4'), ('height', '<u4')])
+
+
+class StageArtifact(object):
+    """
+    Output of the pipeline for one image up to some stage
+    """
+
+    def __init__(self, segments, stage, model_checksum=None, source_size=0, source_mtime=0.0,
+                 segmentation=DEFAULT_SEGMENTATION, scale=1):
+        """
+        :param segments: List of `Segment` objects, classified if `stage` is `CLASSIFIED`
+        :param stage: `SEGMENTED` or `CLASSIFIED`
+        :param model_checksum: Checksum of the model the segments were classified with
+        :param source_size: Size in bytes of the image the segments are from
+        :param source_mtime: Modification time of the image the segments are from
+        :param segmentation: (min_pixels, threshold, target_glyph_height) the image was segmented with
+        :param scale: Factor the image was downsampled by before it was segmented, see `ImageSegmenter.scale`
+        """
+        self.segments = segments
+        self.stage = stage
+        self.model_checksum = model_checksum
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+        self.segmentation = tuple(segmentation)
+        self.scale = scale
+
+    def save(self, path):
+        """
+        Write the artifact to `path`, replacing any artifact already there once the new one is complete
+        """
+        classified = self.stage == CLASSIFIED
+        labels = sorted(set(segment.classification for segment in self.segments)) if classified else []
+        label_table = '\0'.join(labels)
+
+        boxes = np.zeros(len(self.segments), dtype=_BOX)
+        for i, segment in enumerate(self.segments):
+            boxes[i] = segment.upper_left + segment.bitmap.shape[::-1]
+
+        min_pixels, threshold, target_glyph_height = self.segmentation
+        with open(path + '.tmp', 'wb') as artifact_file:
+            artifact_file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, self.stage, len(self.segments), self.source_size,
+                                               self.source_mtime, self.model_checksum or '', len(label_table),
+                                               min_pixels, threshold, target_glyph_height or 0, self.scale))
+            artifact_file.write(label_table)
+            artifact_file.write(boxes.tobytes())
+            if classified:
+                label_numbers = dict((label, i) for i, label in enumerate(labels))
+                artifact_file.write(np.array([segment.distance for segment in self.segments], dtype='<f4').tobytes())
+                artifact_file.write(np.array([label_numbers[segment.classification] for segment in self.segments],
+                                             dtype='<u2').tobytes())
+            for segment in self.segments:
+                artifact_file.write(np.packbits(segment.bitmap).tobytes())
+        os.rename(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read the artifact at `path`
+
+        :raises ValueError: if the file isn't an artifact of this format version, is truncated or is corrupt
+        """
+        with open(path, 'rb') as artifact_file:
+            data = artifact_file.read()
+        magic, version = struct.unpack_from('<8sI', data)
+        if magic != MAGIC:
+            raise ValueError('%s is not a stage artifact' % path)
+        if version != FORMAT_VERSION:
+            raise ValueError('%s has artifact format version %d, expected %d' % (path, version, FORMAT_VERSION))
+        (_, _, stage, n_segments, source_size, source_mtime, model_checksum, table_len, min_pixels, threshold,
+         target_glyph_height, scale) = _PREAMBLE.unpack_from(data)
+        if stage not in (SEGMENTED, CLASSIFIED):
+            raise ValueError('%s has unknown stage %d' % (path, stage))
+
+        offset = _PREAMBLE.size
+        labels = data[offset:offset + table_len].split('\0')
+        offset += table_len
+        boxes = np.frombuffer(data, dtype=_BOX, count=n_segments, offset=offset)
+        offset += boxes.nbytes
+        if stage == CLASSIFIED:
+            distances = np.frombuffer(data, dtype='<f4', count=n_segments, offset=offset)
+            offset += distances.nbytes
+            label_numbers = np.frombuffer(data, dtype='<u2', count=n_segments, offset=offset)
+            offset += label_numbers.nbytes
+            if n_segments and label_numbers.max() >= len(labels):
+                raise ValueError('%s refers to labels missing from its label table' % path)
+        bitmap_bytes = (boxes['width'].astype(np.int64) * boxes['height'] + 7) // 8
+        if offset + bitmap_bytes.sum() != len(data):
+            raise ValueError('%s is truncated or corrupt' % path)
+
+        segments = []
+        for i, ((x, y, width, height), n_bytes) in enumerate(zip(boxes.tolist(), bitmap_bytes.tolist())):
+            bits = np.frombuffer(data, dtype=np.uint8, count=n_bytes, offset=offset)
+            offset += n_bytes
+            segment = Segment(np.unpackbits(bits)[:width * height].reshape(height, width).astype(bool), (x, y))
+            if stage == CLASSIFIED:
+                segment.classification = labels[label_numbers[i]]
+                segment.distance = float(distances[i])
+            segments.append(segment)
+        return cls(segments, stage, model_checksum.rstrip('\0') or None, source_size, source_mtime,
+                   (min_pixels, threshold, target_glyph_height or None), scale)
+
+
+class StageCheckpoints(object):
+    """
+    Directory of `StageArtifact` files, one per image path
+    """
+
+    def __init__(self, directory, load=True, save=True):
+        """
+        :param directory: Directory to keep the artifacts in, created if it doesn't exist
+        :param load: Start images from their saved artifacts when they are still valid
+        :param save: Save the artifacts of the images that are converted
+        """
+        self.directory = directory
+        self.load_artifacts = load
+        self.save_artifacts = save
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def get_path(self, img_path):
+        """
+        Return the path of the artifact of the image at `img_path`
+        """
+        # the hash of the full path keeps images with the same name in different directories apart
+        path_hash = hashlib.sha1(os.path.abspath(img_path)).hexdigest()[:12]
+        return os.path.join(self.directory, '%s.%s%s' % (os.path.basename(img_path), path_hash, ARTIFACT_EXTENSION))
+
+    def load(self, img_path, segmentation=DEFAULT_SEGMENTATION):
+        """
+        Return the artifact saved for the image at `img_path`, or None if there is none, the image changed since or it
+        was segmented with other parameters than `segmentation`
+        """
+        if not self.load_artifacts or not isinstance(img_path, basestring):
+            return None
+        path = self.get_path(img_path)
+        if not os.path.exists(path) or not os.path.exists(img_path):
+            return None
+        try:
+            artifact = StageArtifact.load(path)
+        except (ValueError, struct.error):
+            return None  # written by another version or corrupt, it will be replaced
+        stat = os.stat(img_path)
+        if (artifact.source_size, artifact.source_mtime) != (stat.st_size, stat.st_mtime):
+            return None
+        if artifact.segmentation != tuple(segmentation):
+            return None
+        return artifact
+
+    def save(self, img_path, segments, model_checksum=None, segmentation=DEFAULT_SEGMENTATION, scale=1):
+        """
+        Save the segments of the image at `img_path`, along with their classifications if `model_checksum` is given
+
+        :param segmentation: (min_pixels, threshold, target_glyph_height) the image was segmented with
+        :param scale: Factor the image was downsampled by before it was segmented
+        """
+        if not self.save_artifacts or not isinstance(img_path, basestring):
+            return
+        stat = os.stat(img_path)
+        stage = CLASSIFIED if model_checksum is not None else SEGMENTED
+        StageArtifact(segments, stage, model_checksum, stat.st_size, stat.st_mtime, segmentation,
+                      scale).save(self.get_path(img_path))
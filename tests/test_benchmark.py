@@ -0,0 +1,46 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import benchmark
+from segment_img import ImageSegmenter
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def count_segments(self, expression):
+        return len(ImageSegmenter(benchmark.render(expression)).segment_image())
+
+    def test_render(self):
+        self.assertEqual(7, self.count_segments(benchmark.terms(4)))
+        self.assertEqual(1 + 4 * 3, self.count_segments(benchmark.fraction_tower(3)))  # 1, bar, 2, + per level
+        self.assertEqual(1 + 3 * 3, self.count_segments(benchmark.nested_radical(3)))  # radical, 5, + per level
+
+    def test_compare(self):
+        baseline = {'cases': {'a': {'total': 0.010}, 'b': {'total': 0.010}, 'c': {'total': 0.0001}}}
+        results = {'cases': {'a': {'total': 0.011}, 'b': {'total': 0.020}, 'c': {'total': 0.0010},
+                             'new': {'total': 1.0}}}
+        self.assertEqual([('b', 0.010, 0.020)], benchmark.compare(results, baseline))
+
+    def test_missing_baseline(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        stderr, sys.stderr = sys.stderr, StringIO()
+        try:
+            # refused before anything is benchmarked
+            with self.assertRaises(SystemExit) as context:
+                benchmark.main(['--baseline', os.path.join(tmp_dir, 'missing.json')], StringIO())
+            message = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        self.assertEqual(2, context.exception.code)
+        self.assertIn('--save-baseline', message)
+
+    def test_median(self):
+        self.assertEqual(2, benchmark.median([3, 1, 2]))
+        self.assertEqual(2.5, benchmark.median([4, 1, 2, 3]))
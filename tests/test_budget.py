@@ -0,0 +1,89 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import os
+import unittest
+
+import numpy as np
+
+from budget import BUDGET_CHECK_INTERVAL, Budget, BudgetExceeded
+from classify_segments import Classifier
+from image_to_latex import image_to_latex, image_to_latex_many
+from segment_img import Segment
+from segments_to_latex import MAX_LAYOUT_DEPTH, SegmentsToLatex
+from transform_segment import vectorize_segments
+
+
+class RecordingBudget(Budget):
+    """
+    Budget that remembers the stage of every check of its clock
+    """
+
+    def __init__(self):
+        Budget.__init__(self)
+        self.time_checks = []
+
+    def check_time(self, stage):
+        self.time_checks.append(stage)
+
+
+class TestBudget(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(Budget))
+        self.test_images_dir = os.path.join(root_dir, 'test_images')
+        self.labeled_dir = os.path.join(root_dir, 'serialized_labeled_imgs')
+        self.img_path = os.path.join(self.test_images_dir, 'divisions.png')
+
+    def assert_exceeds(self, budget, limit, stage):
+        with self.assertRaises(BudgetExceeded) as context:
+            image_to_latex(self.img_path, self.labeled_dir, budget=budget)
+        self.assertEqual(limit, context.exception.limit)
+        self.assertEqual(stage, context.exception.stage)
+
+    def test_limits(self):
+        self.assert_exceeds(Budget(max_pixels=100), 'pixels', 'decode')
+        self.assert_exceeds(Budget(max_segments=3), 'segments', 'segment')
+        self.assert_exceeds(Budget(max_seconds=-1), 'seconds', 'segment')
+        self.assert_exceeds(Budget(max_depth=0), 'depth', 'layout')
+
+        expected = '\\frac{\\sqrt{5 + 2} + \\frac{5}{2}}{4 0 0 0 0}'
+        budget = Budget(max_seconds=60, max_pixels=10 ** 7, max_segments=100, max_depth=2)
+        self.assertEqual(expected, image_to_latex(self.img_path, self.labeled_dir, budget=budget))
+
+    def test_image_to_latex_many(self):
+        img_paths = [self.img_path, os.path.join(self.test_images_dir, 'root.png')]
+        results = image_to_latex_many(img_paths, self.labeled_dir, workers=1, budget=Budget(max_segments=8))
+        self.assertEqual({'limit': 'segments', 'value': 14, 'maximum': 8, 'stage': 'segment'},
+                         results[0].budget_exceeded)
+        self.assertIn('BudgetExceeded', results[0].error)
+        self.assertEqual('5 + \\sqrt{5 + 1 0}', results[1].latex)
+        self.assertIsNone(results[1].budget_exceeded)
+
+    def test_time_checked_per_segment(self):
+        segments = [Segment(np.ones((3 + i % 5, 2), dtype=bool)) for i in range(BUDGET_CHECK_INTERVAL * 2 + 1)]
+        budget = RecordingBudget()
+        vecs = vectorize_segments(segments, (50, 50), budget=budget)
+        self.assertEqual(['rescale'] * 3, budget.time_checks)
+
+        budget = RecordingBudget()
+        classifier = Classifier(self.labeled_dir, index_candidates=None, cascade=True, glyph_cache=None)
+        classifier.classify_vectors(vecs, budget=budget)
+        self.assertEqual(['classify'] * 3, budget.time_checks)
+
+    def test_deep_nesting(self):
+        # every division sign is in the denominator of the longer one above it
+        segments = []
+        for i in range(2 * MAX_LAYOUT_DEPTH):
+            segment = Segment(np.ones((1, 4000 - 10 * i), dtype=bool), (5 * i + 5, 10 * i + 10))
+            segment.classification = 'division'
+            segments.append(segment)
+        with self.assertRaises(BudgetExceeded) as context:
+            SegmentsToLatex(segments, Budget().start()).search_and_simplify((0, 0), (999999, 999999))
+        self.assertEqual('depth', context.exception.limit)
+        # without a budget it is a plain error rather than a budget the caller never set running out
+        with self.assertRaises(RuntimeError) as context:
+            SegmentsToLatex(segments).search_and_simplify((0, 0), (999999, 999999))
+        self.assertNotIsInstance(context.exception, BudgetExceeded)
+        self.assertEqual('\\frac{}{\\frac{}{}}', SegmentsToLatex(segments[:2]).search_and_simplify(
+            (0, 0), (999999, 999999)).classification)
@@ -4,7 +4,9 @@ import inspect
 import os
 import unittest
 
-from classify_segments import seg_and_classify_img
+import numpy as np
+
+from classify_segments import Classifier, GlyphCache, invalidate_model_cache, nearest_neighbours, seg_and_classify_img
 
 
 class TestClassifier(unittest.TestCase):  # TODO add many more test cases
@@ -43,3 +45,71 @@ class TestClassifier(unittest.TestCase):  # TODO add many more test cases
         classifications = self.classify('root_frac.png')
         expected = ['radical', 'radical', '1', '0', '5', '5', '+', '+', 'division', 'radical', '4']
         self.assertItemsEqual(expected, classifications)
+
+    def test_classifier_reuse(self):
+        classifier = Classifier(self.labeled_dir)
+        img_path = os.path.join(self.test_images_dir, 'nested_root.png')
+        segments = seg_and_classify_img(img_path, classifier=classifier)
+        expected = ['radical', 'radical', '5', '5', '1', '0', '+', '+']
+        self.assertItemsEqual(expected, [segment.classification for segment in segments])
+
+    def test_model_cache(self):
+        self.assertIs(Classifier(self.labeled_dir).model, Classifier(self.labeled_dir).model)
+        cached = Classifier(self.labeled_dir)
+        other = Classifier(self.labeled_dir, cascade=False)
+        for name in ['index', 'profiles', 'labels', 'label_sq_norms']:
+            self.assertIs(getattr(cached, name), getattr(other, name))
+        invalidate_model_cache(self.labeled_dir)
+        reloaded = Classifier(self.labeled_dir)
+        self.assertIsNot(cached.model, reloaded.model)
+        self.assertIsNot(cached.labels, reloaded.labels)
+
+    def test_nearest_neighbours(self):
+        rng = np.random.RandomState(0)
+        vecs, labeled_vecs = rng.rand(5, 20), rng.rand(30, 20)
+        indices, distances = nearest_neighbours(vecs, labeled_vecs, k=4)
+        for vec, vec_indices, vec_distances in zip(vecs, indices, distances):
+            expected = np.sqrt(((labeled_vecs - vec) ** 2).sum(axis=1))
+            self.assertEqual(np.argsort(expected)[:4].tolist(), vec_indices.tolist())
+            np.testing.assert_allclose(np.sort(expected)[:4], vec_distances)
+
+    def test_classify_vectors_top_k(self):
+        classifier = Classifier(self.labeled_dir)
+        labels, distances = classifier.classify_vectors(classifier.model.vectors[:3], k=2)
+        self.assertEqual(classifier.model.labels[:3], labels[:, 0].tolist())
+        np.testing.assert_allclose(0, distances[:, 0], atol=1e-2)
+        self.assertTrue((distances[:, 1] >= distances[:, 0]).all())
+
+    def test_cascade_matches_exact(self):
+        cascade = Classifier(self.labeled_dir, cascade=True, glyph_cache=None)
+        exact = Classifier(self.labeled_dir, glyph_cache=None)
+        for img_name in ['divisions.png', 'integral.png', 'latex2.png', 'webassign.png']:
+            img_path = os.path.join(self.test_images_dir, img_name)
+            self.assertEqual([segment.classification for segment in exact.classify_image(img_path)],
+                             [segment.classification for segment in cascade.classify_image(img_path)])
+        self.assertGreater(cascade.cascade_stats.segments, 0)
+        self.assertGreater(cascade.cascade_stats.pruned_fraction(), 0)
+        self.assertEqual(0, exact.cascade_stats.segments)
+
+    def test_cascade_any_vectors(self):
+        cascade = Classifier(self.labeled_dir, cascade=True, index_candidates=None, glyph_cache=None)
+        exact = Classifier(self.labeled_dir, index_candidates=None, glyph_cache=None)
+        rng = np.random.RandomState(0)
+        vecs = np.vstack([cascade.model.vectors[:5], rng.rand(3, cascade.model.vectors.shape[1])])
+        vecs[1, :10] = 1 - vecs[1, :10]  # not only 1s and fill_vals, the ink profile bound doesn't hold
+        cascade_labels, cascade_distances = cascade.classify_vectors(vecs, k=3)
+        exact_labels, exact_distances = exact.classify_vectors(vecs, k=3)
+        self.assertEqual(exact_labels.tolist(), cascade_labels.tolist())
+        # float32 rounding of the squared distances is magnified by the square root near 0
+        np.testing.assert_allclose(exact_distances ** 2, cascade_distances ** 2, atol=1e-2, rtol=1e-5)
+
+    def test_glyph_cache(self):
+        glyph_cache = GlyphCache(max_size=8)
+        classifier = Classifier(self.labeled_dir, glyph_cache=glyph_cache)
+        img_path = os.path.join(self.test_images_dir, 'divisions.png')
+        first = [segment.classification for segment in classifier.classify_image(img_path)]
+        self.assertEqual(14, glyph_cache.misses)
+        self.assertEqual(8, len(glyph_cache))
+        second = [segment.classification for segment in classifier.classify_image(img_path)]
+        self.assertEqual(first, second)
+        self.assertGreater(glyph_cache.hits, 0)
@@ -0,0 +1,150 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import httplib
+import inspect
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+import conversion_server
+from budget import Budget
+from conversion_server import ConversionService, QueueFull, make_server
+
+
+class TestConversionServer(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(ConversionService))
+        self.labeled_dir = os.path.join(root_dir, 'serialized_labeled_imgs')
+        with open(os.path.join(root_dir, 'test_images', 'root.png'), 'rb') as img_file:
+            self.image_bytes = img_file.read()
+        self.expected = '5 + \\sqrt{5 + 1 0}'
+
+    def serve(self, service, **kwargs):
+        service.start()
+        server = make_server(service, port=0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        def shut_down():
+            server.shutdown()
+            server.server_close()
+            service.stop()
+        self.addCleanup(shut_down)
+        return server
+
+    def post(self, server, body):
+        connection = httplib.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+        connection.request('POST', '/latex', body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_convert(self):
+        server = self.serve(ConversionService(self.labeled_dir, workers=1))
+        status, result = self.post(server, self.image_bytes)
+        self.assertEqual(200, status)
+        self.assertEqual(self.expected, result['latex'])
+        self.assertIsNone(result['error'])
+
+        status, result = self.post(server, 'not an image')
+        self.assertEqual(422, status)
+        self.assertIn('IOError', result['error'])
+
+    def test_budget(self):
+        service = ConversionService(self.labeled_dir, workers=1, budget=Budget(max_pixels=100))
+        service.start()
+        try:
+            # only the header is needed to tell the image is too large, the truncated data is never decoded
+            result = service.convert(self.image_bytes[:len(self.image_bytes) // 2])
+        finally:
+            service.stop()
+        self.assertIsNone(result.latex)
+        self.assertEqual(('pixels', 'decode'), (result.budget_exceeded['limit'], result.budget_exceeded['stage']))
+
+    def test_micro_batches(self):
+        service = ConversionService(self.labeled_dir, workers=1, batch_size=8, max_wait=0.2)
+        server = self.serve(service)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.post(server, self.image_bytes)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([(200, self.expected)] * 8, [(status, result['latex']) for status, result in results])
+        self.assertLess(service.batches, 8)
+
+    def test_worker_processes(self):
+        service = ConversionService(self.labeled_dir, workers=2)
+        service.start()
+        try:
+            self.assertEqual(self.expected, service.convert(self.image_bytes).latex)
+        finally:
+            service.stop()
+
+    def test_worker_dies(self):
+        convert_image_bytes = conversion_server.convert_image_bytes
+
+        def convert_or_die(blobs, *args):
+            if 'die' in blobs:
+                os._exit(1)
+            return convert_image_bytes(blobs, *args)
+
+        # the workers are forked while the module is patched, the workers replacing them are not
+        conversion_server.convert_image_bytes = convert_or_die
+        try:
+            service = ConversionService(self.labeled_dir, workers=2, batch_timeout=2)
+            service.start()
+        finally:
+            conversion_server.convert_image_bytes = convert_image_bytes
+        try:
+            result = service.convert('die')
+            self.assertIsNone(result.latex)
+            self.assertIn('Timeout', result.error)
+            self.assertEqual(self.expected, service.convert(self.image_bytes).latex)
+        finally:
+            service.stop()
+
+    def test_bad_content_length(self):
+        server = self.serve(ConversionService(self.labeled_dir, workers=1))
+        connection = httplib.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+        connection.putrequest('POST', '/latex')
+        connection.putheader('Content-Length', 'many')
+        connection.endheaders()
+        response = connection.getresponse()
+        self.assertEqual(400, response.status)
+        self.assertIn('Content-Length', json.loads(response.read())['error'])
+
+    def test_queue_full(self):
+        service = ConversionService(self.labeled_dir, workers=1, max_queue=1)  # not started, nothing is taken off
+        service.submit(self.image_bytes)
+        self.assertRaises(QueueFull, service.submit, self.image_bytes)
+
+    def test_stop_with_full_queue(self):
+        service = ConversionService(self.labeled_dir, workers=1, max_queue=2)
+        requests = [service.submit(self.image_bytes) for _ in xrange(2)]
+        service.start()
+        service.stop()  # the queued requests are converted first
+        self.assertEqual([self.expected] * 2, [request.wait(0).latex for request in requests])
+        self.assertEqual(2, service.converted)
+        self.assertRaises(QueueFull, service.submit, self.image_bytes)
+
+    def test_unix_socket(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        socket_path = os.path.join(tmp_dir, 'server.sock')
+        self.serve(ConversionService(self.labeled_dir, workers=1), unix_socket=socket_path)
+
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(socket_path)
+        client.sendall('POST /latex HTTP/1.0\r\nContent-Length: %d\r\n\r\n%s' % (len(self.image_bytes),
+                                                                                 self.image_bytes))
+        response = ''.join(iter(lambda: client.recv(4096), ''))
+        client.close()
+        self.assertTrue(response.startswith('HTTP/1.0 200'))
+        self.assertEqual(self.expected, json.loads(response.split('\r\n\r\n', 1)[1])['latex'])
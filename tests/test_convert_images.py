@@ -0,0 +1,92 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import convert_images
+
+
+class TestConvertImages(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(convert_images))
+        self.test_images_dir = os.path.join(root_dir, 'test_images')
+        self.tmp_dir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmp_dir, 'results.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def read_output(self):
+        with open(self.output) as output_file:
+            return [json.loads(line) for line in output_file]
+
+    def test_directory(self):
+        convert_images.main([self.test_images_dir, '-o', self.output, '--workers', '1'])
+        results = self.read_output()
+        self.assertEqual(16, len(results))
+        self.assertEqual(sorted(result['path'] for result in results), [result['path'] for result in results])
+        divisions = [result for result in results if result['path'].endswith('divisions.png')][0]
+        self.assertEqual('\\frac{\\sqrt{5 + 2} + \\frac{5}{2}}{4 0 0 0 0}', divisions['latex'])
+        self.assertIsNone(divisions['error'])
+        self.assertItemsEqual(['segment', 'classify', 'layout'], divisions['timings'].keys())
+
+    def test_strip_height(self):
+        img_path = os.path.join(self.test_images_dir, 'nested_root.png')
+        convert_images.main([img_path, '-o', self.output, '--workers', '1', '--strip-height', '32'])
+        self.assertEqual('\\sqrt{5 + \\sqrt{5 + 1 0}}', self.read_output()[0]['latex'])
+
+    def test_segment_workers(self):
+        img_path = os.path.join(self.test_images_dir, 'nested_root.png')
+        convert_images.main([img_path, '-o', self.output, '--segment-workers', '2'])
+        self.assertEqual('\\sqrt{5 + \\sqrt{5 + 1 0}}', self.read_output()[0]['latex'])
+
+    def test_stdin_and_resume(self):
+        paths = [os.path.join(self.test_images_dir, name) for name in ['root.png', 'missing.png', 'nested_root.png']]
+        with open(self.output, 'wb') as output_file:
+            output_file.write(json.dumps({'path': paths[0], 'latex': 'done before'}) + '\n')
+            output_file.write('{"path": "interrupted')
+        stdin = StringIO('\n'.join(paths) + '\n')
+        convert_images.main(['-o', self.output, '--resume', '--workers', '1'], stdin=stdin)
+        results = self.read_output()
+        self.assertEqual(paths, [result['path'] for result in results])
+        self.assertEqual('done before', results[0]['latex'])
+        self.assertIn('IOError', results[1]['error'])
+        self.assertEqual('\\sqrt{5 + \\sqrt{5 + 1 0}}', results[2]['latex'])
+
+    def test_resume_after_missing_newline(self):
+        paths = [os.path.join(self.test_images_dir, name) for name in ['root.png', u'r\xe9sum\xe9.png']]
+        with open(self.output, 'wb') as output_file:
+            output_file.write(json.dumps({'path': paths[0], 'latex': 'done before'}) + '\n')
+            output_file.write(json.dumps({'path': paths[1], 'latex': 'done before'}))
+        done = convert_images.read_done_paths(self.output)
+        self.assertEqual(2, len(done))
+        self.assertIn(paths[0], done)
+        self.assertIn(paths[1].encode('utf-8'), done)
+        self.assertNotIn(os.path.join(self.test_images_dir, 'nested_root.png'), done)
+
+        img_path = os.path.join(self.test_images_dir, 'nested_root.png')
+        convert_images.main([img_path, '-o', self.output, '--resume', '--workers', '1'])
+        results = self.read_output()
+        self.assertEqual(paths + [img_path], [result['path'] for result in results])
+        self.assertEqual('\\sqrt{5 + \\sqrt{5 + 1 0}}', results[2]['latex'])
+
+    def test_resume_keeps_results_after_bad_lines(self):
+        records = [json.dumps({'path': name, 'latex': 'done before'}) for name in ['a.png', 'b.png', 'c.png']]
+        with open(self.output, 'wb') as output_file:
+            output_file.write(records[0] + '\n\n' + records[1] + '\nnot json\n' + records[2] + '\n{"path": "d.p')
+        done = convert_images.read_done_paths(self.output)
+        self.assertEqual(3, len(done))
+        self.assertNotIn('d.png', done)
+        with open(self.output, 'rb') as output_file:
+            self.assertEqual(records[0] + '\n\n' + records[1] + '\nnot json\n' + records[2] + '\n', output_file.read())
+
+    def test_glob(self):
+        pattern = os.path.join(self.test_images_dir, 'root*.png')
+        self.assertEqual([os.path.join(self.test_images_dir, name) for name in ['root.png', 'root_frac.png']],
+                         list(convert_images.iter_img_paths([pattern])))
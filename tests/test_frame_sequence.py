@@ -0,0 +1,137 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import os
+import unittest
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from classify_segments import Classifier
+from frame_sequence import FrameSequence
+from image_to_latex import image_to_latex, segments_to_latex
+from profiling import PipelineStats
+from segment_img import TARGET_GLYPH_HEIGHT, ImageSegmenter
+
+
+class TestFrameSequence(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        root_dir = os.path.dirname(inspect.getfile(FrameSequence))
+        cls.classifier = Classifier(os.path.join(root_dir, 'serialized_labeled_imgs'), glyph_cache=None)
+        with Image.open(os.path.join(root_dir, 'test_images', 'nested_frac.png')) as img:
+            cls.frame = img.convert('L')
+
+    def setUp(self):
+        self.sequence = FrameSequence(classifier=self.classifier)
+
+    def draw(self, box, frame=None):
+        frame = (frame or self.frame).copy()
+        ImageDraw.Draw(frame).rectangle(box, 0)
+        return frame
+
+    def assert_same_as_from_scratch(self, frame):
+        expected = ImageSegmenter(frame).segment_image(target_glyph_height=self.sequence.target_glyph_height)
+        self.assertEqual([segment.upper_left for segment in expected],
+                         [segment.upper_left for segment in self.sequence.segments])
+        for expected_segment, segment in zip(expected, self.sequence.segments):
+            np.testing.assert_array_equal(expected_segment.bitmap, segment.bitmap)
+        if self.sequence.target_glyph_height is None:
+            self.assertEqual(self.sequence.latex, image_to_latex(frame, classifier=self.classifier))
+        else:
+            self.assertEqual(self.sequence.latex, segments_to_latex(self.classifier.classify_segments(expected)))
+
+    def test_only_changes_are_segmented(self):
+        self.sequence.update(self.frame)
+        self.assert_same_as_from_scratch(self.frame)
+        n_segments = len(self.sequence.segments)
+        self.assertEqual((self.sequence.reused, self.sequence.segmented), (0, n_segments))
+
+        # a new glyph in a blank corner
+        frame = self.draw([2, 2, 12, 12])
+        self.sequence.update(frame)
+        self.assert_same_as_from_scratch(frame)
+        self.assertEqual((self.sequence.reused, self.sequence.segmented), (n_segments, 1))
+
+        # the same frame again
+        stats = PipelineStats()
+        self.sequence.update(frame, stats)
+        self.assertEqual((self.sequence.reused, self.sequence.segmented), (n_segments + 1, 0))
+        self.assertNotIn('segment', stats.calls)
+        self.assertNotIn('layout', stats.calls)
+
+        # back to the first frame, the glyph is gone
+        self.sequence.update(self.frame)
+        self.assert_same_as_from_scratch(self.frame)
+        self.assertEqual((self.sequence.reused, self.sequence.segmented), (n_segments, 0))
+
+    def test_joined_and_split_groups(self):
+        self.sequence.update(self.frame)
+        segment = self.sequence.segments[0]
+        # a bar from the first segment to the right joins it with its neighbours into one group
+        x, y = segment.upper_left[0], segment.lower_right[1] + 2
+        frame = self.draw([x, y, self.frame.size[0] - 1, y + 1])
+        ImageDraw.Draw(frame).rectangle([x, segment.upper_left[1], x + 1, y], 0)
+        self.sequence.update(frame)
+        self.assert_same_as_from_scratch(frame)
+
+        self.sequence.update(self.frame)
+        self.assert_same_as_from_scratch(self.frame)
+
+        # both ends of the widest fraction bar trimmed at once, far apart changes to the same group
+        bar = max(self.sequence.segments, key=lambda segment: segment.bitmap.shape[1])
+        frame = self.frame.copy()
+        for x in [bar.upper_left[0], bar.lower_right[0]]:
+            ImageDraw.Draw(frame).rectangle([x, bar.upper_left[1], x, bar.lower_right[1]], 255)
+        self.sequence.update(frame)
+        self.assert_same_as_from_scratch(frame)
+        self.assertEqual(self.sequence.segmented, 1)
+
+    def test_random_edits(self):
+        rng = np.random.RandomState(0)
+        frame = self.frame
+        self.sequence.update(frame)
+        width, height = frame.size
+        for _ in xrange(15):
+            # strokes drawn and erased anywhere, in one or two places at once
+            frame = frame.copy()
+            for _ in xrange(rng.randint(1, 3)):
+                x, y = rng.randint(0, width), rng.randint(0, height)
+                length, thickness = rng.randint(0, 40), rng.randint(0, 4)
+                size = (length, thickness) if rng.rand() < 0.5 else (thickness, length)
+                ImageDraw.Draw(frame).rectangle([x, y, x + size[0], y + size[1]], rng.choice([0, 255]))
+            self.sequence.update(frame)
+            self.assert_same_as_from_scratch(frame)
+
+    def test_specks_skip_layout(self):
+        self.sequence.update(self.frame)
+        stats = PipelineStats()
+        latex = self.sequence.update(self.draw([2, 2, 3, 3]), stats)
+        self.assertEqual(latex, image_to_latex(self.frame, classifier=self.classifier))
+        self.assertEqual(self.sequence.segmented, 0)
+        self.assertNotIn('layout', stats.calls)
+
+    def test_high_dpi_frames(self):
+        frame = self.frame.resize((self.frame.size[0] * 11, self.frame.size[1] * 11), Image.NEAREST)
+        self.sequence = FrameSequence(classifier=self.classifier, target_glyph_height=TARGET_GLYPH_HEIGHT)
+        self.sequence.update(frame)
+        self.assertGreater(self.sequence.scale, 1)
+        self.assert_same_as_from_scratch(frame)
+        n_segments = len(self.sequence.segments)
+
+        frame = self.draw([20, 20, 140, 140], frame)
+        self.sequence.update(frame)
+        self.assert_same_as_from_scratch(frame)
+        self.assertEqual((self.sequence.reused, self.sequence.segmented), (n_segments, 1))
+
+    def test_new_size_starts_over(self):
+        self.sequence.update(self.frame)
+        frame = self.frame.crop((0, 0, self.frame.size[0] - 10, self.frame.size[1]))
+        self.sequence.update(frame)
+        self.assertEqual(self.sequence.reused, 0)
+        self.assert_same_as_from_scratch(frame)
+
+
+if __name__ == '__main__':
+    unittest.main()
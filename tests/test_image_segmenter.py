@@ -1,9 +1,17 @@
 # Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
 
+import os
+import shutil
+import tempfile
 import unittest
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
+import numpy as np
 from PIL import Image
-from segment_img import ImageSegmenter
+from segment_img import TARGET_GLYPH_HEIGHT, ImageSegmenter, Segment, binarize, downsample_mask, \
+    estimate_glyph_height, find_blocks, iter_image_strips, iter_segments_in_strips, resolution_scale, \
+    segment_image_in_strips
 
 
 class TestImageSegmenter(unittest.TestCase):
@@ -19,15 +27,22 @@ class TestImageSegmenter(unittest.TestCase):
             self.img.putpixel(xy, (0, 0, 0, 0))
         self.segmenter = ImageSegmenter(self.img)
 
-    def test_get_rgba_matrix(self):
-        copy = Image.new('RGBA', self.img.size)
-        rgba_matrix = self.segmenter.get_rgba_matrix()
+    def test_binarize(self):
+        mask = binarize(self.img)
+        self.assertEqual((7, 7), mask.shape)
+        self.assertItemsEqual(self.segment, [(x, y) for y, x in zip(*mask.nonzero())])
 
-        for y in xrange(self.img.size[1]):
-            for x in xrange(self.img.size[0]):
-                copy.putpixel((x, y), (rgba_matrix[y][x]))
+    def test_binarize_modes(self):
+        for mode in ['L', 'RGB', 'P', '1']:
+            img = self.img.convert('RGB').convert(mode)
+            self.assertEqual(binarize(self.img).tolist(), binarize(img).tolist(), mode)
 
-        self.assertItemsEqual(list(self.img.getdata()), list(copy.getdata()))
+    def test_binarize_threshold(self):
+        img = Image.new('L', (3, 1), 255)
+        img.putpixel((0, 0), 240)
+        img.putpixel((1, 0), 20)
+        self.assertEqual([[True, True, False]], binarize(img).tolist())
+        self.assertEqual([[False, True, False]], binarize(img, threshold=200).tolist())
 
     def test_surrounding_pixels(self):
         self.assertItemsEqual(((1, 0), (0, 1)), self.segmenter.get_surrounding_pixels((0, 0)))
@@ -41,3 +56,157 @@ class TestImageSegmenter(unittest.TestCase):
         self.assertItemsEqual([(2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (4, 2), (5, 3)], segments[0].pix)
         self.assertItemsEqual([(4, 4), (4, 5), (3, 5), (5, 5)], segments[1].pix)
 
+    def test_segment_image_large_segment(self):
+        img = Image.new('RGBA', (2000, 500), (255, 255, 255, 255))
+        img.paste((0, 0, 0, 255), (10, 240, 1990, 260))  # fraction bar far larger than the old recursion limit
+        segments = ImageSegmenter(img).segment_image()
+        self.assertEqual(1, len(segments))
+        self.assertEqual((10, 240), segments[0].upper_left)
+        self.assertEqual((1989, 259), segments[0].lower_right)
+
+    def test_segment_from_pixels(self):
+        segment = Segment.from_pixels([(4, 4), (4, 5), (3, 5), (5, 5)])
+        self.assertEqual((3, 4), segment.upper_left)
+        self.assertEqual((5, 5), segment.lower_right)
+        self.assertEqual((2, 1), segment.dimensions)
+        self.assertEqual((4.0, 4.5), segment.centroid)
+        self.assertItemsEqual([(4, 4), (4, 5), (3, 5), (5, 5)], segment.pix)
+
+    def test_segments_in_strips(self):
+        for strip_height in [1, 2, 3, 7]:
+            segments = list(iter_segments_in_strips(self.img, strip_height, min_pixels=1))
+            self.assertEqual(2, len(segments), strip_height)
+            self.assertItemsEqual([(2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (4, 2), (5, 3)], segments[0].pix)
+            self.assertItemsEqual([(4, 4), (4, 5), (3, 5), (5, 5)], segments[1].pix)
+
+    def test_segments_in_strips_joined_below(self):
+        # two arms of a U are separate groups until the strip holding the bottom of the U joins them
+        img = Image.new('L', (30, 40), 255)
+        img.paste(0, (2, 2, 6, 35))
+        img.paste(0, (20, 2, 24, 35))
+        img.paste(0, (2, 31, 24, 35))
+        img.paste(0, (10, 5, 14, 10))
+        expected = ImageSegmenter(img).segment_image(min_pixels=1)
+        for strip_height in [1, 4, 16]:
+            segments = list(iter_segments_in_strips(img, strip_height, min_pixels=1))
+            self.assertEqual([(10, 5), (2, 2)], [segment.upper_left for segment in segments])
+            self.assertEqual(expected[0].bitmap.tolist(), segments[1].bitmap.tolist())
+
+    def test_image_strips(self):
+        img = Image.new('RGB', (37, 29), (255, 255, 255))
+        for box, colour in [((1, 1, 30, 4), (0, 0, 0)), ((3, 10, 9, 28), (200, 10, 0)), ((20, 12, 36, 20), (5, 5, 90))]:
+            img.paste(colour, box)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        # bottom up BMP rows, padded PGM and BMP rows, packed PBM bits, top down TIFF rows of several depths and
+        # compressed PNG
+        for name, copy in [('rgb.bmp', img), ('gray.bmp', img.convert('L')), ('gray.pgm', img.convert('L')),
+                           ('bits.pbm', img.convert('1')), ('bits.bmp', img.convert('1')), ('rgb.tif', img),
+                           ('cmyk.tif', img.convert('CMYK')), ('int.tif', img.convert('I')),
+                           ('float.tif', img.convert('F')), ('gray_alpha.tga', img.convert('LA')), ('rgb.png', img)]:
+            path = os.path.join(tmp_dir, name)
+            copy.save(path)
+            for strip_height in [1, 4, 29, 64]:
+                opened = Image.open(path)
+                strips = list(iter_image_strips(opened, strip_height))
+                if not name.endswith('.png'):
+                    self.assertTrue(opened.tile, '%s was decoded whole' % name)
+                self.assertEqual(copy.tobytes(), ''.join(strip.tobytes() for strip in strips), name)
+
+    def test_segment_image_in_strips(self):
+        img = Image.new('L', (60, 50), 255)
+        for box in [(2, 2, 6, 45), (20, 2, 24, 45), (2, 41, 24, 45), (10, 5, 14, 10), (30, 30, 58, 33),
+                    (40, 8, 44, 20)]:
+            img.paste(0, box)
+        expected = [(segment.upper_left, segment.bitmap.tolist()) for segment in ImageSegmenter(img).segment_image()]
+        for strip_height in [1, 7, 64]:
+            self.assertEqual(expected, [(segment.upper_left, segment.bitmap.tolist())
+                                        for segment in segment_image_in_strips(img, strip_height)])
+
+    def test_find_blocks(self):
+        img = Image.new('L', (20, 12), 255)
+        for box in [(1, 1, 4, 4), (6, 2, 9, 5), (2, 7, 15, 8), (10, 9, 12, 11)]:
+            img.paste(0, box)
+        blocks = find_blocks(binarize(img))
+        self.assertEqual([((1, 5), (1, 4)), ((1, 5), (6, 9)), ((7, 8), (2, 15)), ((9, 11), (10, 12))],
+                         [((ys.start, ys.stop), (xs.start, xs.stop)) for ys, xs in blocks])
+
+    def test_segment_image_pool(self):
+        img = Image.new('L', (40, 30), 255)
+        for box in [(1, 1, 8, 8), (12, 3, 30, 6), (31, 5, 38, 28), (2, 20, 20, 27)]:
+            img.paste(0, box)
+        segmenter = ImageSegmenter(img)
+        expected = [(segment.upper_left, segment.bitmap.tolist()) for segment in segmenter.segment_image(min_pixels=1)]
+        # ndimage.label holds the GIL so only a process pool segments blocks in parallel, a thread pool must work too
+        for pool in [multiprocessing.Pool(2), ThreadPool(2)]:
+            try:
+                pooled = segmenter.segment_image(min_pixels=1, pool=pool)
+            finally:
+                pool.terminate()
+                pool.join()
+            self.assertEqual(expected, [(segment.upper_left, segment.bitmap.tolist()) for segment in pooled])
+
+    def test_downsample_mask(self):
+        mask = np.zeros((5, 7), dtype=bool)
+        mask[0, 0] = mask[3, 4] = mask[4, 6] = True
+        self.assertEqual([[True, False, False, False],
+                          [False, False, True, False],
+                          [False, False, False, True]], downsample_mask(mask, 2).tolist())
+        self.assertIs(mask, downsample_mask(mask, 1))
+
+    def test_estimate_glyph_height(self):
+        img = Image.new('L', (300, 100), 255)
+        for x in xrange(10, 290, 40):
+            img.paste(0, (x, 20, x + 5, 60))  # seven bars 40 pixels tall
+        img.paste(0, (0, 90, 300, 92))  # one long line
+        mask = binarize(img)
+        self.assertEqual(40, estimate_glyph_height(mask))
+        self.assertAlmostEqual(400, estimate_glyph_height(np.kron(mask, np.ones((10, 10), dtype=bool))), delta=10)
+        self.assertEqual(0, estimate_glyph_height(np.zeros((10, 10), dtype=bool)))
+
+    def test_estimate_glyph_height_noise(self):
+        mask = np.zeros((1200, 2400), dtype=bool)
+        for x in xrange(100, 2200, 400):
+            mask[300:780, x:x + 60] = True  # glyphs 480 pixels tall
+        for x in xrange(50, 2400, 500):
+            mask[1100, x] = True  # specks of dust
+        self.assertAlmostEqual(480, estimate_glyph_height(mask), delta=5)
+
+    def test_normalize_resolution(self):
+        img = Image.new('L', (120, 60), 255)
+        for box in [(10, 10, 20, 50), (40, 10, 60, 50), (70, 20, 110, 25)]:
+            img.paste(0, box)
+        segments = ImageSegmenter(img).segment_image()
+        self.assertEqual(3, len(segments))
+
+        large = img.resize((img.size[0] * 6, img.size[1] * 6), Image.NEAREST)
+        segmenter = ImageSegmenter(large)
+        large_segments = segmenter.segment_image(min_pixels=30 * 6 ** 2, target_glyph_height=TARGET_GLYPH_HEIGHT)
+        self.assertEqual(2, segmenter.scale)
+        self.assertEqual((large.size[1], large.size[0]), segmenter.ink_mask.shape)
+        self.assertEqual([(x * 3, y * 3) for x, y in [segment.upper_left for segment in segments]],
+                         [segment.upper_left for segment in large_segments])
+
+        # downsampling is opt in, by default the same segmenter segments at full resolution
+        full_segments = segmenter.segment_image()
+        self.assertEqual(1, segmenter.scale)
+        self.assertEqual(1, resolution_scale(np.ones((2 * TARGET_GLYPH_HEIGHT - 1, 10), dtype=bool)))
+        self.assertEqual([(x * 6, y * 6) for x, y in [segment.upper_left for segment in segments]],
+                         [segment.upper_left for segment in full_segments])
+
+    def test_normalize_resolution_specks(self):
+        img = Image.new('L', (120, 60), 255)
+        for box in [(10, 10, 20, 50), (40, 10, 60, 50), (70, 20, 110, 25)]:
+            img.paste(0, box)
+        large = img.resize((img.size[0] * 15, img.size[1] * 15), Image.NEAREST)
+        for box in [(1350, 600, 1353, 603), (1500, 675, 1503, 678)]:
+            large.paste(0, box)  # specks of dust far too small to be segments
+        segmenter = ImageSegmenter(large)
+        self.assertEqual(3, len(segmenter.segment_image()))
+        self.assertEqual(3, len(segmenter.segment_image(target_glyph_height=TARGET_GLYPH_HEIGHT)))
+        self.assertGreater(segmenter.scale, 5)
+        pool = ThreadPool(2)
+        try:
+            self.assertEqual(3, len(segmenter.segment_image(pool=pool, target_glyph_height=TARGET_GLYPH_HEIGHT)))
+        finally:
+            pool.close()
@@ -0,0 +1,96 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import os
+import multiprocessing
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+import image_to_latex as image_to_latex_module
+from classify_segments import Classifier
+from image_to_latex import convert_batch, image_to_latex, image_to_latex_many, iter_image_to_latex
+from result_cache import ResultCache
+
+
+class TestImageToLatex(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(image_to_latex))
+        self.test_images_dir = os.path.join(root_dir, 'test_images')
+        self.labeled_dir = os.path.join(root_dir, 'serialized_labeled_imgs')
+        self.img_paths = [os.path.join(self.test_images_dir, img_name)
+                          for img_name in ['divisions.png', 'integral.png', 'nested_root.png', 'root.png']]
+        self.expected = ['\\frac{\\sqrt{5 + 2} + \\frac{5}{2}}{4 0 0 0 0}',
+                         '\\int ( \\sqrt{x} + \\frac{1}{2 \\sqrt{x}} ) d x',
+                         '\\sqrt{5 + \\sqrt{5 + 1 0}}',
+                         '5 + \\sqrt{5 + 1 0}']
+
+    def test_image_to_latex(self):
+        self.assertEqual(self.expected[0], image_to_latex(self.img_paths[0], self.labeled_dir))
+
+    def test_strips(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        bmp_path = os.path.join(tmp_dir, 'divisions.bmp')
+        Image.open(self.img_paths[0]).save(bmp_path)
+        self.assertEqual(self.expected[0], image_to_latex(bmp_path, self.labeled_dir, strip_height=16))
+
+        img_paths = [bmp_path] + self.img_paths[1:]
+        results = image_to_latex_many(img_paths, self.labeled_dir, workers=1, strip_height=16)
+        self.assertEqual(self.expected, [result.latex for result in results])
+
+        # the cache key computed strip by strip is the same as the one computed from the whole image
+        cache = ResultCache()
+        classifier = Classifier(self.labeled_dir)
+        image_to_latex(bmp_path, classifier=classifier, result_cache=cache)
+        convert_batch([bmp_path], classifier, cache, strip_height=16)
+        self.assertEqual(1, cache.memory_hits)
+
+    def test_segment_pool(self):
+        pool = multiprocessing.Pool(2)
+        try:
+            self.assertEqual(self.expected[0], image_to_latex(self.img_paths[0], self.labeled_dir, segment_pool=pool))
+            classifier = Classifier(self.labeled_dir, glyph_cache=None, segment_pool=pool)
+            results = convert_batch(self.img_paths, classifier)
+            self.assertEqual(self.expected, [result.latex for result in results])
+        finally:
+            pool.terminate()
+            pool.join()
+
+        results = image_to_latex_many(self.img_paths, self.labeled_dir, workers=1, segment_workers=2)
+        self.assertEqual(self.expected, [result.latex for result in results])
+        self.assertRaises(ValueError, image_to_latex_many, self.img_paths, self.labeled_dir, workers=2,
+                          segment_workers=2)
+
+    def test_image_to_latex_many(self):
+        img_paths = self.img_paths[:2] + [os.path.join(self.test_images_dir, 'missing.png')] + self.img_paths[2:]
+        for workers in [1, 2]:
+            results = image_to_latex_many(img_paths, self.labeled_dir, workers=workers, batch_size=2)
+            self.assertEqual(img_paths, [result.img_path for result in results])
+            self.assertEqual(self.expected[:2] + [None] + self.expected[2:], [result.latex for result in results])
+            self.assertIn('IOError', results[2].error)
+            self.assertEqual([None] * 4, [result.error for i, result in enumerate(results) if i != 2])
+
+    def test_worker_dies(self):
+        def convert_or_die(img_paths, *args):
+            if 'die' in img_paths:
+                os._exit(1)
+            return convert_batch(img_paths, *args)
+
+        # the workers are forked while the module is patched, the workers replacing them are not
+        image_to_latex_module.convert_batch = convert_or_die
+        try:
+            results = iter_image_to_latex(['die'] + self.img_paths[:1], self.labeled_dir, workers=2, batch_size=1,
+                                          batch_timeout=2)
+            result = next(results)
+        finally:
+            image_to_latex_module.convert_batch = convert_batch
+        try:
+            self.assertEqual(('die', None), (result.img_path, result.latex))
+            self.assertIn('Timeout', result.error)
+            self.assertEqual(self.expected[0], next(results).latex)
+        finally:
+            results.close()
@@ -0,0 +1,83 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import os
+import shutil
+import tempfile
+import unittest
+import cPickle as pickle
+
+import numpy as np
+
+from classify_segments import Classifier
+from label_index import LabelIndex, add_index
+from label_model import MODEL_FILE_NAME, LabelModel, convert_pickle_dir, load_label_model
+
+
+class TestLabelModel(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.vec_dic = {'x': np.array([1.0, -1.45, 1.0]), 'plus': np.array([-1.45, 1.0, -1.45])}
+        self.model = LabelModel.from_dict(self.vec_dic, (3, 1), -1.45)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmp_dir, MODEL_FILE_NAME)
+        self.model.save(path)
+        loaded = LabelModel.load(path, verify=True)
+        self.assertIsInstance(loaded.vectors, np.memmap)
+        self.assertEqual(['plus', 'x'], loaded.labels)
+        self.assertEqual((3, 1), loaded.size)
+        self.assertEqual(-1.45, loaded.fill_val)
+        self.assertEqual(self.model.checksum, loaded.checksum)
+        self.assertEqual(self.model.vectors.tolist(), loaded.vectors.tolist())
+
+    def test_save_over_mapped_model(self):
+        path = os.path.join(self.tmp_dir, MODEL_FILE_NAME)
+        self.model.save(path)
+        mapped = LabelModel.load(path)
+        inode = os.stat(path).st_ino
+
+        # the old file is replaced rather than overwritten so it stays valid for the processes mapping it
+        LabelModel.from_dict({'y': np.array([1.0, 1.0, 1.0])}, (3, 1), -1.45).save(path)
+        self.assertNotEqual(inode, os.stat(path).st_ino)
+        self.assertEqual(self.model.vectors.tolist(), mapped.vectors.tolist())
+        self.assertEqual(['y'], LabelModel.load(path, verify=True).labels)
+        self.assertEqual([MODEL_FILE_NAME], os.listdir(self.tmp_dir))
+
+    def test_corrupt_model(self):
+        path = os.path.join(self.tmp_dir, MODEL_FILE_NAME)
+        self.model.save(path)
+        with open(path, 'r+b') as model_file:
+            model_file.seek(-4, os.SEEK_END)
+            model_file.write('\0' * 4)
+        self.assertRaises(ValueError, LabelModel.load, path, True)
+
+    def test_convert_pickle_dir(self):
+        for name, obj in self.vec_dic.items() + [('size', (3, 1)), ('fill_val', -1.45)]:
+            with open(os.path.join(self.tmp_dir, name + '.p'), 'wb') as obj_file:
+                pickle.dump(obj, obj_file)
+        legacy = load_label_model(self.tmp_dir)
+        convert_pickle_dir(self.tmp_dir)
+        converted = load_label_model(self.tmp_dir)
+        self.assertIsInstance(converted.vectors, np.memmap)
+        self.assertEqual(legacy.checksum, converted.checksum)
+        self.assertEqual(self.model.checksum, converted.checksum)
+
+    def test_index(self):
+        rng = np.random.RandomState(0)
+        vectors = np.where(rng.rand(2000, 400) > 0.5, 1.0, -1.45)
+        labels = ['label%d' % i for i in xrange(2000)]
+        model = add_index(LabelModel(labels, vectors.astype(np.float32), (20, 20), -1.45))
+        path = os.path.join(self.tmp_dir, MODEL_FILE_NAME)
+        model.save(path)
+        self.assertIsNotNone(LabelIndex.from_model(LabelModel.load(path, verify=True)))
+
+        queries = vectors[:50] + rng.normal(scale=0.5, size=(50, 400))
+        exact_labels, exact_distances = Classifier(path, index_candidates=None).classify_vectors(queries)
+        indexed_labels, indexed_distances = Classifier(path, index_candidates=100).classify_vectors(queries, k=3)
+        self.assertEqual((50, 3), indexed_labels.shape)
+        self.assertEqual(exact_labels[:, 0].tolist(), indexed_labels[:, 0].tolist())
+        np.testing.assert_allclose(exact_distances[:, 0], indexed_distances[:, 0], rtol=1e-4)
@@ -0,0 +1,52 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import os
+import unittest
+
+from classify_segments import Classifier, GlyphCache
+from image_to_latex import image_to_latex, image_to_latex_many
+from profiling import PipelineStats, Profiler, add_hook, remove_hook
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(PipelineStats))
+        self.img_path = os.path.join(root_dir, 'test_images', 'root.png')
+        self.labeled_dir = os.path.join(root_dir, 'serialized_labeled_imgs')
+
+    def test_stats(self):
+        stats = PipelineStats()
+        classifier = Classifier(self.labeled_dir, glyph_cache=GlyphCache())
+        image_to_latex(self.img_path, classifier=classifier, stats=stats)
+        image_to_latex(self.img_path, classifier=classifier, stats=stats)
+
+        self.assertItemsEqual(['decode', 'segment', 'glyph_cache', 'rescale', 'classify', 'layout'], stats.timings)
+        self.assertEqual(2, stats.calls['segment'])
+        self.assertEqual(1, stats.calls['classify'])  # second time every glyph is cached
+        self.assertEqual(2 * 7, stats.counts['segments'])
+        self.assertEqual(7, stats.counts['glyph_cache_hits'])
+        self.assertEqual(stats.counts['rescaled'], stats.counts['glyph_cache_misses'])
+        self.assertGreater(stats.counts['pixels'], 0)
+
+    def test_hooks(self):
+        calls = []
+        hook = lambda stage, seconds, counts: calls.append((stage, counts))
+        add_hook(hook)
+        try:
+            image_to_latex_many([self.img_path], self.labeled_dir, workers=1)
+        finally:
+            remove_hook(hook)
+        self.assertIn(('segment', {'segments': 7}), calls)
+        self.assertEqual('layout', calls[-1][0])
+
+        del calls[:]
+        image_to_latex(self.img_path, self.labeled_dir)
+        self.assertEqual([], calls)
+
+    def test_disabled(self):
+        profiler = Profiler()
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(0, profiler.clock())
+        profiler.record('stage', 0, segments=1)
@@ -0,0 +1,113 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import copy
+import inspect
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from classify_segments import Classifier
+from image_to_latex import image_to_latex, image_to_latex_many
+from result_cache import ResultCache
+from segment_img import DEFAULT_SEGMENTATION
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        root_dir = os.path.dirname(inspect.getfile(ResultCache))
+        self.test_images_dir = os.path.join(root_dir, 'test_images')
+        self.labeled_dir = os.path.join(root_dir, 'serialized_labeled_imgs')
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tmp_dir, 'results.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_key(self):
+        img = Image.open(os.path.join(self.test_images_dir, 'root.png'))
+        copy_path = os.path.join(self.tmp_dir, 'copy.png')
+        img.save(copy_path)
+        self.assertEqual(ResultCache.key(img, 'model'), ResultCache.key(Image.open(copy_path), 'model'))
+        self.assertNotEqual(ResultCache.key(img, 'model'), ResultCache.key(img, 'other model'))
+        self.assertNotEqual(ResultCache.key(img, 'model'), ResultCache.key(img.convert('L'), 'model'))
+        self.assertEqual(ResultCache.key(img, 'model'), ResultCache.key(img, 'model', DEFAULT_SEGMENTATION))
+        for segmentation in [(1, 255, None), (30, 200, None), (30, 255, 96)]:
+            self.assertNotEqual(ResultCache.key(img, 'model'), ResultCache.key(img, 'model', segmentation))
+
+    def test_memory_eviction(self):
+        cache = ResultCache(memory_entries=2)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, key.upper())
+            cache.get('a')  # keep 'a' recently used
+        self.assertEqual('A', cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual('C', cache.get('c'))
+
+    def test_disk_tier(self):
+        cache = ResultCache(self.cache_path, max_disk_bytes=100)
+        cache.put('a' * 20, 'x' * 30)
+        cache.put('b' * 20, 'y' * 30)
+        cache.put('c' * 20, 'z' * 30)  # over the size limit, 'a' is evicted
+        cache.close()
+
+        reopened = ResultCache(self.cache_path, max_disk_bytes=100)
+        self.assertIsNone(reopened.get('a' * 20))
+        self.assertEqual('y' * 30, reopened.get('b' * 20))
+        self.assertEqual('z' * 30, reopened.get('c' * 20))
+        self.assertEqual(2, reopened.disk_hits)
+        self.assertEqual('z' * 30, reopened.get('c' * 20))
+        self.assertEqual(1, reopened.memory_hits)
+        reopened.close()
+
+    def test_disk_usage(self):
+        cache = ResultCache(self.cache_path, max_disk_bytes=100)
+
+        def assert_disk_usage(expected):
+            self.assertEqual(expected, cache._db.execute('SELECT bytes FROM disk_usage').fetchone()[0])
+            self.assertEqual(expected, cache._db.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0])
+
+        cache.put('a' * 20, 'x' * 30)
+        cache.put('a' * 20, 'x' * 10)  # replaced, not added
+        assert_disk_usage(30)
+        cache.put('b' * 20, 'y' * 30)
+        cache.put('c' * 20, 'z' * 30)  # 'a' is evicted
+        assert_disk_usage(100)
+
+        # a second process writing to the same file is counted too
+        other = ResultCache(self.cache_path, max_disk_bytes=100)
+        other.put('d' * 20, 'w' * 30)  # 'b' is evicted
+        other.close()
+        assert_disk_usage(100)
+        cache.put('e' * 20, 'v' * 30)  # 'c' is evicted
+        assert_disk_usage(100)
+        cache.clear()
+        assert_disk_usage(0)
+        cache.close()
+
+    def test_image_to_latex(self):
+        img_path = os.path.join(self.test_images_dir, 'root.png')
+        classifier = Classifier(self.labeled_dir)
+        cache = ResultCache(self.cache_path)
+        expected = image_to_latex(img_path, classifier=classifier)
+        self.assertEqual(expected, image_to_latex(img_path, classifier=classifier, result_cache=cache))
+        self.assertEqual(expected, image_to_latex(img_path, classifier=classifier, result_cache=cache))
+        self.assertEqual((1, 1), (cache.misses, cache.memory_hits))
+
+        # results of another model aren't returned, the model is copied so the one shared by the process is untouched
+        classifier.model = copy.copy(classifier.model)
+        classifier.model.checksum = 'changed'
+        self.assertNotEqual('changed', Classifier(self.labeled_dir).model.checksum)
+        self.assertEqual(expected, image_to_latex(img_path, classifier=classifier, result_cache=cache))
+        self.assertEqual(2, cache.misses)
+        cache.close()
+
+    def test_image_to_latex_many(self):
+        img_paths = [os.path.join(self.test_images_dir, name) for name in ['root.png', 'missing.png', 'root.png']]
+        for _ in range(2):
+            results = image_to_latex_many(img_paths, self.labeled_dir, workers=1, result_cache_path=self.cache_path)
+            self.assertEqual(['5 + \\sqrt{5 + 1 0}', None, '5 + \\sqrt{5 + 1 0}'], [result.latex for result in results])
+            self.assertIn('IOError', results[1].error)
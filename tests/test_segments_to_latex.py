@@ -4,8 +4,11 @@ import inspect
 import os
 import unittest
 
+import numpy as np
+
 from classify_segments import seg_and_classify_img
-from segments_to_latex import SegmentsToLatex
+from segment_img import Segment
+from segments_to_latex import SegmentGrid, SegmentsToLatex
 
 
 class TestSegmentsToLatex(unittest.TestCase):  # TODO add many more test cases
@@ -45,3 +48,27 @@ class TestSegmentsToLatex(unittest.TestCase):  # TODO add many more test cases
         expected = '\\frac{\\sqrt{5 + \\sqrt{5 + 1 0}}}{\\sqrt{4}}'
         self.assertEqual(expected, latex)
 
+    def test_segment_grid(self):
+        rng = np.random.RandomState(0)
+        segments = [Segment(np.ones((rng.randint(1, 30), rng.randint(1, 30)), dtype=bool),
+                            (rng.randint(0, 500), rng.randint(0, 200))) for _ in xrange(300)]
+        grid = SegmentGrid(segments)
+        for segment in segments[::3]:
+            grid.remove(segment)
+        remaining = [segment for i, segment in enumerate(segments) if i % 3 != 0]
+        for _ in xrange(50):
+            upper_left = rng.randint(-50, 500), rng.randint(-50, 200)
+            lower_right = upper_left[0] + rng.randint(0, 400), upper_left[1] + rng.randint(0, 400)
+            in_region = lambda seg: upper_left[0] < seg.centroid[0] < lower_right[0] and \
+                upper_left[1] < seg.centroid[1] < lower_right[1]
+            self.assertEqual([seg for seg in remaining if in_region(seg)],
+                             [seg for seg in grid.search(upper_left, lower_right) if in_region(seg)])
+
+    def test_segments_not_modified(self):
+        img_path = os.path.join(self.test_images_dir, 'integral.png')
+        segments = seg_and_classify_img(img_path, self.labeled_dir)
+        before = [(segment, segment.classification) for segment in segments]
+        to_latex = SegmentsToLatex(segments)
+        first = to_latex.search_and_simplify((0, 0), (99999, 99999))
+        self.assertEqual(before, [(segment, segment.classification) for segment in segments])
+        self.assertEqual(first.classification, to_latex.search_and_simplify((0, 0), (99999, 99999)).classification)
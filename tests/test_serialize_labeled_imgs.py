@@ -0,0 +1,69 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from label_model import MODEL_FILE_NAME, LabelModel
+from serialize_labeled_imgs import serialize_imgs
+
+
+class TestSerializeLabeledImgs(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.labeled_dir = os.path.join(self.tmp_dir, 'labeled')
+        self.model_dir = os.path.join(self.tmp_dir, 'model')
+        self.full_dir = os.path.join(self.tmp_dir, 'full')
+        for path in [self.labeled_dir, self.model_dir, self.full_dir]:
+            os.mkdir(path)
+        self.save_glyph('bar', [(5, 20, 40, 25)])
+        self.save_glyph('box', [(10, 10, 30, 40)])
+        self.save_glyph('tall', [(20, 5, 25, 45)])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def save_glyph(self, label, rectangles):
+        img = Image.new('L', (50, 50), 255)
+        for rectangle in rectangles:
+            ImageDraw.Draw(img).rectangle(rectangle, 0)
+        img.save(os.path.join(self.labeled_dir, label + '.png'))
+
+    def build(self, model_dir, **kwargs):
+        return serialize_imgs(self.labeled_dir, model_dir, (50, 50), -1.45, workers=1, **kwargs)
+
+    def assert_same_as_full_build(self):
+        self.build(self.full_dir, incremental=False)
+        incremental = LabelModel.load(os.path.join(self.model_dir, MODEL_FILE_NAME))
+        full = LabelModel.load(os.path.join(self.full_dir, MODEL_FILE_NAME))
+        self.assertEqual(full.labels, incremental.labels)
+        self.assertEqual(full.checksum, incremental.checksum)
+
+    def test_incremental(self):
+        self.assertEqual(3, self.build(self.model_dir))
+        self.assertEqual(0, self.build(self.model_dir))
+
+        self.save_glyph('box', [(10, 10, 35, 40)])
+        self.save_glyph('new', [(5, 5, 45, 10), (5, 5, 10, 45)])
+        self.assertEqual(2, self.build(self.model_dir))
+        self.assert_same_as_full_build()
+
+        os.remove(os.path.join(self.labeled_dir, 'tall.png'))
+        self.assertEqual(0, self.build(self.model_dir))
+        self.assertEqual(['bar', 'box', 'new'], LabelModel.load(os.path.join(self.model_dir, MODEL_FILE_NAME)).labels)
+        self.assert_same_as_full_build()
+
+        # different parameters rebuild everything
+        self.assertEqual(3, serialize_imgs(self.labeled_dir, self.model_dir, (40, 40), -1.45, workers=1))
+
+    def test_workers(self):
+        serialize_imgs(self.labeled_dir, self.model_dir, (50, 50), -1.45, workers=2)
+        self.build(self.full_dir, incremental=False)
+        parallel = LabelModel.load(os.path.join(self.model_dir, MODEL_FILE_NAME))
+        serial = LabelModel.load(os.path.join(self.full_dir, MODEL_FILE_NAME))
+        self.assertTrue(np.array_equal(serial.vectors, parallel.vectors))
@@ -0,0 +1,150 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import inspect
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from classify_segments import Classifier
+from image_to_latex import convert_batch, image_to_latex
+from segment_img import Segment
+from stage_artifacts import CLASSIFIED, DEFAULT_SEGMENTATION, SEGMENTED, StageArtifact, StageCheckpoints
+
+
+class TestStageArtifacts(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        root_dir = os.path.dirname(inspect.getfile(StageArtifact))
+        cls.test_images_dir = os.path.join(root_dir, 'test_images')
+        cls.classifier = Classifier(os.path.join(root_dir, 'serialized_labeled_imgs'), glyph_cache=None)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.img_path = os.path.join(self.tmp_dir, 'nested_frac.png')
+        shutil.copy(os.path.join(self.test_images_dir, 'nested_frac.png'), self.img_path)
+        self.checkpoints = StageCheckpoints(os.path.join(self.tmp_dir, 'stages'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_round_trip(self):
+        segments = [Segment(np.array([[1, 0, 1], [0, 1, 0]], dtype=bool), (3, 7)),
+                    Segment(np.ones((9, 1), dtype=bool), (0, 0))]
+        segments[0].classification, segments[0].distance = 'x', 1.5
+        segments[1].classification, segments[1].distance = '1', 0.25
+        path = os.path.join(self.tmp_dir, 'artifact.j2ls')
+
+        StageArtifact(segments, CLASSIFIED, 'checksum', 10, 20.5, (5, 200, None), 3).save(path)
+        artifact = StageArtifact.load(path)
+        self.assertEqual(artifact.stage, CLASSIFIED)
+        self.assertEqual((artifact.model_checksum, artifact.source_size, artifact.source_mtime), ('checksum', 10, 20.5))
+        self.assertEqual(((5, 200, None), 3), (artifact.segmentation, artifact.scale))
+        for original, loaded in zip(segments, artifact.segments):
+            np.testing.assert_array_equal(original.bitmap, loaded.bitmap)
+            self.assertEqual(original.upper_left, loaded.upper_left)
+            self.assertEqual(original.classification, loaded.classification)
+            self.assertEqual(original.distance, loaded.distance)
+
+        StageArtifact(segments, SEGMENTED).save(path)
+        artifact = StageArtifact.load(path)
+        self.assertEqual((artifact.stage, artifact.model_checksum), (SEGMENTED, None))
+        self.assertEqual((DEFAULT_SEGMENTATION, 1), (artifact.segmentation, artifact.scale))
+        self.assertEqual([segment.classification for segment in artifact.segments], [None, None])
+
+    def test_not_an_artifact(self):
+        path = os.path.join(self.tmp_dir, 'artifact.j2ls')
+        with open(path, 'wb') as artifact_file:
+            artifact_file.write('\0' * 100)
+        self.assertRaises(ValueError, StageArtifact.load, path)
+        self.assertIsNone(self.checkpoints.load(path))
+
+    def test_corrupt_artifact(self):
+        convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        path = self.checkpoints.get_path(self.img_path)
+        with open(path, 'rb') as artifact_file:
+            data = artifact_file.read()
+        artifact = StageArtifact.load(path)
+        labels_offset = len(data) - sum((segment.bitmap.size + 7) // 8 for segment in artifact.segments) - \
+            2 * len(artifact.segments)
+
+        # truncated, with trailing data and with a label number past the end of the label table
+        for corrupt in [data[:-1], data[:labels_offset + 1], data + '\0',
+                        data[:labels_offset] + '\xff\xff' + data[labels_offset + 2:]]:
+            with open(path, 'wb') as artifact_file:
+                artifact_file.write(corrupt)
+            self.assertRaises(ValueError, StageArtifact.load, path)
+            self.assertIsNone(self.checkpoints.load(self.img_path))
+            result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+            self.assertEqual(result.latex, image_to_latex(self.img_path, classifier=self.classifier))
+
+    def test_checkpoints_skip_classification(self):
+        expected = image_to_latex(self.img_path, classifier=self.classifier)
+        self.assertIsNone(self.checkpoints.load(self.img_path))
+        result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        self.assertEqual(result.latex, expected)
+        self.assertEqual(self.checkpoints.load(self.img_path).stage, CLASSIFIED)
+
+        calls = []
+        classify_segments = self.classifier.classify_segments
+        self.classifier.classify_segments = lambda segments, *args: calls.append(len(segments)) or \
+            classify_segments(segments, *args)
+        try:
+            result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        finally:
+            del self.classifier.classify_segments
+        self.assertEqual(result.latex, expected)
+        self.assertEqual(calls, [0])
+
+    def test_segments_saved_before_classification(self):
+        def fail(*args):
+            raise RuntimeError('classification failed')
+        self.classifier.classify_segments = fail
+        try:
+            result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        finally:
+            del self.classifier.classify_segments
+        self.assertIn('RuntimeError', result.error)
+        artifact = self.checkpoints.load(self.img_path)
+        self.assertEqual((artifact.stage, artifact.model_checksum), (SEGMENTED, None))
+
+        result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        self.assertEqual(result.latex, image_to_latex(self.img_path, classifier=self.classifier))
+        self.assertEqual(self.checkpoints.load(self.img_path).stage, CLASSIFIED)
+
+    def test_other_segmentation_is_segmented_again(self):
+        convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        self.assertIsNone(self.checkpoints.load(self.img_path, (1, 255, None)))
+        self.assertIsNone(self.checkpoints.load(self.img_path, (30, 255, 96)))
+
+        # segmenting in strips gives the same segments, so it starts from the same artifact
+        self.classifier.classify_segments = lambda segments, *args: segments and self.fail('classified again')
+        try:
+            result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints, strip_height=16)
+        finally:
+            del self.classifier.classify_segments
+        self.assertEqual(result.latex, image_to_latex(self.img_path, classifier=self.classifier))
+
+    def test_changed_image_is_converted_again(self):
+        convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        shutil.copy(os.path.join(self.test_images_dir, 'root.png'), self.img_path)
+        self.assertIsNone(self.checkpoints.load(self.img_path))
+        result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        self.assertEqual(result.latex, image_to_latex(self.img_path, classifier=self.classifier))
+
+    def test_other_model_classifies_again(self):
+        convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        artifact = self.checkpoints.load(self.img_path)
+        artifact.model_checksum = 'other model'
+        artifact.save(self.checkpoints.get_path(self.img_path))
+
+        result, = convert_batch([self.img_path], self.classifier, checkpoints=self.checkpoints)
+        self.assertEqual(result.latex, image_to_latex(self.img_path, classifier=self.classifier))
+        self.assertEqual(self.checkpoints.load(self.img_path).model_checksum, self.classifier.model.checksum)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+# Copyright (C) 2018 Daniel Roudnitsky <droudnitsky@gmail.com>
+
+import unittest
+
+import numpy as np
+
+from segment_img import Segment
+from transform_segment import TransformSegment, rescale_bitmap, rescale_bitmap_pil, vectorize_segments
+
+
+class TestTransformSegment(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.bitmaps = [rng.rand(height, width) > 0.5 for height, width in [(12, 40), (90, 7), (33, 33), (1, 60)]]
+
+    def test_rescale_matches_pil(self):
+        for bitmap in self.bitmaps:
+            for size in [(50, 50), (20, 35), (64, 9)]:
+                self.assertEqual(rescale_bitmap_pil(bitmap, size).tolist(), rescale_bitmap(bitmap, size).tolist())
+
+    def test_rescale_non_square(self):
+        transform = TransformSegment(Segment(np.ones((10, 30), dtype=bool)))
+        transform.rescale((20, 5))
+        self.assertEqual((5, 20), transform.bitmap.shape)
+        self.assertTrue(transform.bitmap.all())
+
+    def test_vectorize_segments(self):
+        segments = [Segment(bitmap) for bitmap in self.bitmaps]
+        vecs = vectorize_segments(segments, (50, 50), fill_val=-1.45)
+        self.assertEqual((4, 2500), vecs.shape)
+        for segment, vec in zip(segments, vecs):
+            transform = TransformSegment(segment)
+            transform.rescale((50, 50), method='pil')
+            self.assertEqual(transform.get_flattened_pix_grid(-1.45).tolist(), vec.tolist())
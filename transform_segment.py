@@ -10,6 +10,15 @@ sizes.
 import numpy as np
 from PIL import Image
 
+from budget import BUDGET_CHECK_INTERVAL
+
+A_LOWERBOUND = 50  # lower bound for A values from RGBA to keep that are changed due to rescaling
+
+LANCZOS_SUPPORT = 3.0
+PRECISION_BITS = 32 - 8 - 2  # fixed point precision PIL uses for its resampling coefficients
+
+_resample_weights = {}  # (in_size, out_size) -> weight matrix, sizes repeat a lot so there is no need to recompute them
+
 
 class TransformSegment(object):
     """
@@ -21,55 +30,141 @@ class TransformSegment(object):
 
     def __init__(self, segment):
         self.seg = segment
+        self.bitmap = None
         self.rescale_size = None
         self.transform_to_origin()
 
     def transform_to_origin(self):
         """
-        Transform the segment as close to the origin as possible for proper rescaling
+        Transform the segment as close to the origin as possible for proper rescaling. The segment's bitmap is already
+        cropped to the segment so it is used as is, indexed from the origin
         """
-        x_min, y_min = self.seg.upper_left
-        self.seg.pix = [(xy[0] - x_min, xy[1] - y_min) for xy in self.seg.pix]
+        self.bitmap = self.seg.bitmap
 
-    def rescale(self, size):
+    def rescale(self, size, method='numpy'):
         """
-        Due to not wanting to implement an image rescaling algorithm: rebuild the image object, rescale using
-        PIL and re extract non white pixels. TODO implement rescaling algorithm for increase in speed
+        Rescale the segment to `size` with a lanczos filter and re extract the non white pixels
+
+        :param size: (width, height) to rescale to
+        :param method: 'numpy' to resample the bitmap directly or 'pil' to rebuild the image object and rescale it using
+        PIL. Both produce the same pixels, 'pil' is kept as a reference
         """
         self.rescale_size = size
-
-        # rebuild and resize image
-        im = Image.new('RGBA', (self.seg.dimensions[0] + 1, self.seg.dimensions[1] + 1))
-        for xy in self.seg.pix:
-            im.putpixel(xy, (0, 255, 255, 255))
-        im = im.resize(size, Image.ANTIALIAS)
-
-        # extract non white pixels again
-        self.seg.pix = []
-        pixels = list(im.getdata())
-        A_LOWERBOUND = 50  # lower bound for A values from RGBA to keep that are changed due to rescaling
-        non_white = lambda x: x[3] > A_LOWERBOUND
-        for y in xrange(size[1]):
-            for x in xrange(size[0]):
-                if non_white(pixels[y * size[1] + x]):
-                    self.seg.pix.append((x, y))
+        if method == 'numpy':
+            self.bitmap = rescale_bitmap(self.bitmap, size)
+        elif method == 'pil':
+            self.bitmap = rescale_bitmap_pil(self.bitmap, size)
+        else:
+            raise ValueError('Unknown rescale method %s' % method)
 
     def get_flattened_pix_grid(self, fill_val=-1):
         """
         Create a matrix of size max_X by max_Y where each matrix entry corresponding to a pixel in the segment.
         Non white pixels are represented as 1 and white pixels as `fill_val`. The matrix is then flattened. Meant to be
         used after rescaling the image to compare images using a similarity metric
-        :return: One dimensional list of size max_X * max_y TODO
+        :return: One dimensional array of size max_X * max_y
         """
-        if self.rescale_size:
-            grid = np.empty(self.rescale_size)
-        else:
-            grid = np.empty(self.seg.dimensions)
+        return np.where(self.bitmap, 1.0, fill_val).ravel()
+
 
-        grid.fill(fill_val)
-        for xy in self.seg.pix:
-            grid[xy[1]][xy[0]] = 1
+def vectorize_segments(segments, size, fill_val=-1, method='numpy', budget=None):
+    """
+    Transform every segment in `segments` to the origin, rescale it to `size` and flatten it the same way
+    `TransformSegment.get_flattened_pix_grid` does
+
+    :param budget: `budget.Budget` whose time limit to check every `BUDGET_CHECK_INTERVAL` segments
+    :return: Array of shape (len(segments), width * height), row i is the vector representing segments[i]
+    """
+    vecs = np.empty((len(segments), size[0] * size[1]))
+    for i, segment in enumerate(segments):
+        if budget is not None and i % BUDGET_CHECK_INTERVAL == 0:
+            budget.check_time('rescale')
+        transform = TransformSegment(segment)
+        transform.rescale(size, method)
+        vecs[i] = transform.get_flattened_pix_grid(fill_val)
+    return vecs
 
-        return np.ndarray.flatten(grid)
 
+def get_ink_profiles(vecs, size):
+    """
+    Count the non white pixels in every row and every column of vectors created by `get_flattened_pix_grid`. These are
+    cheap shape descriptors: the number of pixels two vectors differ in is at least the sum of the absolute differences
+    of their row counts, and also at least that of their column counts
+
+    :param vecs: Array of shape (n, width * height)
+    :param size: (width, height) the vectors were rescaled to
+    :return: Array of shape (n, height + width), the row counts followed by the column counts of each vector
+    """
+    ink = (np.asarray(vecs) == 1).reshape(len(vecs), size[1], size[0])
+    return np.hstack([ink.sum(axis=2), ink.sum(axis=1)]).astype(np.float32)
+
+
+def rescale_bitmap(bitmap, size):
+    """
+    Resample a boolean bitmap to `size` entirely in numpy. The image is treated as an alpha channel that is 255 where
+    the bitmap is True, resampled with the same separable lanczos filter and fixed point rounding PIL uses for
+    `Image.ANTIALIAS` (horizontal pass first), and thresholded at `A_LOWERBOUND`
 
+    :param bitmap: Two dimensional boolean array
+    :param size: (width, height) to resample to
+    :return: Boolean array of shape (height, width)
+    """
+    alpha = bitmap.astype(np.float64) * 255
+    height, width = bitmap.shape
+    if size[0] != width:
+        alpha = _fixed_point_round(np.dot(alpha, get_resample_weights(width, size[0]).T))
+    if size[1] != height:
+        alpha = _fixed_point_round(np.dot(get_resample_weights(height, size[1]), alpha))
+    return alpha > A_LOWERBOUND
+
+
+def rescale_bitmap_pil(bitmap, size):
+    """
+    Reference implementation of `rescale_bitmap`: rebuild the image object, rescale using PIL and re extract the non
+    white pixels
+    """
+    rgba = np.zeros(bitmap.shape + (4,), dtype=np.uint8)
+    rgba[bitmap] = (0, 255, 255, 255)
+    im = Image.fromarray(rgba, 'RGBA').resize(size, Image.ANTIALIAS)
+    return np.asarray(im.getchannel('A')) > A_LOWERBOUND
+
+
+def get_resample_weights(in_size, out_size):
+    """
+    Return a matrix of shape (out_size, in_size) whose rows are the fixed point lanczos coefficients PIL uses to compute
+    each output pixel from the input pixels, scaled by 2 ** PRECISION_BITS
+    """
+    key = (in_size, out_size)
+    if key not in _resample_weights:
+        scale = float(in_size) / out_size
+        filterscale = max(scale, 1.0)
+        support = LANCZOS_SUPPORT * filterscale
+
+        weights = np.zeros((out_size, in_size))
+        for out_x in xrange(out_size):
+            center = (out_x + 0.5) * scale
+            x_min = max(int(center - support + 0.5), 0)
+            x_max = min(int(center + support + 0.5), in_size)
+            window = (np.arange(x_min, x_max) - center + 0.5) / filterscale
+            coeffs = _lanczos(window)
+            total = coeffs.sum()
+            if total != 0:
+                coeffs /= total
+            weights[out_x, x_min:x_max] = coeffs
+
+        # PIL rounds the normalized coefficients half away from zero into fixed point integers
+        weights = np.trunc(weights * (1 << PRECISION_BITS) + np.where(weights < 0, -0.5, 0.5))
+        _resample_weights[key] = weights
+    return _resample_weights[key]
+
+
+def _lanczos(x):
+    inside = (x >= -LANCZOS_SUPPORT) & (x < LANCZOS_SUPPORT)
+    return np.where(inside, np.sinc(x) * np.sinc(x / LANCZOS_SUPPORT), 0.0)
+
+
+def _fixed_point_round(accumulated):
+    """
+    Convert fixed point sums back to 8 bit values with the same rounding and clipping as PIL
+    """
+    return np.clip(np.floor((accumulated + (1 << (PRECISION_BITS - 1))) / (1 << PRECISION_BITS)), 0, 255)